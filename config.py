@@ -17,13 +17,48 @@ LORA_BANDWIDTH = 31250
 LORA_SPREADING_FACTOR = 10
 LORA_CODING_RATE = 8
 LORA_POWER = 20
+LORA_PREAMBLE_LENGTH = 8  # Symbols (the radio adds 4.25 for sync)
+LORA_RX_IRQ = True  # DIO0 interrupt + packet ring (False = poll every LORA_SYNC_MS)
+LORA_RX_RING_SLOTS = 8  # Packets buffered between main loop iterations
+LORA_RX_SLOT_SIZE = 16  # Max bytes kept per buffered packet
+LORA_DUTY_CYCLE_PERCENT = 1  # Airtime budget (EU868 g1 is 1%; US915 has none)
+LORA_DUTY_WINDOW_MS = 3600000  # Budget window: a full window's airtime may burst
+LORA_TX_POLL_MS = 20  # Re-check for TX_DONE this often once airtime has passed
+LORA_ADR = True  # Adapt SF/bandwidth to the link (adds a 1-byte control trailer)
+LORA_ADR_RATES = (  # (SF, bandwidth) ladder, most robust first
+    (LORA_SPREADING_FACTOR, LORA_BANDWIDTH),
+    (9, 62500),
+    (8, 125000),
+    (7, 125000),
+    (7, 250000),
+)
+LORA_ADR_MARGIN_DB = 10  # Link margin kept above sensitivity
+LORA_ADR_MAX_MISSED = 8  # Sends without hearing a peer before falling back
+LORA_LBT = True  # Channel activity detection (CAD) before every TX
+LORA_LBT_MAX_TRIES = 4  # Busy CADs (random backoff each) before sending anyway
+LORA_SNIFF_MS = 0  # >0: sleep between wake-up CADs instead of RX continuous
+LORA_IDLE_SNIFF_MS = 0  # >0: sniff like this while the display is off (all pets send preambles this long)
+LORA_ACK = True  # Ask a paired pet (the only one heard) to acknowledge syncs
+LORA_ACK_RETRIES = 3  # Retransmissions of an unacknowledged sync
+LORA_ACK_SLACK_MS = 300  # ACK timeout beyond the peer's CAD and the ACK's airtime
+LORA_PEER_TIMEOUT_MS = 120000  # Forget a silent peer's duplicate filter after this
+PEER_TABLE_SLOTS = 16  # Nearby pets tracked (least recently heard evicted)
+PEER_PARTNER_ID = None  # Follow only this pet's syncs (None = first one heard)
 
 # Button Configuration
 BUTTON_PIN = 12
-BUTTON_DEBOUNCE_MS = 50
+BUTTON_DEBOUNCE_MS = 50  # Stable time before an edge counts (button and contact)
+LONG_PRESS_MS = 800  # Hold time for a long press
+DOUBLE_PRESS_MS = 300  # Release-to-press gap for a double press
+INPUT_RING_SLOTS = 16  # Pin edges buffered between input task runs
 
 # OneWire Contact Detection (physical touch)
 ONEWIRE_PIN = 0
+ONEWIRE_PRESENCE = False  # Sense contact by OneWire reset/presence (False = contact button)
+ONEWIRE_SAMPLE_MS = 100  # Time between reset/presence checks
+ONEWIRE_RESET_US = 480  # Minimum reset pulse (held low until the next scheduler tick)
+ONEWIRE_PRESENCE_US = (15, 300)  # Presence edge window after the release
+ONEWIRE_JITTER_US = 150  # Window slack for pin IRQ latency
 
 # Display Configuration
 DISPLAY_WIDTH = 128
@@ -38,11 +73,48 @@ PET_STATES = {
     3: "sleeping",
 }
 
-# Animation frame rate (ms per frame)
+# Default animation frame time (ms per frame)
 ANIMATION_FRAME_MS = 50
 
+# Animation clips per state (see sprites/animation.py): sprite frame
+# indices, ms each frame shows, and "loop" or "pingpong" (forward then
+# back). A clip with one frame is a still: nothing is redrawn until an event.
+ANIMATION_CLIPS = {
+    "happy": ((0, 1, 2, 3), (ANIMATION_FRAME_MS,) * 4, "loop"),
+    "angry": ((0, 1, 2), (ANIMATION_FRAME_MS, ANIMATION_FRAME_MS, 2 * ANIMATION_FRAME_MS), "loop"),
+    "sad": ((0,), (1000,), "loop"),
+    "sleeping": ((0, 1, 2, 3), (400, 200, 200, 400), "pingpong"),
+}
+
+# Transition clips played once on a state change, then the new state's
+# clip: (sprite, frame, ms) per frame
+ANIMATION_TRANSITIONS = {
+    ("happy", "sad"): (("happy", 0, 150), ("sad", 0, 100), ("happy", 0, 100), ("sad", 0, 100)),
+    ("sad", "happy"): (("sad", 0, 150), ("happy", 0, 100), ("sad", 0, 100), ("happy", 0, 100)),
+    ("happy", "angry"): (("happy", 0, 100), ("angry", 0, 100), ("happy", 0, 100), ("angry", 0, 100)),
+    ("sad", "sleeping"): (("sad", 0, 300), ("sleeping", 0, 300), ("sad", 0, 300)),
+}
+
+# Sprite atlas built by tools/build_atlas.py (sprite_data.py is used
+# without one), and how many decoded frames are kept in RAM (one frame
+# buffer each, the size of the largest sprite)
+SPRITE_ATLAS = "sprites/atlas.bin"
+SPRITE_CACHE_FRAMES = 6
+
 # LoRA sync interval (ms)
 LORA_SYNC_MS = 1000
 
+# Contact health % at or above which each mood applies (happy first; below
+# the last one the pet is desperate)
+MOOD_THRESHOLDS = (80, 60, 40, 20)
+
+# Power management
+POWER_LIGHTSLEEP = True  # Light-sleep the CPU whenever every task is waiting
+POWER_MIN_SLEEP_MS = 10  # Shorter gaps are left to the event loop
+POWER_MAX_SLEEP_MS = 60000  # Longest single light sleep
+POWER_DIM_MS = 30000  # No input for this long: dim the display (0 = never)
+POWER_OFF_MS = 120000  # No input for this long: turn the display off (0 = never)
+POWER_DIM_CONTRAST = 16  # Display contrast while dimmed (full is 255)
+
 # Debug mode
 DEBUG = True
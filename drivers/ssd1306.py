@@ -32,6 +32,16 @@ class SSD1306(framebuf.FrameBuffer):
         self.external_vcc = external_vcc
         self.pages = self.height // 8
         self.buffer = bytearray(self.pages * self.width)
+        self.buffer_view = memoryview(self.buffer)
+        # shadow of what the controller's GDDRAM holds (last transmitted frame)
+        self.shadow = bytearray(len(self.buffer))
+        self.shadow_view = memoryview(self.shadow)
+        self.frames_skipped = 0
+        self.bytes_saved = 0
+        # damage tracking: dirty column range per page (lo > hi means clean)
+        self.dirty_lo = bytearray(self.pages)
+        self.dirty_hi = bytearray(self.pages)
+        self.mark_clean()
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
         self.init_display()
 
@@ -99,6 +109,103 @@ class SSD1306(framebuf.FrameBuffer):
         self.write_cmd(0)
         self.write_cmd(self.pages - 1)
         self.write_data(self.buffer)
+        self.shadow_view[:] = self.buffer_view
+        self.mark_clean()
+
+    def mark_clean(self):
+        for page in range(self.pages):
+            self.dirty_lo[page] = 0xFF
+            self.dirty_hi[page] = 0
+
+    def mark_dirty(self, x, y, w, h):
+        # clip the rectangle, then widen the column range of every page it touches
+        x0 = max(x, 0)
+        x1 = min(x + w, self.width) - 1
+        y0 = max(y, 0)
+        y1 = min(y + h, self.height) - 1
+        if x0 > x1 or y0 > y1:
+            return
+        for page in range(y0 >> 3, (y1 >> 3) + 1):
+            if x0 < self.dirty_lo[page]:
+                self.dirty_lo[page] = x0
+            if x1 > self.dirty_hi[page]:
+                self.dirty_hi[page] = x1
+
+    def _trim_page(self, page):
+        # narrow the page's dirty range to the bytes that differ from the
+        # shadow, bisecting with memoryview compares instead of a byte loop
+        base = page * self.width
+        lo = base + self.dirty_lo[page]
+        hi = base + self.dirty_hi[page]
+        buf = self.buffer_view
+        shadow = self.shadow_view
+        if buf[lo:hi + 1] == shadow[lo:hi + 1]:
+            self.dirty_lo[page] = 0xFF
+            self.dirty_hi[page] = 0
+            return
+        # first changed byte: grow the matching prefix
+        a, b = lo, hi
+        while a < b:
+            mid = (a + b) >> 1
+            if buf[a:mid + 1] == shadow[a:mid + 1]:
+                a = mid + 1
+            else:
+                b = mid
+        self.dirty_lo[page] = a - base
+        # last changed byte: grow the matching suffix
+        b = hi
+        while a < b:
+            mid = (a + b + 1) >> 1
+            if buf[mid:b + 1] == shadow[mid:b + 1]:
+                b = mid - 1
+            else:
+                a = mid
+        self.dirty_hi[page] = a - base
+
+    def show_dirty(self):
+        # candidate regions are the marked ranges; drop whatever still
+        # matches the shadow, and skip the transfer if nothing is left
+        dirty = False
+        for page in range(self.pages):
+            if self.dirty_lo[page] <= self.dirty_hi[page]:
+                self._trim_page(page)
+                dirty = dirty or self.dirty_lo[page] <= self.dirty_hi[page]
+        if not dirty:
+            self.frames_skipped += 1
+            self.bytes_saved += len(self.buffer)
+            return
+
+        # send only the changed column range of each page; runs of
+        # full-width pages are contiguous in the buffer and go as one window
+        offset = 32 if self.width == 64 else 0
+        last = self.width - 1
+        sent = 0
+        page = 0
+        while page < self.pages:
+            lo = self.dirty_lo[page]
+            hi = self.dirty_hi[page]
+            if lo > hi:
+                page += 1
+                continue
+            end = page
+            if lo == 0 and hi == last:
+                while (end + 1 < self.pages and self.dirty_lo[end + 1] == 0
+                        and self.dirty_hi[end + 1] == last):
+                    end += 1
+            start = page * self.width + lo
+            stop = end * self.width + hi + 1
+            self.write_cmd(SET_COL_ADDR)
+            self.write_cmd(lo + offset)
+            self.write_cmd(hi + offset)
+            self.write_cmd(SET_PAGE_ADDR)
+            self.write_cmd(page)
+            self.write_cmd(end)
+            self.write_data(self.buffer_view[start:stop])
+            self.shadow_view[start:stop] = self.buffer_view[start:stop]
+            sent += stop - start
+            page = end + 1
+        self.bytes_saved += len(self.buffer) - sent
+        self.mark_clean()
 
 
 class SSD1306_I2C(SSD1306):
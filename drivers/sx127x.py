@@ -61,16 +61,24 @@ MODE_STDBY = 0x01
 MODE_TX = 0x03
 MODE_RX_CONTINUOUS = 0x05
 MODE_RX_SINGLE = 0x06
+MODE_CAD = 0x07
 
 # PA config
 PA_BOOST = 0x80
 
 # IRQ masks
+IRQ_CAD_DETECTED_MASK = 0x01
+IRQ_CAD_DONE_MASK = 0x04
 IRQ_TX_DONE_MASK = 0x08
 IRQ_PAYLOAD_CRC_ERROR_MASK = 0x20
 IRQ_RX_DONE_MASK = 0x40
 IRQ_RX_TIME_OUT_MASK = 0x80
 
+# DIO0 source (REG_DIO_MAPPING_1 bits 7-6, LoRa mode)
+DIO0_RX_DONE = 0x00
+DIO0_TX_DONE = 0x40
+DIO0_CAD_DONE = 0x80
+
 # Buffer size
 MAX_PKT_LENGTH = 255
 
@@ -101,6 +109,12 @@ class SX127x:
         self._parameters = parameters
         self._lock = False
 
+        # preallocated SPI buffers (register access and burst FIFO header)
+        self._tx_buf = bytearray(2)
+        self._rx_buf = bytearray(2)
+        self._addr_buf = bytearray(1)
+        self._payload_buf = bytearray(MAX_PKT_LENGTH)
+
         # setting pins
         if "dio_0" in self._pins:
             self._pin_rx_done = Pin(self._pins["dio_0"], Pin.IN)
@@ -172,17 +186,43 @@ class SX127x:
         self.write_register(REG_PAYLOAD_LENGTH, 0)
 
     def end_packet(self):
-        # put in TX mode
-        self.write_register(REG_OP_MODE, MODE_LONG_RANGE_MODE | MODE_TX)
+        self.start_transmit()
 
         # wait for TX done, standby automatically on TX_DONE
-        while self.read_register(REG_IRQ_FLAGS) & IRQ_TX_DONE_MASK == 0:
+        while not self.tx_done():
             pass
 
-        # clear IRQ's
+        self.collect_garbage()
+
+    def start_transmit(self, irq = False):
+        # put in TX mode and return; poll tx_done() for completion, or with
+        # irq=True get a DIO0 edge on TxDone (receive() maps it back to RxDone)
+        if irq:
+            self.write_register(REG_DIO_MAPPING_1, DIO0_TX_DONE)
+        self.write_register(REG_OP_MODE, MODE_LONG_RANGE_MODE | MODE_TX)
+
+    def tx_done(self):
+        # one register read; clears TX_DONE once it is seen
+        if self.read_register(REG_IRQ_FLAGS) & IRQ_TX_DONE_MASK == 0:
+            return False
         self.write_register(REG_IRQ_FLAGS, IRQ_TX_DONE_MASK)
+        return True
 
-        self.collect_garbage()
+    def start_cad(self, irq = False):
+        # channel activity detection: the radio looks for a preamble for
+        # about two symbols, then returns to standby; poll cad_result(), or
+        # with irq=True get a DIO0 edge on CadDone
+        if irq:
+            self.write_register(REG_DIO_MAPPING_1, DIO0_CAD_DONE)
+        self.write_register(REG_OP_MODE, MODE_LONG_RANGE_MODE | MODE_CAD)
+
+    def cad_result(self):
+        # None while CAD runs, else True if a preamble was detected
+        irq_flags = self.read_register(REG_IRQ_FLAGS)
+        if irq_flags & IRQ_CAD_DONE_MASK == 0:
+            return None
+        self.write_register(REG_IRQ_FLAGS, IRQ_CAD_DONE_MASK | IRQ_CAD_DETECTED_MASK)
+        return bool(irq_flags & IRQ_CAD_DETECTED_MASK)
 
     def write(self, buffer):
         currentLength = self.read_register(REG_PAYLOAD_LENGTH)
@@ -191,14 +231,39 @@ class SX127x:
         # check size
         size = min(size, (MAX_PKT_LENGTH - FifoTxBaseAddr - currentLength))
 
-        # write data
-        for i in range(size):
-            self.write_register(REG_FIFO, buffer[i])
+        # burst write: one chip-select assertion for the whole payload
+        self.write_fifo(buffer, size)
 
         # update length
         self.write_register(REG_PAYLOAD_LENGTH, currentLength + size)
         return size
 
+    def write_fifo(self, buffer, size):
+        if size <= 0:
+            return
+        if size < len(buffer):
+            buffer = memoryview(buffer)[:size]
+
+        self._addr_buf[0] = REG_FIFO | 0x80
+
+        self._pin_ss.value(0)
+        self._spi.write(self._addr_buf)
+        self._spi.write(buffer)
+        self._pin_ss.value(1)
+
+    def read_fifo(self, buffer, size):
+        if size <= 0:
+            return
+        if size < len(buffer):
+            buffer = memoryview(buffer)[:size]
+
+        self._addr_buf[0] = REG_FIFO & 0x7f
+
+        self._pin_ss.value(0)
+        self._spi.write(self._addr_buf)
+        self._spi.readinto(buffer, 0x00)
+        self._pin_ss.value(1)
+
     def set_lock(self, lock = False):
         self._lock = lock
 
@@ -227,8 +292,9 @@ class SX127x:
         return (rssi - (164 if self._frequency < 868E6 else 157))
 
     def packet_snr(self):
+        # two's complement, quarter dB
         snr = self.read_register(REG_PKT_SNR_VALUE)
-        return snr * 0.25
+        return (snr - 256 if snr & 0x80 else snr) * 0.25
 
     def standby(self):
         self.write_register(REG_OP_MODE, MODE_LONG_RANGE_MODE | MODE_STDBY)
@@ -285,6 +351,17 @@ class SX127x:
             (self.read_register(REG_MODEM_CONFIG_1) & 0x0f) | (bw << 4)
         )
 
+    def set_data_rate(self, sf, sbw):
+        # change spreading factor and bandwidth together (from standby) and
+        # keep LowDataRateOptimize in step: required once a symbol is > 16ms
+        self.standby()
+        self.set_signal_bandwidth(sbw)
+        self.set_spreading_factor(sf)
+        config_3 = self.read_register(REG_MODEM_CONFIG_3) & 0xf7
+        if (1 << sf) * 1000 > 16 * sbw:
+            config_3 |= 0x08
+        self.write_register(REG_MODEM_CONFIG_3, config_3)
+
     def set_coding_rate(self, denominator):
         denominator = min(max(denominator, 5), 8)
         cr = denominator - 4
@@ -372,6 +449,7 @@ class SX127x:
 
         # The last packet always starts at FIFO_RX_CURRENT_ADDR
         # no need to reset FIFO_ADDR_PTR
+        self.write_register(REG_DIO_MAPPING_1, DIO0_RX_DONE)
         self.write_register(
             REG_OP_MODE, MODE_LONG_RANGE_MODE | MODE_RX_CONTINUOUS
         )
@@ -388,6 +466,17 @@ class SX127x:
             else:
                 self._pin_rx_done.detach_irq()
 
+    def attach_dio0(self, handler):
+        # map DIO0 to RxDone (start_transmit(irq=True) moves it to TxDone)
+        # and hand the raw pin IRQ to the caller; keep the handler IRQ-safe
+        # (no SPI, no alloc)
+        if self._pin_rx_done:
+            if handler:
+                self.write_register(REG_DIO_MAPPING_1, DIO0_RX_DONE)
+                self._pin_rx_done.irq(trigger=Pin.IRQ_RISING, handler=handler)
+            else:
+                self._pin_rx_done.irq(handler=None)
+
     def handle_on_receive(self, event_source):
         self.set_lock(True)              # lock until TX_Done
         irq_flags = self.get_irq_flags()
@@ -438,7 +527,7 @@ class SX127x:
                 MODE_LONG_RANGE_MODE | MODE_RX_SINGLE
             )
 
-    def read_payload(self):
+    def read_payload_into(self, buffer):
         # set FIFO address to current RX address
         # fifo_rx_current_addr = self.read_register(REG_FIFO_RX_CURRENT_ADDR)
         self.write_register(
@@ -452,32 +541,36 @@ class SX127x:
         else:
             packet_length = self.read_register(REG_RX_NB_BYTES)
 
-        payload = bytearray()
-        for i in range(packet_length):
-            payload.append(self.read_register(REG_FIFO))
+        # burst read straight into the caller's buffer
+        packet_length = min(packet_length, len(buffer))
+        self.read_fifo(buffer, packet_length)
+        return packet_length
+
+    def read_payload(self):
+        packet_length = self.read_payload_into(self._payload_buf)
+        payload = bytes(memoryview(self._payload_buf)[:packet_length])
 
         self.collect_garbage()
-        return bytes(payload)
+        return payload
 
     def read_register(self, address, byteorder = 'big', signed = False):
-        response = self.transfer(address & 0x7f)
-        return int.from_bytes(response, byteorder)
+        return self.transfer(address & 0x7f)
 
     def write_register(self, address, value):
         self.transfer(address | 0x80, value)
 
 
     def transfer(self, address, value = 0x00):
-        response = bytearray(1)
+        self._tx_buf[0] = address
+        self._tx_buf[1] = value
 
         self._pin_ss.value(0)
 
-        self._spi.write(bytes([address]))
-        self._spi.write_readinto(bytes([value]), response)
+        self._spi.write_readinto(self._tx_buf, self._rx_buf)
 
         self._pin_ss.value(1)
 
-        return response
+        return self._rx_buf[1]
 
     def blink_led(self, times = 1, on_seconds = 0.1, off_seconds = 0.1):
         for i in range(times):
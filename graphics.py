@@ -1,9 +1,83 @@
 # Graphics Rendering Engine
 
-from config import DISPLAY_WIDTH, DISPLAY_HEIGHT, ANIMATION_FRAME_MS
+from config import DISPLAY_WIDTH, DISPLAY_HEIGHT
 from sprites.sprite_manager import SpriteManager
-from sprites.sprite_data import SPRITE_DATA
-import time
+from utils import clock
+import framebuf
+
+# HUD layout
+HEART_SIZE = 13
+HEART_SPACING = 2
+HEART_X = 2
+HEART_Y = 10
+BAR_WIDTH = 4
+BAR_HEIGHT = 32
+BAR_X = DISPLAY_WIDTH - BAR_WIDTH - 2
+BAR_Y = (DISPLAY_HEIGHT - BAR_HEIGHT) // 2
+CONTACT_ICON_X = BAR_X - 15
+TEXT_Y = 56
+NEARBY_WIDTH = 32  # "+N" other pets in range, right end of the status line
+NEARBY_X = DISPLAY_WIDTH - NEARBY_WIDTH
+
+# Damage rectangles (x, y, w, h) for each HUD element
+HEARTS_RECT = (HEART_X + 1, HEART_Y + 1, HEART_SIZE, 3 * (HEART_SIZE + HEART_SPACING))
+BAR_RECT = (BAR_X, BAR_Y, BAR_WIDTH, BAR_HEIGHT)
+CONTACT_ICON_RECT = (CONTACT_ICON_X, BAR_Y, HEART_SIZE, HEART_SIZE)
+
+# Heart slot positions, top to bottom
+HEART_POSITIONS = tuple(
+    (HEART_X + 1, HEART_Y + i * (HEART_SIZE + HEART_SPACING) + 1) for i in range(3)
+)
+
+class HudLayer:
+    """
+    Health HUD prerendered into a full-screen layer
+    
+    Static chrome (bar outline, contact icon) is drawn once into its own
+    buffer. The layer is chrome plus the current hearts and bar fill, and is
+    only re-rendered when those values change; every other frame it is just
+    copied into the display buffer in place of the clear.
+    """
+    def __init__(self, sprite_manager):
+        size = DISPLAY_WIDTH * DISPLAY_HEIGHT // 8
+        self.chrome = bytearray(size)
+        self.buffer = bytearray(size)
+        self.fbuf = framebuf.FrameBuffer(self.buffer, DISPLAY_WIDTH, DISPLAY_HEIGHT, framebuf.MONO_VLSB)
+        self.values = None
+        
+        chrome = framebuf.FrameBuffer(self.chrome, DISPLAY_WIDTH, DISPLAY_HEIGHT, framebuf.MONO_VLSB)
+        chrome.rect(BAR_X, BAR_Y, BAR_WIDTH, BAR_HEIGHT, 1)
+        if sprite_manager.has_sprite("contact_icon") and sprite_manager.has_sprite("filled_heart_icon"):
+            icon = sprite_manager.get_sprite("filled_heart_icon")
+            chrome.blit(icon['fbuf'], CONTACT_ICON_X, BAR_Y, 0)
+        
+        # fetched on each re-render: sprites are cache slots, not kept
+        self.sprite_manager = sprite_manager
+        self.has_heart = sprite_manager.has_sprite("empty_heart_icon")
+    
+    def render(self, hearts, bar_pixels):
+        """
+        Get the layer for the given HUD values
+        
+        Args:
+            hearts: Number of signal sprites (0-3)
+            bar_pixels: Filled height of the contact bar
+        
+        Returns:
+            bytearray in display buffer layout
+        """
+        values = (hearts, bar_pixels)
+        if values != self.values:
+            self.values = values
+            self.buffer[:] = self.chrome
+            if self.has_heart and hearts:
+                heart = self.sprite_manager.get_sprite("empty_heart_icon")['fbuf']
+                for i in range(hearts):
+                    x, y = HEART_POSITIONS[i]
+                    self.fbuf.blit(heart, x, y, 0)
+            if bar_pixels > 0:
+                self.fbuf.fill_rect(BAR_X, BAR_Y + BAR_HEIGHT - bar_pixels, BAR_WIDTH, bar_pixels, 1)
+        return self.buffer
 
 class GraphicsEngine:
     def __init__(self, display):
@@ -15,48 +89,69 @@ class GraphicsEngine:
         """
         self.display = display
         self.sprite_manager = SpriteManager()
-        self.last_frame_time = time.time()
-        self.should_update_frame = False
+        self.hud = HudLayer(self.sprite_manager)
+        
+        # Damage tracking: what the last frame drew, so only changes get sent
+        self._last_sprite = None  # (name, frame_idx, x, y, w, h)
+        self._last_hud = None  # (signal sprites, contact pixels) or None
+        self._last_text = None
+        self._nearby = 0
+        self._nearby_text = ""
+        self._full_redraw = True
     
-    def update(self, pet_state, health_system=None):
+    def invalidate(self):
+        """Force the next frame to be sent in full (e.g. after a clear)"""
+        self._full_redraw = True
+    
+    def update(self, pet_state, health_system=None, update_health=True):
         """
         Update and render the display
         
         Args:
             pet_state: PetState object
             health_system: HealthSystem object (optional)
-        """
-        current_time = time.time()
-        elapsed_ms = (current_time - self.last_frame_time) * 1000
+            update_health: Run health decay here (False when a separate
+                           health task owns it)
         
-        # Update health system if provided
-        if health_system:
-            health_system.update()
-            # Update pet state based on health
+        Returns:
+            Milliseconds until the animation frame next changes, or None if
+            it never does (the error screen, a still): the caller can sleep
+            until then
+        """
+        # Update pet state based on health, once a bar or mood may have changed
+        if health_system and update_health and health_system.update():
             pet_state.update_state_from_health(health_system.get_contact_health_percent())
         
-        # Check if it's time to update animation frame
-        if elapsed_ms >= ANIMATION_FRAME_MS:
-            pet_state.update_animation()
-            self.last_frame_time = current_time
+        delay = None
+        if not pet_state.is_error:
+            delay = pet_state.update_animation(clock.now())
         
         # Only redraw if state changed or animation frame changed
-        if pet_state.is_dirty or elapsed_ms >= ANIMATION_FRAME_MS:
+        if pet_state.is_dirty:
             self.draw_frame(pet_state, health_system)
+        return delay
     
     def draw_frame(self, pet_state, health_system=None):
         """Draw current pet state with health bars"""
-        self.display.fill(0)  # Clear display
+        if health_system and not pet_state.is_error:
+            # HUD layer doubles as the cleared background
+            self._draw_health_indicators(health_system)
+        else:
+            self.display.fill(0)  # Clear display
+            self._track_hud(None)
+        if self._full_redraw:
+            self.display.mark_dirty(0, 0, DISPLAY_WIDTH, DISPLAY_HEIGHT)
+            self._full_redraw = False
         
         if pet_state.is_error:
             # Draw error sprite (X symbol)
             self._draw_error_sprite()
         else:
-            state_name = pet_state.get_state_name()
+            sprite_name = pet_state.sprite_name
             frame_idx = pet_state.animation_frame
             
-            # Get sprite for current state and frame
-            sprite_bitmap = self.sprite_manager.get_sprite(state_name, frame_idx)
+            # Get sprite for the frame on show (another state's during a transition)
+            sprite_bitmap = self.sprite_manager.get_frame(sprite_name, frame_idx)
             
             if sprite_bitmap:
                 # Draw sprite centered on display
@@ -65,101 +160,101 @@ class GraphicsEngine:
                 x = (DISPLAY_WIDTH - sprite_width) // 2
                 y = (DISPLAY_HEIGHT - sprite_height) // 2
                 
+                self._track_sprite(sprite_name, frame_idx, x, y, sprite_width, sprite_height)
                 self._draw_bitmap(sprite_bitmap, x, y)
-            
-            # Draw health indicators on sides if health_system provided
-            if health_system:
-                self._draw_health_indicators(health_system)
         
         # Draw status text at bottom
         state_name = pet_state.get_state_name()
-        self.display.text(state_name.upper(), 0, 56, 1)
+        self._track_text(state_name)
+        self.display.text(state_name.upper(), 0, TEXT_Y, 1)
+        self._draw_nearby(0 if pet_state.is_error else pet_state.nearby())
         
         self.display.show()
         pet_state.reset_dirty_flag()
     
+    def _track_sprite(self, name, frame_idx, x, y, width, height):
+        """Mark the area a sprite change touches (old and new position)"""
+        last = self._last_sprite
+        current = (name, frame_idx, x, y, width, height)
+        if last == current:
+            return
+        self._last_sprite = current
+        
+        if last is not None and last[0] == name and last[2:] == current[2:]:
+            # Next animation frame in place: only the delta's bounding box
+            rect = self.sprite_manager.step_rect(name, last[1], frame_idx)
+            if rect is not None:
+                self.display.mark_dirty(x + rect[0], y + rect[1], rect[2], rect[3])
+                return
+        if last is not None:
+            self.display.mark_dirty(last[2], last[3], last[4], last[5])
+        self.display.mark_dirty(x, y, width, height)
+    
+    def _track_hud(self, hud):
+        """Mark HUD elements whose values changed (None = HUD hidden)"""
+        last = self._last_hud
+        if hud == last:
+            return
+        self._last_hud = hud
+        
+        if hud is None or last is None:
+            self.display.mark_dirty(*HEARTS_RECT)
+            self.display.mark_dirty(*BAR_RECT)
+            self.display.mark_dirty(*CONTACT_ICON_RECT)
+            return
+        if hud[0] != last[0]:
+            self.display.mark_dirty(*HEARTS_RECT)
+        if hud[1] != last[1]:
+            self.display.mark_dirty(*BAR_RECT)
+    
+    def _track_text(self, text):
+        """Mark the status line if its text changed"""
+        last = self._last_text
+        if text == last:
+            return
+        self._last_text = text
+        
+        chars = max(len(text), len(last)) if last is not None else len(text)
+        self.display.mark_dirty(0, TEXT_Y, chars * 8, 8)
+    
+    def _draw_nearby(self, count):
+        """Draw how many other pets are in range (nothing when none)"""
+        if count != self._nearby:
+            self._nearby = count
+            self._nearby_text = "+%d" % count if count else ""
+            self.display.mark_dirty(NEARBY_X, TEXT_Y, NEARBY_WIDTH, 8)
+        text = self._nearby_text
+        if text:
+            self.display.text(text, DISPLAY_WIDTH - 8 * len(text), TEXT_Y, 1)
+    
     def _draw_health_indicators(self, health_system):
         """
         Draw health indicators:
         Left: 0-3 signal sprites (wireless health)
         Right: Contact health bar
-        """
-        sprite_size = 13
-        spacing = 2
         
-        # Left side - Signal sprites (max 3)
+        Replaces the whole display buffer with the HUD layer, so it runs
+        first and stands in for the clear.
+        """
         signal_sprites = health_system.get_wireless_signal_sprites()
-        start_x = 2
-        start_y = 10
-        
-        for i in range(3):  # Draw up to 3 sprite slots
-            # Draw filled signal sprites for active ones
-            if i < signal_sprites:
-                self._draw_heart_icon(start_x + 1, start_y + i * (sprite_size + spacing) + 1)
-        
-        # Right side - Contact health bar
-        bar_width = 4
-        bar_height = 32
-        bar_x = DISPLAY_WIDTH - bar_width - 2
-        bar_y = (DISPLAY_HEIGHT - bar_height) // 2
-        
-        # Draw contact icon above bar
-        self._draw_contact_icon(bar_x - 15, bar_y)
-        
-        # Draw health bar outline
-        for px in range(bar_width):
-            self.display.pixel(bar_x + px, bar_y, 1)
-            self.display.pixel(bar_x + px, bar_y + bar_height - 1, 1)
-        for py in range(bar_height):
-            self.display.pixel(bar_x, bar_y + py, 1)
-            self.display.pixel(bar_x + bar_width - 1, bar_y + py, 1)
-        
-        # Draw filled portion based on contact health
-        contact_pixels = health_system.get_contact_health_pixels(bar_height)
-        if contact_pixels > 0:
-            for px in range(bar_width):
-                for py in range(contact_pixels):
-                    self.display.pixel(bar_x + px, bar_y + (bar_height - py - 1), 1)
-    
-    def _draw_heart_icon(self, x, y):
-        """Draw wireless/signal indicator icon (8x8) from sprite data"""
-        if "empty_heart_icon" in SPRITE_DATA and SPRITE_DATA["empty_heart_icon"]:
-            icon_bitmap = SPRITE_DATA["empty_heart_icon"][0]
-            self._draw_bitmap(icon_bitmap, x, y)
-    
-    def _draw_contact_icon(self, x, y):
-        """Draw contact/touch indicator icon (8x8) from sprite data"""
-        if "contact_icon" in SPRITE_DATA and SPRITE_DATA["filled_heart_icon"]:
-            icon_bitmap = SPRITE_DATA["filled_heart_icon"][0]
-            self._draw_bitmap(icon_bitmap, x, y)
+        contact_pixels = health_system.get_contact_health_pixels(BAR_HEIGHT)
+        self._track_hud((signal_sprites, contact_pixels))
+        self.display.load(self.hud.render(signal_sprites, contact_pixels))
     
     def _draw_bitmap(self, bitmap_data, x, y):
         """
         Draw bitmap to display
         
         Args:
-            bitmap_data: Dictionary with 'width', 'height', and 'data' keys
+            bitmap_data: Sprite dictionary prepared by SpriteManager ('fbuf' key)
             x, y: Position on display
         """
-        width = bitmap_data.get('width', 0)
-        height = bitmap_data.get('height', 0)
-        data = bitmap_data.get('data', [])
-        
-        if not data:
+        fbuf = bitmap_data.get('fbuf')
+        if fbuf is None:
             return
         
-        # Draw pixel by pixel (bitmap format: list of bytes, 8 pixels per byte)
-        for byte_idx, byte_val in enumerate(data):
-            row = byte_idx // ((width + 7) // 8)
-            col = (byte_idx % ((width + 7) // 8)) * 8
-            
-            for bit in range(8):
-                if col + bit < width and row < height:
-                    if byte_val & (1 << bit):
-                        px = x + col + bit
-                        py = y + row
-                        if 0 <= px < DISPLAY_WIDTH and 0 <= py < DISPLAY_HEIGHT:
-                            self.display.pixel(px, py, 1)
+        # Single native blit; key=0 keeps unset sprite pixels transparent
+        self.display.blit(fbuf, x, y, 0)
     
     def _draw_error_sprite(self):
         """Draw error sprite (X symbol) in center of display"""
@@ -167,6 +262,8 @@ class GraphicsEngine:
         center_y = ((DISPLAY_HEIGHT) // 2) - 25  # Offset for text at bottom
         size = 100
         
-        if "irritated" in SPRITE_DATA and SPRITE_DATA["irritated"]:
-            icon_bitmap = SPRITE_DATA["irritated"][0]
-            self._draw_bitmap(icon_bitmap, center_x - size // 2, center_y)
+        if self.sprite_manager.has_sprite("irritated"):
+            icon_bitmap = self.sprite_manager.get_sprite("irritated")
+            x = center_x - size // 2
+            self._track_sprite("irritated", 0, x, center_y, icon_bitmap['width'], icon_bitmap['height'])
+            self._draw_bitmap(icon_bitmap, x, center_y)
@@ -1,7 +1,7 @@
 # Health System - Connection and Contact tracking
 
-from config import DEBUG
-import time
+from config import DEBUG, MOOD_THRESHOLDS
+from utils import clock
 
 class HealthSystem:
     def __init__(self):
@@ -9,28 +9,71 @@ class HealthSystem:
         Initialize health system with two bars:
         - wireless_health: depletes if no LoRA sync, resets on sync
         - contact_health: depletes if no physical contact, resets on contact
+        
+        Contact health is fixed-point, in milliseconds of life left: a full
+        bar is contact_timeout_ms units and decay is one unit per ms, so the
+        value is worked out when read from the level at the last event and
+        the ticks since, with no periodic update. update() predicts when
+        the bar or the mood will next change and next_change_ms() reports
+        it, so a task can sleep until then (or until flag is set by an
+        event).
         """
         self.wireless_health = 100  # 0-100
-        self.contact_health = 100   # 0-100
         
-        self.last_wireless_update = time.time()
-        self.last_contact_update = time.time()
+        self.last_wireless_update = clock.now()
+        
+        # Time constants (ticks_ms)
+        self.wireless_timeout_ms = 10000  # Health fully depletes in 10 seconds without sync
+        self.contact_timeout_ms = 30000   # Health fully depletes in 30 seconds without contact
         
-        # Time constants (in seconds)
-        self.wireless_timeout = 10.0  # Health fully depletes in 10 seconds without sync
-        self.contact_timeout = 30.0   # Health fully depletes in 30 seconds without contact
+        self._contact_units = self.contact_timeout_ms  # level at _contact_since
+        self._contact_since = clock.now()
+        self._deadline = None  # ticks_ms of the next visible change, None = none due
+        self.changed = True  # an event moved a bar since the last update()
+        self.flag = None  # optional ThreadSafeFlag set on every event
+    
+    def _contact_now(self, now):
+        """Contact units at ticks now; an empty bar stays latched at zero"""
+        units = self._contact_units
+        if units:
+            units -= clock.diff(now, self._contact_since)
+            if units <= 0:
+                # latch, so the reference cannot wrap days later
+                units = self._contact_units = 0
+                self._contact_since = now
+        return units
+    
+    def _set_contact(self, units):
+        self._contact_units = units
+        self._contact_since = clock.now()
+        self._event()
+    
+    def _event(self):
+        self.changed = True
+        if self.flag:
+            self.flag.set()
+    
+    @property
+    def contact_health(self):
+        """Contact health 0-100, rounded down as int() did on the float bar"""
+        return self._contact_now(clock.now()) * 100 // self.contact_timeout_ms
+    
+    @contact_health.setter
+    def contact_health(self, percent):
+        self._set_contact(max(0, min(100, int(percent))) * self.contact_timeout_ms // 100)
     
     def on_wireless_sync(self):
-        """Called when LoRA packet is received - reduces signal sprites and boosts contact health by 20%
+        """Called when LoRA packet is received - reduces signal sprites and refills contact health
         Returns True if successful, False if all signals depleted"""
         if self.wireless_health <= 0:
             # No signals left, cannot sync
             return False
         
         self.wireless_health = max(0, self.wireless_health - 34)  # Remove one "signal sprite" (~33%)
-        self.contact_health = min(100, self.contact_health + 20)  # Boost contact health by 20%
-        self.last_wireless_update = time.time()
-        self.last_contact_update = time.time()
+        self.last_wireless_update = clock.now()
+        # A sync restarts the contact decay from full (the +20% boost this
+        # used to apply was replaced by the next periodic update anyway)
+        self._set_contact(self.contact_timeout_ms)
         if DEBUG:
             print(f"Wireless sync! Wireless: {self.wireless_health}, Contact: {self.contact_health}")
         return True
@@ -38,19 +81,55 @@ class HealthSystem:
     def on_physical_contact(self):
         """Called when OneWire contact detected - replenishes both bars"""
         self.wireless_health = 100
-        self.contact_health = 100
-        self.last_wireless_update = time.time()
-        self.last_contact_update = time.time()
+        self.last_wireless_update = clock.now()
+        self._set_contact(self.contact_timeout_ms)
         if DEBUG:
             print("Physical contact! Both health bars reset to 100")
     
     def update(self):
-        """Update health bars based on elapsed time since last update"""
-        current_time = time.time()
+        """
+        Check whether a displayed value may have changed
         
-        # Update contact health (depletes over time without physical contact)
-        contact_elapsed = current_time - self.last_contact_update
-        self.contact_health = max(0, 100 - (contact_elapsed / self.contact_timeout * 100))
+        Returns:
+            True after an event, or once the next_change_ms() deadline has
+            passed; False while every bar, heart and mood is unchanged
+        """
+        now = clock.now()
+        due = self.changed or (self._deadline is not None and clock.diff(now, self._deadline) >= 0)
+        if due:
+            self.changed = False
+            delay = self._next_change(now)
+            self._deadline = None if delay is None else clock.add(now, delay)
+        return due
+    
+    def next_change_ms(self):
+        """
+        Milliseconds until update() will next return True without an event
+        (the contact bar or the mood changes), or None if nothing is due
+        """
+        if self.changed:
+            return 0
+        if self._deadline is None:
+            return None
+        return max(clock.diff(self._deadline, clock.now()), 0)
+    
+    def _next_change(self, now, bar_height=32):
+        """Milliseconds from now until the bar or the mood changes, or None"""
+        units = self._contact_now(now)
+        timeout = self.contact_timeout_ms
+        if not units:
+            return None
+        percent = units * 100 // timeout
+        # highest unit below the current one that shows a different bar or
+        # mood: the one just under the current pixel's or mood threshold's
+        # first unit (0 = none; still wake when the bar empties, to latch it)
+        pixels = units * bar_height // timeout
+        target = (pixels * timeout + bar_height - 1) // bar_height - 1 if pixels else 0
+        for threshold in MOOD_THRESHOLDS:
+            if percent >= threshold:
+                target = max(target, (threshold * timeout + 99) // 100 - 1)
+                break
+        return units - target
     
     def get_wireless_health_percent(self):
         """Return wireless health as 0-100"""
@@ -58,7 +137,7 @@ class HealthSystem:
     
     def get_contact_health_percent(self):
         """Return contact health as 0-100"""
-        return int(self.contact_health)
+        return self.contact_health
     
     def get_wireless_signal_sprites(self):
         """Return number of signal sprites to draw (0-3)"""
@@ -73,4 +152,4 @@ class HealthSystem:
     
     def get_contact_health_pixels(self, max_height=32):
         """Convert contact health to pixel height for bar display"""
-        return int((self.contact_health / 100.0) * max_height)
+        return self._contact_now(clock.now()) * max_height // self.contact_timeout_ms
@@ -0,0 +1,205 @@
+# LoRA Adaptive Data Rate
+
+import math
+from utils import clock
+from utils.peer_table import NO_SLOT
+
+NOISE_FIGURE_DB = 6  # SX127x receiver noise figure
+
+def snr_limit_q(sf):
+    """Demodulator SNR floor in quarter dB (-5 dB at SF6, 2.5 dB lower per SF)"""
+    return -20 - 10 * (sf - 6)
+
+def noise_floor_q(bandwidth):
+    """Thermal noise plus receiver noise figure over the bandwidth, quarter dBm"""
+    return round(4 * (-174 + 10 * math.log10(bandwidth) + NOISE_FIGURE_DB))
+
+class LinkAdapter:
+    def __init__(self, device_id, rates, peers, margin_db=10, max_missed=3, hysteresis_db=3,
+                 timeout_ms=120000):
+        """
+        Pick the fastest data rate every paired pet can still hear
+        
+        Received power is tracked per peer (EWMA of packet RSSI, or of SNR
+        plus noise floor when the packet was below the noise, where RSSI
+        only measures noise). A rate is supported when that power clears the
+        rate's sensitivity by margin_db.
+        
+        Only a pair adapts: with more than one peer known the leader
+        commands the robust rate, so pets that have not been heard yet (and
+        only ever start out robust) stay in reach of the broadcast.
+        
+        Every packet carries one control byte: high nibble the rate command
+        (leader) or rate in use (follower), low nibble the fastest rate the
+        sender supports. The pet with the lowest device id leads: it takes
+        the minimum of its own and every peer's supported rate, steps down at
+        once, steps up one rung at a time once its own estimate clears the
+        next rung by hysteresis_db more, announces the new rate in its next
+        packet and switches once that packet is sent (acknowledged, when it
+        asked for an ACK). Followers switch when they hear the command. After
+        max_missed sends without hearing any peer, a pet falls back to the
+        robust rate and drops its power estimates.
+        
+        Peers are the shared PeerTable's, heard within timeout_ms: the same
+        ones the link layer's ACK gate and the application count, evicted
+        least recently heard first, so strangers passing by neither grow
+        the table nor count towards the pair for good.
+        
+        Args:
+            device_id: This pet's id (decides leadership)
+            rates: ((spreading_factor, bandwidth_hz), ...), robust first,
+                   at most 16 entries
+            peers: PeerTable shared with the application and ReliableLink
+            margin_db: Link margin required above sensitivity
+            max_missed: Sends without a reply before falling back
+            hysteresis_db: Extra margin needed to step up
+            timeout_ms: Silence after which a peer is forgotten
+        """
+        self.device_id = device_id
+        self.rates = rates
+        self.peers = peers
+        self.noise_q = [noise_floor_q(bw) for sf, bw in rates]
+        self.sensitivity_q = [
+            self.noise_q[i] + snr_limit_q(sf) for i, (sf, bw) in enumerate(rates)
+        ]
+        self.margin_q = 4 * margin_db
+        self.hysteresis_q = 4 * hysteresis_db
+        self.max_missed = max_missed
+        self.rate = 0  # index into rates, as both ends use it
+        self.announced = None  # command in the packet on air (leader)
+        self.timeout_ms = timeout_ms
+        self.missed = 0
+        self.rate_changes = 0
+        self.fallbacks = 0
+    
+    def _supported(self, power_q, margin_q):
+        """Fastest rate whose sensitivity power_q clears by margin_q"""
+        best = 0
+        for i in range(len(self.rates)):
+            if power_q - self.sensitivity_q[i] >= margin_q:
+                best = i
+        return best
+    
+    def _live(self, slot, now):
+        """True while the peer in slot (walking from the most recently heard) is live"""
+        return slot != NO_SLOT and clock.diff(now, self.peers.last_seen[slot]) < self.timeout_ms
+    
+    def supported(self, extra_q=0):
+        """Fastest rate this pet hears every live peer with a power estimate at"""
+        peers = self.peers
+        now = clock.now()
+        best = None
+        slot = peers.head
+        while self._live(slot, now):
+            power_q = peers.power_q[slot]
+            if power_q is not None:
+                rate = self._supported(power_q, self.margin_q + extra_q)
+                best = rate if best is None else min(best, rate)
+            slot = peers.after(slot)
+        return self.rate if best is None else best
+    
+    def leader_id(self):
+        """Lowest device id among this pet and its live peers"""
+        peers = self.peers
+        now = clock.now()
+        lowest = self.device_id
+        slot = peers.head
+        while self._live(slot, now):
+            if peers.ids[slot] < lowest:
+                lowest = peers.ids[slot]
+            slot = peers.after(slot)
+        return lowest
+    
+    def is_leader(self):
+        return self.leader_id() == self.device_id
+    
+    def target(self):
+        """Rate the leader commands next (down at once, one rung up at most)"""
+        peers = self.peers
+        live = peers.live(clock.now(), self.timeout_ms)
+        if not live:
+            return self.rate
+        if live > 1:
+            return 0
+        slot = peers.head  # the one live peer
+        if peers.power_q[slot] is None:
+            return self.rate
+        keep = min(self.supported(), peers.advertised[slot])
+        up = min(self.supported(self.hysteresis_q), peers.advertised[slot])
+        if keep < self.rate:
+            return keep
+        if up > self.rate:
+            return self.rate + 1
+        return self.rate
+    def _set_rate(self, rate):
+        if rate != self.rate:
+            self.rate = rate
+            self.rate_changes += 1
+    
+    def on_receive(self, peer, control, rssi, snr_q):
+        """
+        Feed back one received packet
+        
+        Args:
+            peer: Sender's device id
+            control: The packet's control byte
+            rssi: Packet RSSI in dBm
+            snr_q: Packet SNR in quarter dB
+        """
+        if snr_q >= 0:
+            power_q = 4 * rssi
+        else:
+            power_q = snr_q + self.noise_q[self.rate]
+        now = clock.now()
+        peers = self.peers
+        peers.expire(now, self.timeout_ms)
+        slot = peers.touch(peer, now)
+        if peers.power_q[slot] is None:
+            peers.power_q[slot] = power_q
+        else:
+            peers.power_q[slot] += (power_q - peers.power_q[slot]) >> 2
+        peers.advertised[slot] = control & 0x0F
+        self.missed = 0
+        
+        command = control >> 4
+        if peer < self.device_id and peer == self.leader_id() and command < len(self.rates):
+            self._set_rate(command)
+    
+    def check_fallback(self):
+        """Back to the robust rate after max_missed unanswered sends"""
+        if self.missed >= self.max_missed:
+            peers = self.peers
+            slot = peers.head
+            while slot != NO_SLOT:
+                peers.power_q[slot] = None
+                slot = peers.after(slot)
+            self.missed = 0
+            if self.rate:
+                self.fallbacks += 1
+            self._set_rate(0)
+    
+    def control(self, announce=True):
+        """
+        Control byte for a packet about to be sent
+        
+        Args:
+            announce: False for packets that must not carry a rate change
+                      (ACKs, which are not confirmed themselves)
+        """
+        self.missed += 1
+        if announce and self.is_leader():
+            self.announced = self.target()
+            command = self.announced
+        else:
+            command = self.rate
+        return (command << 4) | self.supported()
+    
+    def on_sent(self):
+        """The packet is off the air: the leader now moves to its command"""
+        if self.announced is not None:
+            self._set_rate(self.announced)
+            self.announced = None
+    
+    def on_lost(self):
+        """The packet carrying the command was never acknowledged: stay put"""
+        self.announced = None
@@ -3,15 +3,141 @@
 from config import (
     LORA_MOSI_PIN, LORA_MISO_PIN, LORA_CLK_PIN, LORA_SS_PIN,
     LORA_RESET_PIN, LORA_DIO0_PIN, LORA_FREQUENCY,
-    LORA_BANDWIDTH, LORA_SPREADING_FACTOR, LORA_CODING_RATE, LORA_POWER
+    LORA_BANDWIDTH, LORA_SPREADING_FACTOR, LORA_CODING_RATE, LORA_POWER,
+    LORA_PREAMBLE_LENGTH,
+    LORA_RX_IRQ, LORA_RX_RING_SLOTS, LORA_RX_SLOT_SIZE,
+    LORA_DUTY_CYCLE_PERCENT, LORA_DUTY_WINDOW_MS, LORA_TX_POLL_MS,
+    LORA_ADR, LORA_ADR_RATES, LORA_ADR_MARGIN_DB, LORA_ADR_MAX_MISSED,
+    LORA_LBT, LORA_LBT_MAX_TRIES, LORA_SNIFF_MS, LORA_IDLE_SNIFF_MS,
+    LORA_ACK, LORA_ACK_RETRIES, LORA_ACK_SLACK_MS, LORA_PEER_TIMEOUT_MS, PEER_TABLE_SLOTS
 )
 from machine import SPI, Pin
-from drivers.sx127x import SX127x
+from drivers.sx127x import (
+    SX127x, MAX_PKT_LENGTH, REG_IRQ_FLAGS, REG_PKT_SNR_VALUE,
+    IRQ_RX_DONE_MASK, IRQ_PAYLOAD_CRC_ERROR_MASK
+)
+from utils.packet_ring import PacketRing
+from utils.peer_table import PeerTable
+from lora_scheduler import TxScheduler, packet_airtime_us
+from lora_adr import LinkAdapter
+from lora_link import (
+    ReliableLink, crc8, HDR_ACK, HDR_ACK_REQUEST, HDR_TRAILER, SEQ_MASK
+)
+from utils.aio import asyncio
+from utils import clock
+import micropython
+import random
 import time
 
-class LoRaCommunication:
+# Radio states driven by LoRaCommunication.service()
+RADIO_RX = 0  # RX continuous
+RADIO_SLEEP = 1  # sniffing: asleep until the next CAD
+RADIO_SNIFF = 2  # sniffing: CAD looking for a wake-up preamble
+RADIO_SNIFF_RX = 3  # sniffing: preamble seen, receiving the packet
+RADIO_LBT = 4  # CAD before transmitting
+RADIO_TX = 5
+
+CAD_SYMBOLS = 2  # a CAD listens for about two symbols
+
+class TxHandle:
+    """Progress of one send(): queued, on air, then sent/acked/superseded/failed"""
+    QUEUED = 0
+    ON_AIR = 1
+    WAIT_ACK = 2  # sent, waiting for the peer's ACK (retransmitted on timeout)
+    SENT = 3  # left the radio (unconfirmed)
+    ACKED = 4
+    SUPERSEDED = 5  # a newer packet replaced it before it got airtime
+    FAILED = 6  # radio error, or no ACK after LORA_ACK_RETRIES
+    
     def __init__(self):
-        """Initialize LoRA module using sx127x driver"""
+        self.state = TxHandle.QUEUED
+        self._event = None
+    
+    @property
+    def done(self):
+        return self.state >= TxHandle.SENT
+    
+    def _finish(self, state):
+        self.state = state
+        if self._event:
+            self._event.set()
+    
+    async def wait(self):
+        """
+        Wait until the packet has left the radio (and was acknowledged,
+        if it asked for an ACK) or was dropped
+        
+        Returns:
+            True if it was sent or acknowledged
+        """
+        if not self.done:
+            self._event = asyncio.Event()
+            await self._event.wait()
+        return self.state == TxHandle.SENT or self.state == TxHandle.ACKED
+
+class LoRaCommunication:
+    def __init__(self, device_id=0, peers=None):
+        """
+        Initialize LoRA module using sx127x driver
+        
+        Args:
+            device_id: This pet's id (adaptive data rate leadership)
+            peers: PeerTable shared with the application (default: a new one)
+        """
+        # Preallocated receive buffer; receive() returns views into it
+        self.rx_buffer = bytearray(MAX_PKT_LENGTH)
+        self.rx_view = memoryview(self.rx_buffer)
+        
+        # Interrupt-driven receive state (see enable_irq_receive)
+        self.irq_receive = False
+        self.rx_ring = PacketRing(LORA_RX_RING_SLOTS, LORA_RX_SLOT_SIZE)
+        self._rx_held = False
+        self.schedule_misses = 0
+        self.rx_flag = None  # Optional flag set whenever a packet is queued
+        
+        # Radio state machine (see service): duty-cycled TX,
+        # listen-before-talk and sniff-mode RX
+        self.scheduler = None
+        self.state = RADIO_RX
+        self.op_started = 0  # ticks_ms when the running TX/CAD/RX began
+        self.op_deadline_ms = 0
+        self.dio0_event = False  # TxDone/CadDone edge seen (IRQ mode)
+        self.rx_event = False  # RxDone drained while sniffing
+        self.tx_handle = None  # on air
+        self.tx_frame = None
+        self.pending_handle = None  # queued in the scheduler
+        self.ack_handle = None  # sent, waiting for an ACK
+        self.radio_flag = None  # Optional flag set on submit and on radio events
+        self.meter = None  # Optional PowerMeter told about every radio state change
+        self.dio0 = None  # DIO0 pin (IRQ mode)
+        self.lbt = LORA_LBT
+        self.lbt_tries = 0
+        self.backoff_until = None
+        self.sniff_ms = LORA_SNIFF_MS  # 0 = stay in RX continuous
+        self.wake_at = 0
+        self.lbt_busy = 0  # CADs that found the channel busy
+        self.lbt_forced = 0  # sent anyway after LORA_LBT_MAX_TRIES
+        self.sniff_hits = 0  # wake-up CADs that led to a packet
+        self.sniff_misses = 0  # ... and ones that did not
+        
+        # Every pet heard: link windows, ADR estimates and the last syncs
+        self.peers = peers if peers is not None else PeerTable(PEER_TABLE_SLOTS)
+        
+        # Adaptive data rate: control trailer on every packet (see lora_adr)
+        self.adr = LinkAdapter(
+            device_id, LORA_ADR_RATES, self.peers, LORA_ADR_MARGIN_DB, LORA_ADR_MAX_MISSED,
+            timeout_ms=LORA_PEER_TIMEOUT_MS
+        ) if LORA_ADR else None
+        self.rate = 0  # LORA_ADR_RATES index the radio is set to
+        self._trailer = bytearray(2)  # [ADR control] CRC-8
+        self.last_rssi = 0  # link quality of the last packet from receive()
+        self.last_seq = 0  # link sequence number of the last packet from receive()
+        self.last_snr = 0  # quarter dB
+        
+        # Sequence numbers, CRC, ACKs and duplicate filtering (see lora_link)
+        self.device_id = device_id
+        self.link = ReliableLink(device_id, self.peers, LORA_ACK, LORA_ACK_RETRIES, LORA_PEER_TIMEOUT_MS)
+        
         try:
             # Hardware reset sequence
             reset_pin = Pin(LORA_RESET_PIN, Pin.OUT)
@@ -46,65 +172,540 @@ class LoRaCommunication:
                 'signal_bandwidth': LORA_BANDWIDTH,
                 'spreading_factor': LORA_SPREADING_FACTOR,
                 'coding_rate': LORA_CODING_RATE,
-                'preamble_length': 8,
+                'preamble_length': LORA_PREAMBLE_LENGTH,
                 'implicit_header': False,
                 'sync_word': 0x12,
-                'enable_CRC': False,
+                'enable_CRC': False,  # CRC-8 in the frame instead (see lora_link)
                 'invert_IQ': False,
             }
             
             # Initialize LoRA
             self.lora = SX127x(self.spi, pins, parameters)
             self.lora.receive()  # Start in receive mode
+            self.parameters = parameters
+            self.scheduler = TxScheduler(
+                self.airtime_us, LORA_DUTY_CYCLE_PERCENT, LORA_DUTY_WINDOW_MS
+            )
             self.initialized = True
+            if LORA_RX_IRQ:
+                self.enable_irq_receive()
+            self.set_sniff(self.sniff_ms)
             print("LoRA initialized successfully")
         
         except Exception as e:
             print(f"LoRA initialization error: {e}")
             self.initialized = False
     
+    def airtime_us(self, frame_len):
+        """Time on air of a frame (plus CRC and ADR trailer) at the current data rate"""
+        frame_len += 1
+        if self.adr:
+            frame_len += 1
+        return packet_airtime_us(self.parameters, frame_len)
+    
+    def _sync_rate(self, now):
+        """Retune the radio to the ADR rate (never mid-operation), then idle"""
+        if not self.adr or self.adr.rate == self.rate:
+            return
+        if self.state in (RADIO_TX, RADIO_LBT, RADIO_SNIFF):
+            return
+        if self.scheduler.urgent is not None:
+            return  # the ACK goes out at the rate its frame came in on
+        self.rate = self.adr.rate
+        sf, bandwidth = LORA_ADR_RATES[self.rate]
+        self.lora.set_data_rate(sf, bandwidth)
+        self.parameters['spreading_factor'] = sf
+        self.parameters['signal_bandwidth'] = bandwidth
+        self._set_preamble()
+        self._idle(now)
+        print(f"ADR: SF{sf} {bandwidth // 1000} kHz")
+    
+    def _symbol_us(self):
+        return (1 << self.parameters['spreading_factor']) * 1000000 // self.parameters['signal_bandwidth']
+    
+    def _cad_ms(self):
+        return (CAD_SYMBOLS * self._symbol_us() + 999) // 1000
+    
+    def _set_preamble(self):
+        """
+        Long preamble while sniffing, so it spans a receiver's sleep and CAD
+        
+        With LORA_IDLE_SNIFF_MS any pet may be sniffing while idle, so the
+        preamble always spans that sleep too.
+        """
+        length = LORA_PREAMBLE_LENGTH
+        sniff_ms = max(self.sniff_ms, LORA_IDLE_SNIFF_MS)
+        if sniff_ms:
+            symbol_us = self._symbol_us()
+            length += (sniff_ms * 1000 + symbol_us - 1) // symbol_us + CAD_SYMBOLS
+        self.lora.set_preamble_length(length)
+        self.parameters['preamble_length'] = length
+    
+    def set_sniff(self, sniff_ms):
+        """
+        Choose RX continuous (0) or sniff mode
+        
+        In sniff mode the radio sleeps for sniff_ms, wakes for a CAD and
+        only stays in RX when it finds a preamble; every packet is sent
+        with a preamble long enough to be caught that way. Needs the DIO0
+        interrupt.
+        
+        Args:
+            sniff_ms: Sleep between wake-up CADs, 0 to disable
+        """
+        if not self.initialized or self.state != RADIO_RX and self.state != RADIO_SLEEP:
+            return
+        if sniff_ms and not self.irq_receive:
+            print("LoRA sniff mode needs LORA_RX_IRQ")
+            sniff_ms = 0
+        self.sniff_ms = sniff_ms
+        self._set_preamble()
+        self._idle(clock.now())
+        if self.radio_flag:
+            self.radio_flag.set()  # the radio task has a new sleep deadline
+    
     def send(self, data):
         """
-        Send data via LoRA
+        Queue data for transmission
+        
+        Only the newest queued packet is kept; service() sends it when the
+        radio is free and the duty-cycle budget covers its airtime. It is
+        framed with a sequence number and CRC, and retransmitted until the
+        paired pet acknowledges it (see ReliableLink).
         
         Args:
-            data: Bytes to send
+            data: Bytes to send, starting with this pet's device id
+        
+        Returns:
+            TxHandle to check or await, or None if the radio is not available
+        """
+        if not self.initialized:
+            return None
+        
+        # a newer sync replaces the queued one and ends the wait for an ACK
+        for old in (self.pending_handle, self.ack_handle):
+            if old and not old.done:
+                old._finish(TxHandle.SUPERSEDED if old.state == TxHandle.QUEUED else TxHandle.SENT)
+        self.ack_handle = None
+        handle = TxHandle()
+        self.pending_handle = handle
+        self.scheduler.submit(self.link.frame(data, self.adr is not None, clock.now()))
+        if self.radio_flag:
+            self.radio_flag.set()
+        return handle
+    
+    def service(self):
+        """
+        Advance the radio without blocking
+        
+        Finishes a running TX (TxDone) or CAD (CadDone), queues a
+        retransmission when an ACK is overdue, starts the next packet (ACKs
+        first) once the radio is free, the duty-cycle budget covers it and,
+        with listen-before-talk, a CAD found the channel clear, and runs
+        the sniff cycle. In IRQ mode DIO0 wakes the caller through
+        radio_flag and the deadlines are only watchdogs for a missed edge;
+        otherwise results are polled once they are due.
         
         Returns:
-            True if successful, False otherwise
+            Milliseconds until the next call is useful, or None when idle
         """
         if not self.initialized:
-            return False
+            return None
         
+        now = clock.now()
         try:
-            print(f"TX: Sending {len(data)} bytes")
-            self.lora.begin_packet(implicit_header_mode=False)
-            self.lora.write(data)
-            print("TX: Waiting for TX_DONE...")
-            self.lora.end_packet()
-            print("TX: Packet sent, returning to RX mode")
-            self.lora.receive()  # Return to receive mode after sending
-            return True
+            wait = self._step(now)
+            if wait is not None:
+                return wait
+            ack_wait = self._check_ack(now)
+            wait = self._start_next(now)
+            if self.state == RADIO_SLEEP:
+                # sniffing: wake for a CAD when the sleep is over
+                sleep = clock.diff(self.wake_at, now)
+                if sleep <= 0:
+                    self.lora.start_cad(irq=True)
+                    self._begin(RADIO_SNIFF, now, self._cad_ms())
+                    return self.op_deadline_ms
+                wait = sleep if wait is None else min(wait, sleep)
+            if ack_wait is not None and self.state != RADIO_LBT and self.state != RADIO_TX:
+                wait = ack_wait if wait is None else min(wait, ack_wait)
+            return wait
         except Exception as e:
-            print(f"LoRA send error: {e}")
-            return False
+            print(f"LoRA radio error: {e}")
+            if self.state == RADIO_TX:
+                self._end_tx(TxHandle.FAILED, now)
+            else:
+                self._idle(now)
+            return None
+    
+    def _begin(self, state, now, duration_ms, watchdog=True):
+        """Enter a timed state; its result is due after duration_ms"""
+        self.state = state
+        self.op_started = now
+        self.dio0_event = False
+        if self.meter:
+            self.meter.radio(state, now)
+        # with DIO0 the deadline only catches a missed edge
+        if watchdog and self.irq_receive:
+            duration_ms *= 2
+        self.op_deadline_ms = duration_ms
+    
+    def _due(self, now):
+        """Milliseconds until the running operation's result is due"""
+        if self.dio0_event:
+            return 0
+        return max(self.op_deadline_ms - clock.diff(now, self.op_started), 0)
+    
+    def _idle(self, now):
+        """Radio free: RX continuous, or asleep until the next sniff"""
+        if self.sniff_ms:
+            self.state = RADIO_SLEEP
+            self.lora.sleep()
+            self.wake_at = clock.add(now, self.sniff_ms)
+        else:
+            self.state = RADIO_RX
+            self.lora.receive()
+        if self.meter:
+            self.meter.radio(self.state, now)
+    
+    def _step(self, now):
+        """
+        Advance a running TX, CAD or sniff RX window
+        
+        Returns:
+            Milliseconds to wait, or None once the radio is free
+        """
+        state = self.state
+        if state == RADIO_TX:
+            wait = self._due(now)
+            if wait:
+                return wait
+            if not self.lora.tx_done():
+                return LORA_TX_POLL_MS
+            awaiting = self.link.on_sent(self.tx_frame, now, self._ack_timeout_ms())
+            self._end_tx(TxHandle.WAIT_ACK if awaiting else TxHandle.SENT, now)
+            print("TX: Packet sent")
+            if self.adr:
+                if not awaiting and not self.tx_frame[0] & HDR_ACK:
+                    # a rate command asking for an ACK takes effect with the ACK
+                    self.adr.on_sent()
+                self._sync_rate(now)
+            return None
+        
+        if state == RADIO_LBT or state == RADIO_SNIFF:
+            wait = self._due(now)
+            if wait:
+                return wait
+            busy = self.lora.cad_result()
+            if busy is None:
+                return LORA_TX_POLL_MS
+            if state == RADIO_LBT:
+                return self._lbt_result(busy, now)
+            if busy:
+                # wake-up preamble: listen until the packet is in
+                self.rx_event = False
+                self.lora.receive()
+                self._begin(RADIO_SNIFF_RX, now, self._max_packet_ms(), watchdog=False)
+                return self.op_deadline_ms
+            self._idle(now)
+            return None
+        
+        if state == RADIO_SNIFF_RX:
+            if self.rx_event:
+                self.sniff_hits += 1
+            else:
+                wait = self._due(now)
+                if wait:
+                    return wait
+                self.sniff_misses += 1
+            self._idle(now)
+        return None
+    
+    def _max_packet_ms(self):
+        return (self.airtime_us(LORA_RX_SLOT_SIZE) + 999) // 1000
+    
+    def _start_next(self, now):
+        """
+        Start the pending packet (or its listen-before-talk CAD) if allowed
+        
+        Returns:
+            Milliseconds until the started operation or the packet is due,
+            or None if nothing is pending
+        """
+        if self.adr and self.scheduler.peek() is not None:
+            self.adr.check_fallback()
+            self._sync_rate(now)
+        wait = self.scheduler.wait_ms(now)
+        if wait is None:
+            return None
+        if self.backoff_until is not None:
+            backoff = clock.diff(self.backoff_until, now)
+            if backoff > 0:
+                wait = max(wait, backoff)
+            else:
+                self.backoff_until = None
+        if wait > 0:
+            return wait
+        
+        if self.lbt:
+            self.lora.start_cad(irq=self.irq_receive)
+            self._begin(RADIO_LBT, now, self._cad_ms())
+            return self.op_deadline_ms
+        return self._transmit(now)
+    
+    def _lbt_result(self, busy, now):
+        """CAD before TX finished: transmit, or back off and retry"""
+        if busy and self.lbt_tries < LORA_LBT_MAX_TRIES:
+            # binary exponential backoff in units of this packet's airtime
+            self.lbt_busy += 1
+            self.lbt_tries += 1
+            window = (self.airtime_us(len(self.scheduler.peek())) // 1000 + 1) << self.lbt_tries
+            self.backoff_until = clock.add(now, random.getrandbits(16) % window)
+            self._idle(now)
+            return None
+        if busy:
+            self.lbt_forced += 1
+        self.lbt_tries = 0
+        return self._transmit(now)
+    
+    def _transmit(self, now):
+        """Load the next frame, append ADR control and CRC, and start TX"""
+        ack = self.scheduler.urgent is not None
+        packet = self.scheduler.next_packet(now)
+        if packet is None:
+            self._idle(now)
+            return self.scheduler.wait_ms(now)
+        
+        print(f"TX: Sending {len(packet)} bytes")
+        if not ack:
+            self.tx_handle = self.pending_handle
+            self.pending_handle = None
+            self.tx_handle.state = TxHandle.ON_AIR
+        self.tx_frame = packet
+        self._begin(RADIO_TX, now, (self.airtime_us(len(packet)) + 999) // 1000)
+        self.lora.begin_packet(implicit_header_mode=False)
+        self.lora.write(packet)
+        crc = crc8(packet)
+        trailer = self._trailer
+        if self.adr:
+            trailer[0] = self.adr.control(not ack)
+            trailer[1] = crc8(trailer[:1], crc)
+            self.lora.write(trailer)
+        else:
+            trailer[1] = crc
+            self.lora.write(trailer[1:])
+        self.lora.start_transmit(irq=self.irq_receive)
+        return self.op_deadline_ms
+    
+    def _end_tx(self, state, now):
+        """Leave TX (DIO0 back on RxDone) and resolve the handle"""
+        self._idle(now)
+        handle = self.tx_handle
+        self.tx_handle = None
+        if handle is None:
+            return  # an ACK
+        if state == TxHandle.WAIT_ACK:
+            handle.state = state
+            self.ack_handle = handle
+        else:
+            handle._finish(state)
+    
+    def _ack_timeout_ms(self):
+        """How long the peer's ACK can take: its CAD, its airtime and some slack"""
+        return self._cad_ms() + self.airtime_us(3) // 1000 + LORA_ACK_SLACK_MS
+    
+    def _check_ack(self, now):
+        """
+        Retransmit (or give up on) a frame whose ACK is overdue
+        
+        Returns:
+            Milliseconds until the ACK timer expires, or None
+        """
+        wait = self.link.ack_wait_ms(now)
+        if wait is None or wait > 0:
+            return wait
+        frame = self.link.retry()
+        handle = self.ack_handle
+        if frame is None:
+            self.ack_handle = None
+            if handle:
+                handle._finish(TxHandle.FAILED)
+            if self.adr:
+                self.adr.on_lost()
+            print("TX: No ACK")
+        elif self.scheduler.pending is None:
+            self.scheduler.submit(frame)
+            self.pending_handle = handle
+        return None
+    
+    def enable_irq_receive(self):
+        """
+        Switch to interrupt-driven receive
+        
+        DIO0 (RxDone) schedules _drain_rx, which copies the packet from the
+        radio FIFO into the preallocated ring. receive() then only pops from
+        the ring, so packets arriving between main loop iterations queue up
+        instead of overwriting each other. While transmitting or running a
+        CAD, DIO0 is mapped to TxDone/CadDone and wakes service() instead.
+        """
+        if not self.initialized:
+            return
+        # Bound methods allocate; create them once so the ISR does not
+        self._drain_rx_ref = self._drain_rx
+        self._on_dio0_ref = self._on_dio0
+        self.irq_receive = True
+        self.dio0 = self.lora._pin_rx_done
+        self.lora.attach_dio0(self._on_dio0_ref)
+    
+    def check_dio0(self):
+        """Catch up on a DIO0 edge the IRQ missed (e.g. one that woke the CPU from light sleep)"""
+        if self.irq_receive and self.dio0 and self.dio0.value():
+            self._on_dio0(self.dio0)
+    
+    def _on_dio0(self, pin):
+        """DIO0 rising edge (hard IRQ context): defer the SPI work"""
+        if self.state == RADIO_TX or self.state == RADIO_LBT or self.state == RADIO_SNIFF:
+            # mapped to TxDone/CadDone: wake the radio task
+            self.dio0_event = True
+            if self.radio_flag:
+                self.radio_flag.set()
+            return
+        try:
+            micropython.schedule(self._drain_rx_ref, 0)
+        except RuntimeError:
+            # Schedule queue full: an earlier drain is still pending and
+            # will find this packet's RxDone flag
+            self.schedule_misses += 1
+    
+    def _drain_rx(self, _):
+        """Scheduled: move a received packet from the radio FIFO into the ring"""
+        try:
+            irq_flags = self.lora.read_register(REG_IRQ_FLAGS)
+            if not irq_flags & IRQ_RX_DONE_MASK:
+                return  # e.g. TxDone, handled by service()
+            if self.state == RADIO_SNIFF_RX:
+                # the wake-up packet is in: let service() put the radio back to sleep
+                self.rx_event = True
+                if self.radio_flag:
+                    self.radio_flag.set()
+            
+            # Clear only the RX flags so a pending TX_DONE is left alone
+            self.lora.write_register(
+                REG_IRQ_FLAGS, irq_flags & (IRQ_RX_DONE_MASK | IRQ_PAYLOAD_CRC_ERROR_MASK)
+            )
+            if irq_flags & IRQ_PAYLOAD_CRC_ERROR_MASK:
+                return
+            
+            buffer = self.rx_ring.reserve()
+            if buffer is None:
+                self.rx_ring.dropped += 1
+                return
+            self.rx_ring.commit(
+                self.lora.read_payload_into(buffer), self.lora.packet_rssi(), self._packet_snr()
+            )
+            if self.rx_flag:
+                self.rx_flag.set()
+        except Exception as e:
+            print(f"LoRA drain error: {e}")
+    
+    def _packet_snr(self):
+        """SNR of the last packet in quarter dB (integer, no float)"""
+        snr = self.lora.read_register(REG_PKT_SNR_VALUE)
+        return snr - 256 if snr & 0x80 else snr
+    
+    def _unframe(self, frame):
+        """
+        Check and strip a received frame's link layer
+        
+        Drops frames with a bad CRC, feeds the ADR trailer to LinkAdapter,
+        resolves ACKs, answers ACK requests and drops duplicates.
+        
+        Returns:
+            The body (starting with the sender's device id) of a new data
+            frame, or None if there is nothing for the application
+        """
+        end = len(frame) - 1
+        if end < 2 or crc8(frame[:end]) != frame[end]:
+            self.link.crc_errors += 1
+            return None
+        header = frame[0]
+        if header & HDR_TRAILER:
+            end -= 1
+            if end < 2:
+                self.link.crc_errors += 1
+                return None
+            if self.adr:
+                self.adr.on_receive(frame[1], frame[end], self.last_rssi, self.last_snr)
+        body = frame[1:end]
+        now = clock.now()
+        
+        if header & HDR_ACK:
+            awaited = self.link.awaiting
+            if len(body) >= 2 and body[1] == self.device_id and self.link.on_ack(header):
+                handle = self.ack_handle
+                self.ack_handle = None
+                if handle and self.pending_handle is handle:
+                    # the ACK beat a retransmission still queued
+                    self.pending_handle = None
+                    self.scheduler.cancel(awaited)
+                if handle:
+                    handle._finish(TxHandle.ACKED)
+                if self.adr:
+                    self.adr.on_sent()
+            self._sync_rate(now)
+            return None
+        
+        new = self.link.accept(body[0], header, now)
+        self.last_seq = header & SEQ_MASK
+        if header & HDR_ACK_REQUEST and self.link.live_peers(now) == 1:
+            self.scheduler.submit(self.link.ack_frame(header, body[0], self.adr is not None), urgent=True)
+            if self.radio_flag:
+                self.radio_flag.set()
+        self._sync_rate(now)
+        return body if new else None
     
     def receive(self):
         """
         Check for incoming LoRA data
         
         Returns:
-            Received bytes or None if no data
+            memoryview of the received bytes (valid until the next call)
+            or None if no data
         """
         if not self.initialized:
             return None
         
+        while True:
+            frame = self._next_frame()
+            if frame is None:
+                return None
+            body = self._unframe(frame)
+            if body is not None:
+                return body
+    
+    def _next_frame(self):
+        """Next raw frame from the ring (IRQ mode) or the radio FIFO, or None"""
+        if self.irq_receive:
+            # Free the slot handed out last time, then pop the next one
+            if self._rx_held:
+                self.rx_ring.release()
+            frame = self.rx_ring.peek()
+            self._rx_held = frame is not None
+            if frame is None:
+                return None
+            self.last_rssi = self.rx_ring.rssi
+            self.last_snr = self.rx_ring.snr
+            return frame
+        
         try:
             irq_flags = self.lora.read_register(0x12)  # REG_IRQ_FLAGS
             if irq_flags & 0x40:  # IRQ_RX_DONE_MASK
                 print(f"RX: Packet detected (IRQ: 0x{irq_flags:02x})")
-                payload = self.lora.read_payload()
-                print(f"RX: Got {len(payload)} bytes")
+                length = self.lora.read_payload_into(self.rx_buffer)
+                payload = self.rx_view[:length]
+                print(f"RX: Got {length} bytes")
+                self.last_rssi = self.lora.packet_rssi()
+                self.last_snr = self._packet_snr()
                 # Clear the RX_DONE interrupt flag (0x40)
                 self.lora.write_register(0x12, 0x40)
                 return payload
@@ -0,0 +1,220 @@
+# LoRA Link Framing: sequence numbers, CRC, ACKs and duplicate filtering
+
+from utils import clock
+import random
+
+HDR_ACK = 0x80  # acknowledgement: body is [acker id, acked pet id]
+HDR_ACK_REQUEST = 0x40  # sender wants this sequence number acknowledged
+HDR_TRAILER = 0x20  # an ADR control byte sits before the CRC
+SEQ_MASK = 0x1F
+DEDUP_WINDOW = 8  # sequence numbers behind the newest still remembered per peer
+FRAME_OVERHEAD = 2  # header + CRC-8 (the ADR trailer adds one more)
+
+def _crc8_table():
+    table = bytearray(256)
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x07) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+        table[i] = crc
+    return bytes(table)
+
+CRC8_TABLE = _crc8_table()
+
+def crc8(data, crc=0):
+    """CRC-8 (polynomial 0x07) of data, continuing from crc"""
+    table = CRC8_TABLE
+    for b in data:
+        crc = table[crc ^ b]
+    return crc
+
+def encode(header, body, control=None):
+    """
+    Build a whole frame as it goes on air
+    
+    The firmware writes frames to the radio piecewise; this is for tools
+    and the simulator that play frames in.
+    
+    Args:
+        header: Header byte (flags | sequence number)
+        body: Frame body, starting with the sender's device id
+        control: ADR control byte, or None for no trailer
+    
+    Returns:
+        bytes: [header][body][control?][CRC-8]
+    """
+    frame = bytearray(1)
+    frame[0] = header if control is None else header | HDR_TRAILER
+    frame += body
+    if control is not None:
+        frame.append(control)
+    frame.append(crc8(frame))
+    return bytes(frame)
+
+class ReliableLink:
+    def __init__(self, device_id, peers, ack=True, retries=3, peer_timeout_ms=120000):
+        """
+        Sequence numbers, duplicate filtering and ACK/retransmit for syncs
+        
+        Frames are [header][body][ADR control?][CRC-8]. The header holds a
+        5-bit sequence number and the ACK, ACK request and trailer flags;
+        every body starts with the sender's device id. A retransmission
+        reuses its sequence number, so the receiver's per-peer window of
+        recent numbers drops it as a duplicate (and acknowledges it again).
+        
+        ACKs are only requested, and requests only answered, while exactly
+        one peer has been heard within peer_timeout_ms: a pair confirms each
+        sync, while a crowd would answer a broadcast with colliding ACKs.
+        Only the newest frame is ever awaited; a new frame gives up on the
+        previous one.
+        
+        Dedup windows live in the shared PeerTable's per-slot fields: a
+        sender not yet known takes a free slot, else the least recently
+        heard one, so strangers on the channel cost no memory, and the ACK
+        gate counts the same live peers as the rest of the firmware.
+        
+        Args:
+            device_id: This pet's id
+            peers: PeerTable shared with the application and LinkAdapter
+            ack: Request ACKs
+            retries: Retransmissions before giving up on an ACK
+            peer_timeout_ms: Silence after which a peer's dedup state is
+                             forgotten (it may have rebooted)
+        """
+        self.device_id = device_id
+        self.ack = ack
+        self.retries = retries
+        self.peer_timeout_ms = peer_timeout_ms
+        self.seq = random.getrandbits(5)  # avoid matching a stale window after reboot
+        self.peers = peers
+        self.awaiting = None  # sent frame waiting for its ACK
+        self.ack_deadline = None  # ticks_ms; None while the frame is queued again
+        self.tries = 0
+        self.retransmits = 0
+        self.acked = 0
+        self.unacked = 0  # gave up after retries
+        self.acks_sent = 0
+        self.duplicates = 0
+        self.crc_errors = 0
+    
+    def live_peers(self, now):
+        """Peers heard within peer_timeout_ms"""
+        return self.peers.live(now, self.peer_timeout_ms)
+    
+    def frame(self, body, trailer, now):
+        """
+        Start a new data frame
+        
+        Args:
+            body: Payload, starting with this pet's device id
+            trailer: An ADR control byte will follow the body
+            now: ticks_ms
+        
+        Returns:
+            bytearray [header][body] (the sender appends trailer and CRC)
+        """
+        self.seq = (self.seq + 1) & SEQ_MASK
+        header = self.seq
+        if trailer:
+            header |= HDR_TRAILER
+        if self.ack and self.live_peers(now) == 1:
+            header |= HDR_ACK_REQUEST
+        self.awaiting = None
+        self.ack_deadline = None
+        frame = bytearray(1 + len(body))
+        frame[0] = header
+        frame[1:] = body
+        return frame
+    
+    def ack_frame(self, header, sender, trailer):
+        """ACK for a received frame with this header, from sender"""
+        frame = bytearray(3)
+        frame[0] = HDR_ACK | (header & SEQ_MASK)
+        if trailer:
+            frame[0] |= HDR_TRAILER
+        frame[1] = self.device_id
+        frame[2] = sender
+        self.acks_sent += 1
+        return frame
+    
+    def accept(self, sender, header, now):
+        """
+        Record a data frame from sender
+        
+        Returns:
+            False if its sequence number was already seen (a retransmission)
+        """
+        seq = header & SEQ_MASK
+        peers = self.peers
+        peers.expire(now, self.peer_timeout_ms)  # silent too long: it may have rebooted
+        slot = peers.touch(sender, now)
+        seen = peers.seen[slot]
+        if not seen:
+            peers.newest[slot] = seq
+            peers.seen[slot] = 1
+            return True
+        ahead = (seq - peers.newest[slot]) & SEQ_MASK
+        if ahead and ahead <= SEQ_MASK - DEDUP_WINDOW:
+            # newer: slide the window (bit k = newest - k seen)
+            peers.newest[slot] = seq
+            peers.seen[slot] = ((seen << ahead) | 1) & ((2 << DEDUP_WINDOW) - 1)
+            return True
+        bit = 1 << ((SEQ_MASK + 1 - ahead) & SEQ_MASK)
+        if seen & bit:
+            self.duplicates += 1
+            return False
+        peers.seen[slot] = seen | bit  # late, but not seen yet
+        return True
+    
+    def on_sent(self, frame, now, timeout_ms):
+        """
+        A frame left the radio: start the ACK timer if it asked for one
+        
+        Returns:
+            True if an ACK is now awaited for it
+        """
+        header = frame[0]
+        if not header & HDR_ACK_REQUEST or (header ^ self.seq) & SEQ_MASK:
+            return False
+        if frame is not self.awaiting:
+            self.awaiting = frame
+            self.tries = 0
+        self.tries += 1
+        self.ack_deadline = clock.add(now, timeout_ms)
+        return True
+    
+    def on_ack(self, header):
+        """
+        An ACK addressed to this pet arrived
+        
+        Returns:
+            True if it confirms the awaited frame
+        """
+        awaiting = self.awaiting
+        if awaiting is None or (awaiting[0] ^ header) & SEQ_MASK:
+            return False
+        self.awaiting = None
+        self.ack_deadline = None
+        self.acked += 1
+        return True
+    
+    def ack_wait_ms(self, now):
+        """Milliseconds until the ACK timer expires (0 = expired), or None"""
+        if self.ack_deadline is None:
+            return None
+        return max(clock.diff(self.ack_deadline, now), 0)
+    
+    def retry(self):
+        """
+        The ACK timer expired
+        
+        Returns:
+            The frame to send again, or None once retries are used up
+        """
+        self.ack_deadline = None
+        if self.tries > self.retries:
+            self.awaiting = None
+            self.unacked += 1
+            return None
+        self.retransmits += 1
+        return self.awaiting
@@ -0,0 +1,149 @@
+# LoRA Airtime and Duty-Cycle Scheduling
+
+from utils import clock
+
+def time_on_air_us(payload_len, sf, bandwidth, coding_rate, preamble=8,
+                   implicit_header=False, crc=False, low_data_rate=None):
+    """
+    Exact LoRa packet duration (Semtech AN1200.13), integer arithmetic
+    
+    Args:
+        payload_len: Payload bytes
+        sf: Spreading factor (6-12)
+        bandwidth: Signal bandwidth in Hz
+        coding_rate: Coding rate denominator (5-8 for 4/5..4/8)
+        preamble: Programmed preamble length in symbols
+        implicit_header: Implicit header mode (no header on air)
+        crc: Payload CRC enabled
+        low_data_rate: LowDataRateOptimize; None = on when a symbol is
+                       longer than 16 ms, as SX127x sets it
+    
+    Returns:
+        Time on air in microseconds (rounded down)
+    """
+    bandwidth = int(bandwidth)
+    if low_data_rate is None:
+        low_data_rate = (1 << sf) * 1000 > 16 * bandwidth
+    de = 1 if low_data_rate else 0
+    bits = 8 * payload_len - 4 * sf + 28 + (16 if crc else 0) - (20 if implicit_header else 0)
+    divisor = 4 * (sf - 2 * de)
+    blocks = max((bits + divisor - 1) // divisor, 0)  # ceil, never negative
+    payload_symbols = 8 + blocks * coding_rate
+    # (preamble + 4.25 + payload_symbols) symbols, in quarter symbols
+    quarter_symbols = 4 * preamble + 17 + 4 * payload_symbols
+    return quarter_symbols * (1 << sf) * 1000000 // (4 * bandwidth)
+
+def packet_airtime_us(parameters, payload_len):
+    """
+    Time on air for a payload with an SX127x parameter dictionary
+    
+    Args:
+        parameters: Dict as passed to SX127x (signal_bandwidth,
+                    spreading_factor, coding_rate, preamble_length,
+                    implicit_header, enable_CRC)
+        payload_len: Payload bytes
+    """
+    return time_on_air_us(
+        payload_len,
+        parameters['spreading_factor'],
+        parameters['signal_bandwidth'],
+        parameters['coding_rate'],
+        parameters['preamble_length'],
+        parameters['implicit_header'],
+        parameters['enable_CRC'],
+    )
+
+class TxScheduler:
+    def __init__(self, airtime_us, duty_cycle_percent, window_ms):
+        """
+        Duty-cycle token bucket with a one-packet coalescing queue
+        
+        The bucket holds up to duty_cycle_percent of window_ms of airtime
+        and refills at the duty-cycle rate. Only the newest submitted
+        packet is kept: older state updates that never got airtime are
+        superseded rather than queued. Urgent packets (ACKs) have a slot
+        of their own that goes first, and are charged the same way.
+        
+        Args:
+            airtime_us: Function payload_len -> airtime in microseconds
+            duty_cycle_percent: Allowed share of airtime (e.g. 1 for 1%)
+            window_ms: Duty-cycle window the budget is spread over
+        """
+        self.airtime_us = airtime_us
+        self.rate_ppm = int(duty_cycle_percent * 10000)  # parts per million
+        self.capacity_us = window_ms * self.rate_ppm // 1000
+        self.tokens_us = self.capacity_us
+        self.last_refill = clock.now()
+        self.pending = None
+        self.urgent = None
+        self.coalesced = 0
+        self.sent = 0
+        self.airtime_used_us = 0
+    
+    def submit(self, packet, urgent=False):
+        """Queue a packet, replacing one that has not been sent yet"""
+        if urgent:
+            self.urgent = packet
+            return
+        if self.pending is not None:
+            self.coalesced += 1
+        self.pending = packet
+    
+    def cancel(self, packet):
+        """Drop packet if it is still queued"""
+        if self.pending is packet:
+            self.pending = None
+    
+    def peek(self):
+        """The packet next_packet() would take, or None"""
+        return self.pending if self.urgent is None else self.urgent
+    
+    def _refill(self, now):
+        elapsed = clock.diff(now, self.last_refill)
+        if elapsed <= 0:
+            return
+        self.last_refill = now
+        self.tokens_us = min(self.capacity_us, self.tokens_us + elapsed * self.rate_ppm // 1000)
+    
+    def next_packet(self, now=None):
+        """
+        Take the pending packet if the budget covers its airtime
+        
+        Returns:
+            The packet (its airtime is charged), or None
+        """
+        packet = self.peek()
+        if packet is None:
+            return None
+        if now is None:
+            now = clock.now()
+        self._refill(now)
+        cost = self.airtime_us(len(packet))
+        if cost > self.tokens_us:
+            return None
+        if packet is self.urgent:
+            self.urgent = None
+        else:
+            self.pending = None
+        self.tokens_us -= cost
+        self.sent += 1
+        self.airtime_used_us += cost
+        return packet
+    
+    def wait_ms(self, now=None):
+        """
+        Get the time until the pending packet can be sent
+        
+        Returns:
+            Milliseconds (0 = now), or None if nothing is pending
+        """
+        packet = self.peek()
+        if packet is None:
+            return None
+        if now is None:
+            now = clock.now()
+        self._refill(now)
+        deficit = self.airtime_us(len(packet)) - self.tokens_us
+        if deficit <= 0:
+            return 0
+        return (deficit * 1000 + self.rate_ppm - 1) // self.rate_ppm
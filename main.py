@@ -2,15 +2,34 @@
 # P4nda5 Virtual Pet - Main Application
 
 from machine import Pin
-from config import LORA_SYNC_MS, DEBUG, ONEWIRE_PIN
+from config import (
+    LORA_SYNC_MS, DEBUG, BUTTON_PIN, ONEWIRE_PIN,
+    BUTTON_DEBOUNCE_MS, LONG_PRESS_MS, DOUBLE_PRESS_MS, INPUT_RING_SLOTS,
+    ONEWIRE_PRESENCE, ONEWIRE_SAMPLE_MS, ONEWIRE_RESET_US, ONEWIRE_PRESENCE_US, ONEWIRE_JITTER_US,
+    POWER_LIGHTSLEEP, POWER_MIN_SLEEP_MS, POWER_MAX_SLEEP_MS, POWER_DIM_MS, POWER_OFF_MS,
+    POWER_DIM_CONTRAST, LORA_IDLE_SNIFF_MS
+)
 from pet_state import PetState
 from graphics import GraphicsEngine
 from health_system import HealthSystem
 from lora_comm import LoRaCommunication
+from power_manager import PowerManager
 from utils.i2c_display import Display
-from utils.button_handler import ButtonHandler
+from utils.input_events import InputManager
+from utils.onewire_contact import OneWireContact
+from utils.aio import asyncio, sleep_ms, wait_ms, Flag
+from utils import clock
 import time
 
+# Task slots in the power manager's deadline table
+TASK_INPUT = 0
+TASK_RENDER = 1
+TASK_HEALTH = 2
+TASK_LORA = 3
+TASK_RADIO = 4
+TASK_CONTACT = 5
+TASKS = 6
+
 class VirtualPetApp:
     def __init__(self, device_id=0):
         """Initialize virtual pet application"""
@@ -21,28 +40,53 @@ class VirtualPetApp:
         print("Initializing display...")
         self.display = Display()
         
-        print("Initializing pet state...")
-        self.pet_state = PetState(device_id)
-        
         print("Initializing graphics engine...")
         self.graphics = GraphicsEngine(self.display)
         
+        print("Initializing pet state...")
+        self.pet_state = PetState(device_id, self.graphics.sprite_manager.frame_counts())
+        
         print("Initializing health system...")
         self.health = HealthSystem()
         
         print("Initializing LoRA communication...")
-        self.lora = LoRaCommunication()
+        self.lora = LoRaCommunication(device_id, self.pet_state.peers)
         
-        print("Initializing button handler...")
-        self.button = ButtonHandler(self.on_button_pressed)
+        print("Initializing buttons...")
+        self.inputs = InputManager(INPUT_RING_SLOTS, BUTTON_DEBOUNCE_MS, LONG_PRESS_MS, DOUBLE_PRESS_MS)
+        self.button = self.inputs.add(BUTTON_PIN)
+        self.button.on_press = self.on_button_pressed
+        self.contact = None
+        self.contact_button = None
+        if ONEWIRE_PRESENCE:
+            self.contact = OneWireContact(ONEWIRE_PIN, ONEWIRE_SAMPLE_MS, ONEWIRE_RESET_US,
+                                          ONEWIRE_PRESENCE_US, ONEWIRE_JITTER_US)
+            self.contact.on_contact(self.on_physical_contact)
+        else:
+            self.contact_button = self.inputs.add(ONEWIRE_PIN)  # contact reset button
+            self.contact_button.on_press = self.on_physical_contact
+        
+        print("Initializing power management...")
+        self.power = PowerManager(
+            self.display, self.lora, TASKS, POWER_LIGHTSLEEP, POWER_MIN_SLEEP_MS,
+            POWER_MAX_SLEEP_MS, POWER_DIM_MS, POWER_OFF_MS, POWER_DIM_CONTRAST, LORA_IDLE_SNIFF_MS
+        )
+        for pin in self.inputs.pins:
+            self.power.wake_on(pin, 0)
+        if self.lora.dio0:
+            self.power.wake_on(self.lora.dio0, 1)
         
-        print("Initializing contact reset button...")
-        self.contact_button_pin = Pin(ONEWIRE_PIN, Pin.IN, Pin.PULL_UP)
-        self.contact_button_pressed = False
+        # Event-driven wakeups for the cooperative runtime
+        self.redraw_flag = Flag()
+        self.inputs.flag = Flag()
+        self.lora.rx_flag = Flag()
+        self.lora.radio_flag = Flag()
+        self.health.flag = Flag()
+        self.power.flag = Flag()
         
         # Timing
-        self.last_lora_sync = time.time()
-        self.error_start_time = None  # Track when error occurred
+        self.last_lora_sync = clock.now()
+        self.error_start_time = None  # ticks_ms when the error occurred
         self.error_duration_ms = 1000  # Show error for 500ms
         
         if DEBUG:
@@ -52,6 +96,7 @@ class VirtualPetApp:
         """Handle button press - reduce wireless health, boost contact health"""
         if DEBUG:
             print("Button pressed!")
+        self.power.user_activity()
         
         # Try to sync wireless
         success = self.health.on_wireless_sync()
@@ -61,16 +106,22 @@ class VirtualPetApp:
             self.pet_state.previous_state = self.pet_state.current_state
             self.pet_state.is_error = True
             self.pet_state.is_dirty = True
-            self.error_start_time = time.time()
+            self.error_start_time = clock.now()
             if DEBUG:
                 print("No wireless signals left! Error state displayed.")
         else:
             self.error_start_time = None
             self._send_state()
+        self._request_redraw()
+    
+    def _request_redraw(self):
+        """Wake the render task now instead of at the next animation frame"""
+        self.pet_state.is_dirty = True
+        self.redraw_flag.set()
     
     def _send_state(self):
         """Send current state via LoRA"""
-        packet = self.pet_state.get_sync_packet()
+        packet = self.pet_state.encode_sync(self.health)
         if self.lora.send(packet):
             if DEBUG:
                 print(f"Sent state: {self.pet_state.get_state_name()}")
@@ -79,70 +130,198 @@ class VirtualPetApp:
                 print("Failed to send state")
     
     def _check_lora_updates(self):
-        """Check for incoming LoRA messages"""
-        data = self.lora.receive()
-        if data:
+        """Check for incoming LoRA messages (drains every queued packet)"""
+        while True:
+            data = self.lora.receive()
+            if not data:
+                break
+            self._handle_packet(data)
+    
+    def _handle_packet(self, data):
+        """Apply one received sync packet"""
+        if DEBUG:
+            print(f"Received: {bytes(data).hex()}")
+        if not self.pet_state.apply_sync(data, self.lora.last_rssi, self.lora.last_seq):
+            return  # another pet nearby, or not a sync this firmware understands
+        success = self.health.on_wireless_sync()  # Removes one signal sprite and boosts contact health
+        
+        if not success:
+            # No signals left - show error state
+            self.pet_state.previous_state = self.pet_state.current_state
+            self.pet_state.is_error = True
+            self.pet_state.is_dirty = True
+            self.error_start_time = clock.now()
             if DEBUG:
-                print(f"Received: {data.hex()}")
-            self.pet_state.parse_sync_packet(data)
-            success = self.health.on_wireless_sync()  # Removes one signal sprite and boosts contact health
-            
-            if not success:
-                # No signals left - show error state
-                self.pet_state.previous_state = self.pet_state.current_state
-                self.pet_state.is_error = True
-                self.pet_state.is_dirty = True
-                self.error_start_time = time.time()
-                if DEBUG:
-                    print("No wireless signals left! Error state displayed.")
+                print("No wireless signals left! Error state displayed.")
     
     def on_physical_contact(self):
         """Called when physical contact detected via OneWire"""
         self.health.on_physical_contact()
+        self.power.user_activity()
         self.error_start_time = None  # Clear error state
         self.pet_state.is_error = False
-        self.pet_state.is_dirty = True
+        self._request_redraw()
         if DEBUG:
             print("Physical contact detected!")
     
+    def _check_error_timeout(self):
+        """
+        Revert from the error state once error_duration_ms has elapsed
+        
+        Returns:
+            Milliseconds until the error screen ends, or None if not shown
+        """
+        if self.error_start_time is not None:
+            elapsed_ms = clock.elapsed(self.error_start_time)
+            if elapsed_ms < self.error_duration_ms:
+                return self.error_duration_ms - elapsed_ms
+            # Revert from error state
+            self.pet_state.is_error = False
+            self.pet_state.current_state = self.pet_state.previous_state
+            self.error_start_time = None
+            self._request_redraw()
+            if DEBUG:
+                print("Error cleared, reverting to previous state")
+        return None
+    
+    def _check_inputs(self):
+        """Classify button and contact edges queued by the pin IRQs"""
+        self.inputs.process()
+    
+    async def _input_task(self):
+        """Buttons and error timeout: woken by pin IRQs, else by the next timer"""
+        while self.running:
+            self._check_inputs()
+            delay = self._check_error_timeout()
+            timer = self.inputs.next_deadline_ms()
+            if delay is None or (timer is not None and timer < delay):
+                delay = timer
+            self.power.wait(TASK_INPUT, delay)
+            if delay is None:
+                await self.inputs.flag.wait()
+            else:
+                await wait_ms(self.inputs.flag.wait(), delay)
+    
+    async def _contact_task(self):
+        """OneWire contact sensing: one reset/presence phase per wakeup"""
+        while self.running:
+            delay = self.contact.step()
+            self.power.wait(TASK_CONTACT, delay)
+            await sleep_ms(delay)
+    
+    async def _render_task(self):
+        """Draw when the animation frame changes, or at once when woken by an event (not while the display is off)"""
+        while self.running:
+            if self.power.display_off:
+                self.power.wait(TASK_RENDER, None)
+                await self.redraw_flag.wait()
+                continue
+            delay = self.graphics.update(self.pet_state, self.health, update_health=False)
+            self.power.wait(TASK_RENDER, delay)
+            if delay is None:
+                await self.redraw_flag.wait()
+            else:
+                await wait_ms(self.redraw_flag.wait(), delay)
+    
+    async def _health_task(self):
+        """Mood thresholds and HUD redraws: woken by health events, else at the next visible change"""
+        while self.running:
+            if self.health.update():
+                self.pet_state.update_state_from_health(self.health.get_contact_health_percent())
+                self._request_redraw()
+            delay = self.health.next_change_ms()
+            self.power.wait(TASK_HEALTH, delay)
+            if delay is None:
+                await self.health.flag.wait()
+            else:
+                await wait_ms(self.health.flag.wait(), delay)
+    
+    async def _lora_task(self):
+        """Handle received packets: woken by the RX flag in IRQ mode, else polled"""
+        while self.running:
+            if self.lora.irq_receive:
+                self.power.wait(TASK_LORA, None)
+                await self.lora.rx_flag.wait()
+            else:
+                self.power.wait(TASK_LORA, LORA_SYNC_MS)
+                await sleep_ms(LORA_SYNC_MS)
+                self.last_lora_sync = clock.now()
+            if self.running:
+                self._check_lora_updates()
+                self._request_redraw()
+    
+    async def _radio_task(self):
+        """Drive the LoRa radio: woken by send() and DIO0, else by its own deadline"""
+        while self.running:
+            delay = self.lora.service()
+            self.power.wait(TASK_RADIO, delay)
+            if delay is None:
+                await self.lora.radio_flag.wait()
+            else:
+                await wait_ms(self.lora.radio_flag.wait(), delay)
+    
+    def _events_pending(self):
+        """IRQ work queued for a task that has not run yet"""
+        return len(self.inputs.ring) or self.lora.irq_receive and len(self.lora.rx_ring)
+    
+    async def _power_task(self):
+        """Display and radio idle timeouts; light sleep whenever every other task is waiting"""
+        power = self.power
+        while self.running:
+            delay = power.step()
+            seen = power.activity
+            await sleep_ms(0)  # let every task that is ready run first
+            if not self.running:
+                break
+            if power.activity != seen or self._events_pending():
+                continue  # a task ran: its new deadline may be sooner
+            wait = power.next_wait(delay)
+            if power.sleep(wait):
+                # edges that woke the CPU may not have reached the pin IRQs
+                self.inputs.resync(clock.now())
+                self.lora.check_dio0()
+                continue
+            if wait is None:
+                await power.flag.wait()
+            else:
+                await wait_ms(power.flag.wait(), max(wait, 1))
+    
+    async def run_async(self):
+        """
+        Run each subsystem as its own task
+        
+        Every task sleeps until its own deadline or event, so when nothing
+        is due the event loop idles until the earliest wakeup instead of
+        spinning on a fixed delay.
+        """
+        tasks = [
+            self._input_task(),
+            self._render_task(),
+            self._health_task(),
+            self._lora_task(),
+            self._radio_task(),
+        ]
+        if self.contact:
+            tasks.append(self._contact_task())
+        tasks.append(self._power_task())
+        await asyncio.gather(*tasks)
+    
+    def stop(self):
+        """Ask all tasks to finish"""
+        self.running = False
+        self.redraw_flag.set()
+        self.lora.rx_flag.set()
+        self.lora.radio_flag.set()
+        self.health.flag.set()
+        self.inputs.flag.set()
+        self.power.flag.set()
+    
     def run(self):
-        """Main application loop"""
+        """Main application entry: start the cooperative runtime"""
         print("Starting virtual pet application...")
         
         try:
-            while self.running:
-                # Check if error display timeout has elapsed
-                if self.error_start_time is not None:
-                    elapsed_ms = (time.time() - self.error_start_time) * 1000
-                    if elapsed_ms >= self.error_duration_ms:
-                        # Revert from error state
-                        self.pet_state.is_error = False
-                        self.pet_state.current_state = self.pet_state.previous_state
-                        self.pet_state.is_dirty = True
-                        self.error_start_time = None
-                        if DEBUG:
-                            print("Error cleared, reverting to previous state")
-                
-                # Check button input
-                self.button.check()
-                
-                # Check for contact reset button (GPIO pulled high, pressed = low)
-                contact_pressed = self.contact_button_pin.value() == 0
-                if contact_pressed and not self.contact_button_pressed:
-                    self.on_physical_contact()
-                self.contact_button_pressed = contact_pressed
-                
-                # Update graphics with health system
-                self.graphics.update(self.pet_state, self.health)
-                
-                # Check LoRA at intervals
-                current_time = time.time()
-                if (current_time - self.last_lora_sync) * 1000 >= LORA_SYNC_MS:
-                    self._check_lora_updates()
-                    self.last_lora_sync = current_time
-                
-                # Small delay to prevent tight loop
-                time.sleep(0.05)
+            asyncio.run(self.run_async())
         
         except KeyboardInterrupt:
             print("Application interrupted")
@@ -1,40 +1,76 @@
 # Virtual Pet State Machine
 
-from config import PET_STATES
-import time
+from config import (
+    PET_STATES, MOOD_THRESHOLDS, PEER_TABLE_SLOTS, PEER_PARTNER_ID, LORA_PEER_TIMEOUT_MS,
+    ANIMATION_CLIPS, ANIMATION_TRANSITIONS
+)
+from sync_codec import SyncPacket, SYNC_LEN, encode_into, decode_into, quantize_contact
+from sprites.animation import Animator
+from utils.peer_table import PeerTable
+from utils import clock
 
 class PetState:
-    def __init__(self, device_id=0):
+    def __init__(self, device_id=0, frame_counts=None):
+        """
+        Initialize pet state
+        
+        Args:
+            device_id: This pet's id in syncs
+            frame_counts: Frames per sprite name (SpriteManager.frame_counts()),
+                          to check the animation clips against (optional)
+        """
         self.device_id = device_id
         self.current_state = 0  # Start with "happy"
-        self.last_update = time.time()
-        self.animation_frame = 0
+        self.last_update = clock.now()
+        
+        # Precompiled state and transition timelines; sprite_name and
+        # animation_frame are what is on show (animation_frame is also the
+        # phase sent in syncs)
+        self.animation = Animator(ANIMATION_CLIPS, ANIMATION_TRANSITIONS, frame_counts)
+        self.animation.play(PET_STATES[self.current_state], self.last_update)
+        self.sprite_name = self.animation.sprite
+        self.animation_frame = self.animation.frame
         self.is_dirty = True  # Flag for display refresh
         self.is_error = False  # Error state flag
         self.previous_state = 0  # Store state before error
         
+        # Preallocated sync messages (see sync_codec)
+        self.sync_out = SyncPacket()
+        self.peer = SyncPacket()  # last sync received from any pet
+        self.sync_buffer = bytearray(SYNC_LEN)
+        
+        # Every pet in range; only the partner's syncs drive this pet
+        self.peers = PeerTable(PEER_TABLE_SLOTS)
+        self.partner = PEER_PARTNER_ID
+    
     def set_state(self, state_id):
         """Change pet state"""
         if state_id in PET_STATES:
             if self.current_state != state_id:
-                self.current_state = state_id
-                self.animation_frame = 0
-                self.is_dirty = True
+                self._play(state_id)
             return True
         return False
     
+    def _play(self, state_id):
+        """Switch state, through a transition clip if one is configured"""
+        previous = PET_STATES[self.current_state]
+        self.current_state = state_id
+        self.animation.play(PET_STATES[state_id], clock.now(), previous)
+        self._show()
+    
+    def _show(self):
+        self.sprite_name = self.animation.sprite
+        self.animation_frame = self.animation.frame
+        self.is_dirty = True
+    
     def update_state_from_health(self, contact_health):
         """Update pet state based on contact health percentage"""
-        if contact_health >= 80:
-            new_state = 0  # happy
-        elif contact_health >= 60:
-            new_state = 1  # hungry
-        elif contact_health >= 40:
-            new_state = 2  # sad
-        elif contact_health >= 20:
-            new_state = 3  # sleeping
-        else:
-            new_state = 4  # playful (desperate state)
+        # happy, hungry, sad, sleeping, then playful (desperate state)
+        new_state = len(MOOD_THRESHOLDS)
+        for state, threshold in enumerate(MOOD_THRESHOLDS):
+            if contact_health >= threshold:
+                new_state = state
+                break
         
         self.set_state(new_state)
     
@@ -44,30 +80,86 @@ class PetState:
             return "No More Excuses!"
         return PET_STATES.get(self.current_state, "unknown")
     
-    def update_animation(self):
-        """Update animation frame"""
-        self.animation_frame = (self.animation_frame + 1) % 4  # 4 frames per state
-        self.is_dirty = True
+    def update_animation(self, now):
+        """
+        Show the frame the timeline has due at now
+        
+        Args:
+            now: ticks_ms
+        
+        Returns:
+            Milliseconds until the frame next changes, or None if it never does
+        """
+        animation = self.animation
+        if animation.update(now):
+            self._show()
+        return animation.next_change_ms(now)
     
-    def get_sync_packet(self):
+    def encode_sync(self, health):
         """
-        Generate minimal LoRA sync packet
-        Format: [device_id(1 byte), state_id(1 byte)]
-        Total: 2 bytes for maximum range
+        Pack this pet's state into the preallocated sync buffer
+        
+        Args:
+            health: HealthSystem (contact health and wireless hearts)
+        
+        Returns:
+            bytearray of SYNC_LEN bytes, reused by the next call
         """
-        return bytes([self.device_id & 0xFF, self.current_state & 0xFF])
+        out = self.sync_out
+        out.device_id = self.device_id
+        out.state = self.current_state
+        out.error = self.is_error
+        out.contact = quantize_contact(health.get_contact_health_percent())
+        out.hearts = health.get_wireless_signal_sprites()
+        out.phase = self.animation_frame
+        encode_into(self.sync_buffer, out)
+        return self.sync_buffer
     
-    def parse_sync_packet(self, packet):
-        """Parse incoming sync packet"""
-        if len(packet) >= 2:
-            device_id = packet[0]
-            state_id = packet[1]
-            if state_id in PET_STATES:
-                self.current_state = state_id
-                self.animation_frame = 0
-                self.is_dirty = True
-                return True
-        return False
+    def _partner_lost(self, now):
+        """True if the partner may be replaced (not pinned, not heard lately)"""
+        if self.partner is None:
+            return True
+        if PEER_PARTNER_ID is not None:
+            return False
+        slot = self.peers.find(self.partner)
+        return slot is None or clock.diff(now, self.peers.last_seen[slot]) >= LORA_PEER_TIMEOUT_MS
+    
+    def apply_sync(self, data, rssi=0, seq=0):
+        """
+        Decode a received sync into self.peer and the peer table, and adopt
+        its state and animation phase if it comes from the partner
+        
+        The partner is PEER_PARTNER_ID, or else the first pet heard, until
+        it has been silent for LORA_PEER_TIMEOUT_MS. Other pets in range are
+        only recorded, so a third device cannot take over this pet.
+        
+        Args:
+            data: Received sync body
+            rssi: Packet RSSI in dBm
+            seq: Link sequence number of the frame
+        
+        Returns:
+            True if data was a readable sync from the partner
+        """
+        peer = self.peer
+        if not decode_into(peer, data):
+            return False
+        now = clock.now()
+        if peer.device_id != self.partner and self._partner_lost(now):
+            self.partner = peer.device_id
+        self.peers.record(peer, rssi, seq, now)
+        if peer.device_id != self.partner:
+            return False
+        if peer.state in PET_STATES:
+            if peer.state != self.current_state:
+                self._play(peer.state)
+            if self.animation.seek(peer.phase, now):
+                self._show()
+        return True
+    
+    def nearby(self):
+        """Other pets heard within LORA_PEER_TIMEOUT_MS, not counting the partner"""
+        return self.peers.live(clock.now(), LORA_PEER_TIMEOUT_MS, self.partner)
     
     def reset_dirty_flag(self):
         """Clear the dirty flag after display update"""
@@ -0,0 +1,344 @@
+# Power Management - light sleep between task deadlines, display dimming, idle radio
+
+from lora_comm import RADIO_RX, RADIO_SLEEP, RADIO_SNIFF, RADIO_SNIFF_RX, RADIO_LBT, RADIO_TX
+from config import DEBUG
+from utils import clock
+import machine
+
+try:
+    import esp32
+except ImportError:
+    esp32 = None  # host
+
+# Power meter components and their states
+CPU = 0
+DISPLAY = 1
+RADIO = 2
+CPU_AWAKE, CPU_LIGHT_SLEEP = 0, 1
+DISPLAY_ON, DISPLAY_DIM, DISPLAY_OFF = 0, 1, 2
+RADIO_METER_RX, RADIO_METER_CAD, RADIO_METER_TX, RADIO_METER_SLEEP = 0, 1, 2, 3
+
+COMPONENT_NAMES = ("cpu", "display", "radio")
+STATE_NAMES = (
+    ("awake", "light sleep"),
+    ("on", "dim", "off"),
+    ("rx", "cad", "tx", "sleep"),
+)
+
+# Typical supply current per state (mA), from the datasheets: ESP32-C3 at
+# 160 MHz with the CPU running and Wi-Fi/BT off (modem sleep), and in light
+# sleep; SSD1306 128x64 about half lit at full and dimmed contrast, and in
+# display-off; SX1278 in RX (LNA boost), CAD, TX at +20 dBm and sleep
+STATE_MA = (
+    (23.0, 0.13),
+    (9.0, 3.5, 0.01),
+    (11.5, 11.5, 120.0, 0.0002),
+)
+
+# lora_comm radio state -> meter state
+_RADIO_STATES = {
+    RADIO_RX: RADIO_METER_RX,
+    RADIO_SLEEP: RADIO_METER_SLEEP,
+    RADIO_SNIFF: RADIO_METER_CAD,
+    RADIO_SNIFF_RX: RADIO_METER_RX,
+    RADIO_LBT: RADIO_METER_CAD,
+    RADIO_TX: RADIO_METER_TX,
+}
+
+class PowerMeter:
+    def __init__(self, now):
+        """
+        Time-in-state per component, for an estimated supply current
+        
+        Components report state changes as they happen (set()); time is
+        accounted in ticks_ms, so the meter costs nothing between changes.
+        
+        Args:
+            now: ticks_ms the meter starts at (every component in state 0)
+        """
+        self.state = bytearray(len(COMPONENT_NAMES))
+        self.since = [now] * len(COMPONENT_NAMES)
+        self.time_ms = [[0] * len(names) for names in STATE_NAMES]
+    
+    def set(self, component, state, now):
+        """Record that component entered state at ticks now"""
+        old = self.state[component]
+        if old == state:
+            return
+        self.time_ms[component][old] += clock.diff(now, self.since[component])
+        self.since[component] = now
+        self.state[component] = state
+    
+    def radio(self, radio_state, now):
+        """Record a LoRaCommunication state change"""
+        self.set(RADIO, _RADIO_STATES[radio_state], now)
+    
+    def totals(self, now):
+        """
+        Get time in each state up to now
+        
+        Returns:
+            List per component of milliseconds per state
+        """
+        totals = []
+        for component in range(len(COMPONENT_NAMES)):
+            times = list(self.time_ms[component])
+            times[self.state[component]] += clock.diff(now, self.since[component])
+            totals.append(times)
+        return totals
+    
+    def average_ma(self, now):
+        """
+        Get the estimated average current since the meter started
+        
+        Returns:
+            List of mA per component
+        """
+        currents = []
+        for component, times in enumerate(self.totals(now)):
+            elapsed = sum(times)
+            charge = sum(t * ma for t, ma in zip(times, STATE_MA[component]))
+            currents.append(charge / elapsed if elapsed else 0.0)
+        return currents
+    
+    def report(self, now):
+        """Print time in state and estimated mA per component"""
+        totals = self.totals(now)
+        currents = self.average_ma(now)
+        for component, name in enumerate(COMPONENT_NAMES):
+            times = totals[component]
+            elapsed = sum(times) or 1
+            states = ", ".join(
+                f"{state} {t * 100 // elapsed}%" for state, t in zip(STATE_NAMES[component], times)
+            )
+            print(f"{name}: {currents[component]:.2f} mA ({states})")
+        print(f"total: {sum(currents):.2f} mA")
+
+class PowerManager:
+    def __init__(self, display, lora, tasks, light_sleep=True, min_sleep_ms=10,
+                 max_sleep_ms=60000, dim_ms=30000, off_ms=120000, dim_contrast=16,
+                 idle_sniff_ms=0):
+        """
+        Initialize power management
+        
+        Every task reports when it next needs to run (wait()) before it
+        awaits, so the earliest deadline across animation, health, radio and
+        input timers is known without asking the subsystems. When all tasks
+        are waiting and that deadline is at least min_sleep_ms away, the
+        power task puts the CPU in light sleep until then; pins armed with
+        wake_on() (buttons, DIO0) end the sleep early. With no input for
+        dim_ms the display is dimmed, after off_ms it is turned off and the
+        radio sniffs every idle_sniff_ms (if set) instead of staying in RX.
+        
+        Args:
+            display: Display (contrast/poweroff/poweron)
+            lora: LoRaCommunication (its radio state feeds the meter)
+            tasks: Number of task deadline slots
+            light_sleep: Use machine.lightsleep (False: only the display and radio)
+            min_sleep_ms: Shortest gap worth a light sleep
+            max_sleep_ms: Longest single light sleep
+            dim_ms: Inactivity before dimming (0 = never)
+            off_ms: Inactivity before the display is turned off (0 = never)
+            dim_contrast: Contrast while dimmed
+            idle_sniff_ms: Radio sniff interval while the display is off (0 = stay in RX)
+        """
+        now = clock.now()
+        self.display = display
+        self.lora = lora
+        self.light_sleep = light_sleep
+        self.min_sleep_ms = min_sleep_ms
+        self.max_sleep_ms = max_sleep_ms
+        self.dim_ms = dim_ms
+        self.off_ms = off_ms
+        self.dim_contrast = dim_contrast
+        self.idle_sniff_ms = idle_sniff_ms
+        self.meter = PowerMeter(now)
+        lora.meter = self.meter
+        if lora.initialized:
+            self.meter.radio(lora.state, now)
+        self._due = [None] * tasks  # ticks_ms each task next runs at, None = on an event only
+        self.activity = 0  # bumped by every wait(): a task ran
+        self.last_input = now
+        self.display_state = DISPLAY_ON
+        self._radio_sniff = None  # sniff interval still to be applied
+        self._awake_sniff = lora.sniff_ms  # restored when the display comes back on
+        self._wake_low = []
+        self._wake_high = []
+        self.wake_poll_ms = None  # cap on a sleep when an input cannot wake the CPU
+        self.flag = None  # optional ThreadSafeFlag set on input activity
+        self.blocked = False  # the last sleep() ended at once
+        self.sleeps = 0
+        self.slept_ms = 0
+    
+    def wake_on(self, pin, level):
+        """
+        Make a pin a light-sleep wake source
+        
+        Args:
+            pin: Pin object (kept as is so its IRQ handler stays attached)
+            level: Level that wakes the CPU (0 for active-low inputs)
+        """
+        if level:
+            self._wake_high.append(pin)
+        else:
+            self._wake_low.append(pin)
+        if not self.light_sleep or esp32 is None:
+            return
+        if not hasattr(esp32, "wake_on_ext1"):
+            self.wake_poll_ms = 50  # no EXT wakeup (ESP32-C3): inputs seen on a timer wakeup
+            return
+        # ext0 takes one pin at either level; ext1 a set of pins that all
+        # have to be low, unless the port has ANY_LOW (ESP32-S2/S3/C6)
+        if self._wake_high:
+            esp32.wake_on_ext0(self._wake_high[0], esp32.WAKEUP_ANY_HIGH)
+        if not self._wake_low:
+            return
+        any_low = getattr(esp32, "WAKEUP_ANY_LOW", None)
+        if any_low is not None:
+            esp32.wake_on_ext1(self._wake_low, any_low)
+        else:
+            esp32.wake_on_ext1(self._wake_low[:1], esp32.WAKEUP_ALL_LOW)
+            if len(self._wake_low) > 1:
+                self.wake_poll_ms = 50  # the others are only seen on a timer wakeup
+    
+    def wait(self, task, delay):
+        """
+        Record that a task is about to wait
+        
+        Args:
+            task: Task slot
+            delay: Milliseconds until it runs again, None if only an event wakes it
+        """
+        self._due[task] = None if delay is None else clock.add(clock.now(), delay)
+        self.activity += 1
+        if self.blocked and self.flag:
+            self.flag.set()  # try the sleep again
+    
+    def idle_ms(self, now):
+        """Milliseconds until the earliest task deadline, or None"""
+        idle = None
+        for due in self._due:
+            if due is not None:
+                remaining = max(clock.diff(due, now), 0)
+                if idle is None or remaining < idle:
+                    idle = remaining
+        return idle
+    
+    def user_activity(self):
+        """
+        Input seen: restart the inactivity timer and wake the display
+        
+        Returns:
+            True if the display was dimmed or off (it needs a redraw)
+        """
+        self.last_input = clock.now()
+        if self.flag:
+            self.flag.set()
+        if self.display_state == DISPLAY_ON:
+            return False
+        if self.display_state == DISPLAY_OFF:
+            self.display.poweron()
+            if self.idle_sniff_ms:
+                self._radio_sniff = self._awake_sniff
+                self._sync_radio()
+        self.display.contrast(255)
+        self._set_display(DISPLAY_ON)
+        return True
+    
+    @property
+    def display_off(self):
+        return self.display_state == DISPLAY_OFF
+    
+    def step(self):
+        """
+        Dim or turn off the display once its inactivity timeout passes
+        
+        Returns:
+            Milliseconds until the next timeout, or None
+        """
+        self._sync_radio()
+        idle = clock.elapsed(self.last_input)
+        if self.display_state == DISPLAY_ON and self.dim_ms:
+            if idle < self.dim_ms:
+                return self.dim_ms - idle
+            self.display.contrast(self.dim_contrast)
+            self._set_display(DISPLAY_DIM)
+            if DEBUG:
+                print("Power: display dimmed")
+        if self.display_state != DISPLAY_OFF and self.off_ms:
+            if idle < self.off_ms:
+                return self.off_ms - idle
+            self.display.poweroff()
+            self._set_display(DISPLAY_OFF)
+            if self.idle_sniff_ms:
+                if self._radio_sniff is None:
+                    self._awake_sniff = self.lora.sniff_ms
+                self._radio_sniff = self.idle_sniff_ms
+                self._sync_radio()
+            if DEBUG:
+                print("Power: display off")
+        return None
+    
+    def _set_display(self, state):
+        self.display_state = state
+        self.meter.set(DISPLAY, state, clock.now())
+    
+    def _sync_radio(self):
+        # set_sniff() is ignored mid-operation, so retried on every step
+        lora = self.lora
+        if self._radio_sniff is None:
+            return
+        if not lora.initialized or lora.state == RADIO_RX or lora.state == RADIO_SLEEP:
+            if lora.sniff_ms != self._radio_sniff:
+                lora.set_sniff(self._radio_sniff)
+            self._radio_sniff = None
+    
+    def next_wait(self, delay):
+        """
+        Get how long the power task can wait: until the earliest task
+        deadline or its own next timeout, whichever is sooner (only the
+        timeout without light sleep)
+        
+        Args:
+            delay: The power manager's own next timeout (from step())
+        
+        Returns:
+            Milliseconds, or None if nothing is due
+        """
+        if not self.light_sleep:
+            return delay
+        idle = self.idle_ms(clock.now())
+        if idle is None or delay is not None and delay < idle:
+            return delay
+        return idle
+    
+    def sleep(self, wait):
+        """
+        Light-sleep for wait ms (capped), if that is worth it
+        
+        Call only when every task is waiting; a wake source ends the sleep
+        early, or stops it at once while it is still active (a held button,
+        a pending interrupt). That sets blocked, and the next wait() sets
+        flag so the sleep is tried again once a task has run.
+        
+        Returns:
+            True if the CPU slept (False: wait in the event loop instead)
+        """
+        self.blocked = False
+        if not self.light_sleep or wait is not None and wait < self.min_sleep_ms:
+            return False
+        cap = self.max_sleep_ms if self.wake_poll_ms is None else self.wake_poll_ms
+        if wait is None or wait > cap:
+            wait = cap
+        now = clock.now()
+        self.meter.set(CPU, CPU_LIGHT_SLEEP, now)
+        machine.lightsleep(wait)
+        woke = clock.now()
+        self.meter.set(CPU, CPU_AWAKE, woke)
+        slept = clock.diff(woke, now)
+        if not slept:
+            self.blocked = True
+            return False
+        self.sleeps += 1
+        self.slept_ms += slept
+        return True
@@ -0,0 +1,65 @@
+# Host-side hardware simulator
+#
+# Stand-ins for the MicroPython modules the firmware imports (machine,
+# framebuf, micropython, time, and esp32 as on the ESP32-C3) plus chip
+# models for the SX1278 radio and the SSD1306 panel, so the device code runs
+# unmodified on a desktop Python.
+#
+# Usage:
+#     import sim
+#     sim.install(virtual_time=True)   # before importing device modules
+#     pet = sim.SimulatedPet()
+#     sim.run(pet.app.run_async(), seconds=60, stop=pet.app.stop)
+#
+# or `python -m sim [seconds]` to run one pet with scripted inputs.
+
+import os
+import sys
+
+from sim import clock, esp32, framebuf, machine, micropython, time
+from sim.clock import RealClock, VirtualClock, VirtualEventLoop, run
+from sim.machine import Board, board
+from sim.micropython import run_scheduled
+from sim.ssd1306 import SSD1306
+from sim.sx1278 import SX1278
+
+
+def install(virtual_time=False):
+    """
+    Register the stand-ins in sys.modules and put the repo root on sys.path
+
+    Args:
+        virtual_time: Drive time/ticks and the event loop from a VirtualClock
+                      instead of the host clock
+
+    Returns:
+        The active clock
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+    sys.modules.setdefault("esp32", esp32)
+    sys.modules.setdefault("framebuf", framebuf)
+    sys.modules.setdefault("machine", machine)
+    sys.modules.setdefault("micropython", micropython)
+    sys.modules["time"] = time
+    sys.modules["utime"] = time
+
+    # MicroPython's gc extensions used by the drivers
+    import gc
+    if not hasattr(gc, "mem_free"):
+        gc.mem_free = lambda: 0
+        gc.mem_alloc = lambda: 0
+
+    if virtual_time:
+        return clock.use(VirtualClock())
+    return clock.clock
+
+
+def __getattr__(name):
+    # SimulatedPet imports the firmware, so it is only loaded once asked for
+    if name == "SimulatedPet":
+        from sim.app import SimulatedPet
+        return SimulatedPet
+    raise AttributeError(name)
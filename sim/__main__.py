@@ -0,0 +1,93 @@
+# Run one VirtualPetApp at virtual time with scripted inputs
+# Usage: python -m sim [seconds] [--profile] [--screen]
+#
+# The button is pressed every 7 s, the contact button every 23 s, and a peer
+# sync packet arrives every 5 s. Prints throughput counters for the display
+# and radio and the estimated supply current; --profile adds the top
+# cProfile entries, --screen the final panel image.
+
+import contextlib
+import cProfile
+import io
+import pstats
+import sys
+import time as host_time
+
+import sim
+
+sim.install(virtual_time=True)
+
+
+async def script(pet, seconds):
+    from lora_link import SEQ_MASK, encode
+    from sync_codec import SYNC_LEN, SyncPacket, encode_into
+    from utils.aio import sleep_ms
+
+    peer = SyncPacket()  # device 0, full health
+    peer.contact = 15
+    peer.hearts = 3
+    body = bytearray(SYNC_LEN)
+
+    t = 0
+    while t < seconds * 1000:
+        await sleep_ms(1000)
+        t += 1000
+        if t % 7000 == 0:
+            pet.press_button()
+        if t % 23000 == 0:
+            pet.touch()
+        if t % 5000 == 0:
+            k = t // 5000
+            peer.state = k % 4
+            size = encode_into(body, peer)
+            pet.receive(encode(k & SEQ_MASK, body[:size]))
+
+
+async def session(pet, seconds):
+    from utils.aio import asyncio
+
+    await asyncio.gather(pet.app.run_async(), script(pet, seconds))
+
+
+def main():
+    from power_manager import COMPONENT_NAMES
+    from utils import clock
+
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    seconds = float(args[0]) if args else 60
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        pet = sim.SimulatedPet()
+    profiler = cProfile.Profile() if "--profile" in sys.argv else None
+
+    start = host_time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if profiler:
+            profiler.enable()
+        sim.run(session(pet, seconds), seconds=seconds, stop=pet.app.stop)
+        if profiler:
+            profiler.disable()
+    wall = host_time.perf_counter() - start
+
+    panel = pet.panel
+    print(f"{seconds:.0f} s virtual in {wall:.2f} s wall ({seconds / wall:.0f}x)")
+    print(f"  display: {panel.data_messages} data writes, {panel.bytes_received} I2C bytes "
+          f"({panel.bytes_received / seconds:.0f} B/s)")
+    print(f"  radio:   {len(pet.radio.transmitted)} packets sent, {pet.radio.transactions} SPI transactions")
+    print(f"  pet:     state {pet.app.pet_state.get_state_name()}, "
+          f"contact {pet.app.health.get_contact_health_percent()}%, "
+          f"wireless {pet.app.health.get_wireless_health_percent()}%")
+    power = pet.app.power
+    currents = power.meter.average_ma(clock.now())
+    print(f"  power:   {sum(currents):.1f} mA estimated ("
+          + ", ".join(f"{name} {ma:.1f}" for name, ma in zip(COMPONENT_NAMES, currents))
+          + f"), {power.sleeps} light sleeps, {power.slept_ms} ms")
+    if "--screen" in sys.argv:
+        print(pet.screen())
+    if profiler:
+        stats = pstats.Stats(profiler)
+        stats.sort_stats("cumulative").print_stats(15)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# One simulated pet: a board with radio and panel models running VirtualPetApp
+
+import asyncio
+
+from config import BUTTON_PIN, LORA_SS_PIN, LORA_DIO0_PIN, ONEWIRE_PIN
+from sim.machine import Board
+from sim.ssd1306 import SSD1306
+from sim.sx1278 import SX1278
+
+
+class SimulatedPet:
+    """
+    VirtualPetApp wired to its own simulated board
+
+    Args:
+        device_id: Passed to VirtualPetApp
+        name: Board name (defaults to boardN)
+        render: False skips drawing (network runs with many pets); frames
+                still count as drawn so the app's redraw logic is unchanged
+    """
+
+    def __init__(self, device_id=1, name=None, render=True):
+        from main import VirtualPetApp
+
+        self.board = Board(name)
+        with self.board:
+            self.radio = SX1278(LORA_SS_PIN, LORA_DIO0_PIN).attach()
+            self.panel = SSD1306().attach()
+            self.app = VirtualPetApp(device_id=device_id)
+        if not render:
+            self.app.graphics.draw_frame = self._skip_frame
+
+    @staticmethod
+    def _skip_frame(pet_state, health_system=None):
+        pet_state.reset_dirty_flag()
+
+    def _hold(self, pin_id, hold_ms):
+        # active-low press, released hold_ms later on the running loop
+        pin = self.board.pin(pin_id)
+        pin.drive(0)
+        asyncio.get_event_loop().call_later(hold_ms / 1000, pin.drive, 1)
+
+    def press_button(self, hold_ms=30):
+        """Press and release the main button (call from inside the loop)"""
+        self._hold(BUTTON_PIN, hold_ms)
+
+    def touch(self, hold_ms=30):
+        """Press and release the contact reset button (call from inside the loop)"""
+        self._hold(ONEWIRE_PIN, hold_ms)
+
+    def receive(self, payload, rssi=-60, snr=10):
+        """A LoRa packet for this pet arrives over the air"""
+        self.radio.deliver(payload, rssi, snr)
+
+    def screen(self):
+        """Current panel image as text"""
+        return self.panel.render()
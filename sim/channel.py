@@ -0,0 +1,252 @@
+# Shared LoRa radio channel: airtime, path loss, collisions and capture
+#
+# Radios attached to a Channel transmit into it instead of completing TX in
+# isolation. Each packet occupies the air for its time-on-air, computed from
+# the modem registers the firmware programmed. At the end of the packet every
+# other radio on the same frequency, spreading factor and bandwidth either
+# receives it or loses it to: range (below sensitivity), half duplex (was
+# transmitting itself), not listening (not in RX mode from before the header,
+# so a receiver that wakes up mid-preamble still locks on), or a collision
+# with overlapping packets, unless the capture effect lets the stronger one
+# through. A CAD reports activity when an in-range packet on the same channel
+# is on air while it runs. Random loss and single-bit corruption can be added
+# on top for link-layer tests.
+
+import asyncio
+import math
+import random
+from collections import deque
+
+from sim import clock
+
+CAPTURE_DB = 6  # stronger packet survives if this far above the interference
+NOISE_FIGURE_DB = 6
+SNR_LIMIT_DB = {6: -5.0, 7: -7.5, 8: -10.0, 9: -12.5, 10: -15.0, 11: -17.5, 12: -20.0}
+
+
+def sensitivity_dbm(sf, bandwidth):
+    """Receiver sensitivity from thermal noise, noise figure and the SF's SNR limit"""
+    return -174 + 10 * math.log10(bandwidth) + NOISE_FIGURE_DB + SNR_LIMIT_DB[sf]
+
+
+def path_loss_db(distance_m, frequency, exponent=2.7):
+    """Log-distance path loss: free space to 1 m, then `exponent` per decade"""
+    wavelength = 299792458 / frequency
+    free_space_1m = 20 * math.log10(4 * math.pi / wavelength)
+    return free_space_1m + 10 * exponent * math.log10(max(distance_m, 1.0))
+
+
+class Node:
+    """A radio's place on the channel"""
+
+    def __init__(self, radio, position):
+        self.radio = radio
+        self.position = position
+        self.deliveries = deque()  # (payload, send time) not yet handled
+        self.busy_until = 0.0
+        self.submitted = None  # when the firmware queued the pending packet
+
+
+class Transmission:
+    __slots__ = ('node', 'payload', 'requested', 'start', 'end', 'modem')
+
+    def __init__(self, node, payload, requested, start, end, modem):
+        self.node = node
+        self.requested = requested
+        self.payload = payload
+        self.start = start
+        self.end = end
+        self.modem = modem
+
+
+class Channel:
+    """
+    Radio channel shared by simulated SX1278s
+
+    Must be used from inside a running VirtualEventLoop: packet ends are
+    scheduled on it. Attached radios run with timed_tx, so each stays in TX
+    mode (deaf to others) for the full time on air and the firmware sees
+    TxDone only when the packet has left.
+
+    Args:
+        path_loss_exponent: Log-distance exponent (2 free space, ~2.7 suburban)
+        shadowing_db: Std-dev of per-link log-normal shadowing
+        seed: RNG seed for shadowing, loss and corruption
+        loss: Probability that an otherwise good reception is lost (fading)
+        corruption: Probability that a reception arrives with one bit
+                    flipped (the radio's payload CRC is off)
+    """
+
+    def __init__(self, path_loss_exponent=2.7, shadowing_db=0.0, seed=None, loss=0.0, corruption=0.0):
+        self.path_loss_exponent = path_loss_exponent
+        self.shadowing_db = shadowing_db
+        self.loss = loss
+        self.corruption = corruption
+        self.rng = random.Random(seed)
+        self.nodes = []
+        self._by_radio = {}
+        self._links = {}
+        self.on_air = []
+        self.max_airtime = 0.0
+        self.transmissions = 0
+        self.airtime = 0.0
+        self.delivered = 0
+        self.collisions = 0
+        self.half_duplex = 0
+        self.not_listening = 0
+        self.out_of_range = 0
+        self.lost = 0
+        self.corrupted = 0
+        self.latencies = []
+
+    def add(self, radio, position=(0.0, 0.0)):
+        """Attach a radio at (x, y) metres"""
+        node = Node(radio, position)
+        radio.on_transmit = lambda payload: self._transmit(node, payload)
+        radio.cad_probe = lambda radio: self._activity(node)
+        radio.timed_tx = True
+        self.nodes.append(node)
+        self._by_radio[radio] = node
+        return node
+
+    def rssi(self, src, dst, modem):
+        """Received power (dBm) of src's signal at dst"""
+        key = (id(src), id(dst))
+        loss = self._links.get(key)
+        if loss is None:
+            dx = src.position[0] - dst.position[0]
+            dy = src.position[1] - dst.position[1]
+            loss = path_loss_db(math.hypot(dx, dy), modem['frequency'], self.path_loss_exponent)
+            if self.shadowing_db:
+                loss += self.rng.gauss(0, self.shadowing_db)
+            self._links[key] = self._links[(id(dst), id(src))] = loss
+        return modem['tx_power'] - loss
+
+    def _transmit(self, node, payload):
+        modem = node.radio.modem()
+        duration = node.radio.airtime(len(payload)) / 1000000
+        # a radio sends one packet at a time: a TX started while the last
+        # one is still on air follows it
+        now = clock.clock.now()
+        start = max(now, node.busy_until)
+        node.busy_until = start + duration
+        requested = node.submitted if node.submitted is not None else now
+        node.submitted = None
+        tx = Transmission(node, payload, requested, start, start + duration, modem)
+        self.on_air.append(tx)
+        self.transmissions += 1
+        self.airtime += duration
+        self.max_airtime = max(self.max_airtime, duration)
+        asyncio.get_event_loop().call_at(tx.end, self._end, tx)
+
+    def _same_channel(self, a, b):
+        return (a['frequency'] == b['frequency'] and a['sf'] == b['sf']
+                and a['bandwidth'] == b['bandwidth'])
+
+    def _activity(self, node):
+        """CAD result for node: a same-channel packet above sensitivity overlaps the CAD"""
+        modem = node.radio.modem()
+        now = clock.clock.now()
+        start = now - 2 * (1 << modem['sf']) / modem['bandwidth']
+        floor = sensitivity_dbm(modem['sf'], modem['bandwidth'])
+        for tx in self.on_air:
+            if (tx.node is not node and tx.start < now and tx.end > start
+                    and self._same_channel(modem, tx.modem)
+                    and self.rssi(tx.node, node, tx.modem) >= floor):
+                return True
+        return False
+
+    def _end(self, tx):
+        modem = tx.modem
+        overlapping = [other for other in self.on_air
+                       if other is not tx and other.start < tx.end and other.end > tx.start
+                       and self._same_channel(modem, other.modem)]
+        floor = sensitivity_dbm(modem['sf'], modem['bandwidth'])
+        # the receiver has to be listening by the end of the preamble
+        header = tx.start + (modem['preamble'] + 4.25) * (1 << modem['sf']) / modem['bandwidth']
+        for node in self.nodes:
+            if node is tx.node:
+                continue
+            rssi = self.rssi(tx.node, node, modem)
+            if rssi < floor:
+                self.out_of_range += 1
+                continue
+            if any(other.node is node for other in overlapping):
+                self.half_duplex += 1
+                continue
+            radio = node.radio
+            if (not radio.receiving or radio.rx_since > header
+                    or not self._same_channel(modem, radio.modem())):
+                self.not_listening += 1
+                continue
+            interference = sum(10 ** (self.rssi(other.node, node, other.modem) / 10)
+                               for other in overlapping)
+            if interference and rssi - 10 * math.log10(interference) < CAPTURE_DB:
+                self.collisions += 1
+                continue
+            if self.loss and self.rng.random() < self.loss:
+                self.lost += 1
+                continue
+            payload = tx.payload
+            if self.corruption and self.rng.random() < self.corruption:
+                payload = bytearray(payload)
+                payload[self.rng.randrange(len(payload))] ^= 1 << self.rng.randrange(8)
+                self.corrupted += 1
+            noise = -174 + 10 * math.log10(modem['bandwidth']) + NOISE_FIGURE_DB
+            node.deliveries.append((tx.payload, tx.requested))
+            node.radio.deliver(payload, rssi, rssi - noise)
+            self.delivered += 1
+        self._prune(tx.end)
+
+    def _prune(self, now):
+        # keep packets that could still overlap one that has not ended yet
+        horizon = now - self.max_airtime
+        self.on_air = [tx for tx in self.on_air if tx.end > horizon]
+
+    def submitted(self, radio):
+        """
+        The firmware queued a packet (LoRaCommunication.send)
+
+        Latency of the packet that next goes on air is measured from here,
+        so time spent waiting for the radio or the duty-cycle budget counts.
+        A later submit supersedes an unsent one, as the firmware coalesces.
+        """
+        self._by_radio[radio].submitted = clock.clock.now()
+
+    def handled(self, radio, payload):
+        """
+        The firmware consumed a received packet: record its sync latency
+
+        Matches the oldest undelivered packet that contains payload (the
+        firmware strips the link header and trailer; packets it dropped in
+        between are discarded).
+
+        Returns:
+            Seconds since the sender queued the packet, or None if unmatched
+        """
+        node = self._by_radio[radio]
+        payload = bytes(payload)
+        while node.deliveries:
+            delivered, sent = node.deliveries.popleft()
+            if payload in delivered:
+                latency = clock.clock.now() - sent
+                self.latencies.append(latency)
+                return latency
+        return None
+
+    def stats(self, seconds):
+        """Summary counters over a run of `seconds`"""
+        contended = self.delivered + self.collisions
+        latencies = sorted(self.latencies)
+        return {
+            'transmissions': self.transmissions,
+            'delivered': self.delivered,
+            'delivered_per_s': self.delivered / seconds,
+            'collision_rate': self.collisions / contended if contended else 0.0,
+            'half_duplex': self.half_duplex,
+            'not_listening': self.not_listening,
+            'out_of_range': self.out_of_range,
+            'utilisation': self.airtime / seconds,
+            'latency_mean': sum(latencies) / len(latencies) if latencies else None,
+            'latency_p95': latencies[int(len(latencies) * 0.95)] if latencies else None,
+        }
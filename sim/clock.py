@@ -0,0 +1,128 @@
+# Simulation clocks and an asyncio event loop that runs on virtual time
+
+import asyncio
+import selectors
+import time as _time
+
+from sim import micropython
+
+
+class RealClock:
+    """Host wall clock"""
+    virtual = False
+
+    def now(self):
+        return _time.monotonic()
+
+    def epoch(self):
+        return _time.time()
+
+    def sleep(self, seconds):
+        _time.sleep(seconds)
+
+
+class VirtualClock:
+    """
+    Clock that only moves when something waits on it
+
+    Blocking sleeps and idle event loop time advance it instantly, so the
+    firmware runs as fast as the host can execute it.
+
+    Args:
+        integer_time: time.time() returns whole seconds, as on the ESP32 port
+    """
+    virtual = True
+
+    def __init__(self, start=0.0, epoch=1700000000, integer_time=True):
+        self.t = start
+        self.start_epoch = epoch
+        self.integer_time = integer_time
+
+    def now(self):
+        return self.t
+
+    def epoch(self):
+        return self.start_epoch + self.t
+
+    def advance(self, seconds):
+        if seconds > 0:
+            self.t += seconds
+
+    def sleep(self, seconds):
+        self.advance(seconds)
+
+
+clock = RealClock()
+
+
+def use(new_clock):
+    """Make new_clock drive sim.time (and new VirtualEventLoops)"""
+    global clock
+    clock = new_clock
+    return new_clock
+
+
+class _VirtualSelector(selectors.DefaultSelector):
+    """Never blocks: an idle wait advances the virtual clock to the next timer"""
+
+    def __init__(self, clock):
+        super().__init__()
+        self.clock = clock
+
+    def select(self, timeout=None):
+        # soft IRQs queued by pin handlers run at the next safe point
+        if micropython.run_scheduled():
+            timeout = 0
+        events = super().select(0)
+        if events or timeout == 0:
+            return events
+        if timeout is None:
+            raise RuntimeError("simulation idle: no task is waiting on a timer")
+        self.clock.advance(timeout)
+        return []
+
+
+class VirtualEventLoop(asyncio.SelectorEventLoop):
+    """asyncio loop whose time() is the virtual clock"""
+
+    def __init__(self, virtual_clock=None):
+        virtual_clock = virtual_clock or clock
+        super().__init__(_VirtualSelector(virtual_clock))
+        self.clock = virtual_clock
+
+    def time(self):
+        return self.clock.now()
+
+    def next_event(self):
+        """
+        Time the loop next has something to run: now if callbacks are ready,
+        else the earliest timer (None if there is none)
+        """
+        if self._ready:
+            return self.clock.now()
+        if self._scheduled:
+            return self._scheduled[0].when()
+        return None
+
+
+def run(coro, seconds=None, stop=None):
+    """
+    Run a coroutine on a fresh VirtualEventLoop
+
+    Args:
+        coro: Coroutine to run to completion
+        seconds: Virtual run time after which stop() is called
+        stop: Callable that makes coro finish (e.g. VirtualPetApp.stop)
+
+    Returns:
+        The coroutine's result
+    """
+    loop = VirtualEventLoop()
+    asyncio.set_event_loop(loop)
+    try:
+        if seconds is not None and stop is not None:
+            loop.call_at(loop.time() + seconds, stop)
+        return loop.run_until_complete(coro)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
@@ -0,0 +1,5 @@
+# esp32 module stand-in, as on the ESP32-C3 port
+#
+# The C3 has no RTC-IO EXT0/EXT1 wakeup, so the port has no wake_on_ext0,
+# wake_on_ext1 or WAKEUP_* constants: power_manager falls back to capping
+# each light sleep at its wake_poll_ms, as it does on the device.
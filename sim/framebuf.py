@@ -0,0 +1,101 @@
+# framebuf module stand-in: pure-Python FrameBuffer for the 1-bit formats
+#
+# Same buffer layouts as the C module, so driver buffers and sprite data can
+# be checked byte for byte. text() draws a 6x7 box per glyph instead of the
+# ROM font.
+
+MONO_VLSB = 0
+MONO_HLSB = 3
+MONO_HMSB = 4
+
+
+class FrameBuffer:
+    """Pure-Python subset of framebuf.FrameBuffer (1-bit formats only)"""
+
+    def __init__(self, buffer, width, height, format, stride=None):
+        self.buf = buffer
+        self.width = width
+        self.height = height
+        self.format = format
+        self.stride = width if stride is None else stride
+
+    def _index(self, x, y):
+        if self.format == MONO_VLSB:
+            return (y >> 3) * self.stride + x, y & 7
+        if self.format == MONO_HMSB:
+            return (y * ((self.stride + 7) >> 3)) + (x >> 3), x & 7
+        return (y * ((self.stride + 7) >> 3)) + (x >> 3), 7 - (x & 7)
+
+    def _get(self, x, y):
+        idx, bit = self._index(x, y)
+        return (self.buf[idx] >> bit) & 1
+
+    def _set(self, x, y, c):
+        idx, bit = self._index(x, y)
+        if c:
+            self.buf[idx] |= 1 << bit
+        else:
+            self.buf[idx] &= ~(1 << bit) & 0xFF
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        if c is None:
+            return self._get(x, y)
+        self._set(x, y, c)
+
+    def fill(self, c):
+        val = 0xFF if c else 0x00
+        for i in range(len(self.buf)):
+            self.buf[i] = val
+
+    def fill_rect(self, x, y, w, h, c):
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + w, self.width)
+        y1 = min(y + h, self.height)
+        for py in range(y0, y1):
+            for px in range(x0, x1):
+                self._set(px, py, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.hline(x, y, w, c)
+        self.hline(x, y + h - 1, w, c)
+        self.vline(x, y, h, c)
+        self.vline(x + w - 1, y, h, c)
+
+    def text(self, s, x, y, c=1):
+        # The ROM font is not available on the host; draw a 6x7 cell per glyph
+        for i, ch in enumerate(s):
+            if ch != " ":
+                self.rect(x + i * 8, y, 6, 7, c)
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        if isinstance(fbuf, tuple):
+            fbuf = FrameBuffer(*fbuf)
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + fbuf.width, self.width)
+        y1 = min(y + fbuf.height, self.height)
+        skip_blank = key == 0 and fbuf.format != MONO_VLSB
+        for py in range(y0, y1):
+            px = x0
+            while px < x1:
+                sx = px - x
+                if skip_blank and sx & 7 == 0 and fbuf.buf[fbuf._index(sx, py - y)[0]] == 0:
+                    # Whole source byte is transparent
+                    px += 8
+                    continue
+                c = fbuf._get(sx, py - y)
+                if c != key:
+                    self._set(px, py, c)
+                px += 1
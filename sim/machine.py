@@ -0,0 +1,241 @@
+# machine module stand-in: Pin, SPI and I2C routed through a simulated board
+#
+# Every peripheral object captures the board that is current when it is
+# constructed, so several VirtualPetApp instances can run side by side: build
+# each one inside `with Board():` and its pins and buses stay wired to that
+# board's devices.
+
+_boards = []
+_current = None
+_irq_board = None  # board whose pin handler is running (for schedule())
+sleeps = 0  # lightsleep() calls, all boards
+sleep_time = 0.0  # seconds spent in them
+
+
+class Board:
+    """
+    One simulated device: its pins plus the chips on its SPI and I2C buses
+
+    Attributes:
+        pins: Latest Pin created for each pin id
+        pin_listeners: Callables notified when the firmware drives a pin
+        spi_device: Chip model behind every SPI object (write/readinto/...)
+        i2c_device: Chip model behind every I2C object (message(bytes))
+        scheduled: Pending micropython.schedule callbacks
+    """
+
+    def __init__(self, name=None):
+        self.name = name if name is not None else "board%d" % len(_boards)
+        self.pins = {}
+        self.pin_listeners = {}
+        self.spi_device = None
+        self.i2c_device = None
+        self.scheduled = []
+        _boards.append(self)
+
+    def activate(self):
+        global _current
+        _current = self
+        return self
+
+    def __enter__(self):
+        self._previous = _current
+        return self.activate()
+
+    def __exit__(self, *exc):
+        global _current
+        _current = self._previous
+        return False
+
+    def pin(self, id):
+        """Get the firmware's Pin object for an id (None if never created)"""
+        return self.pins.get(id)
+
+
+def board():
+    """Get the current board, creating a default one on first use"""
+    if _current is None:
+        Board().activate()
+    return _current
+
+
+def boards():
+    return list(_boards)
+
+
+def lightsleep(time_ms=None):
+    """
+    Light sleep until time_ms has passed or a wake source fires
+
+    On the virtual clock, anything the event loop has due (a button edge, a
+    radio packet, a timer) counts as a wake source, so the sleep ends at the
+    loop's next event; a pending callback aborts it like a pending interrupt.
+    """
+    import asyncio
+
+    global sleeps, sleep_time
+
+    from sim import clock
+
+    now = clock.clock.now()
+    end = now + time_ms / 1000 if time_ms is not None else None
+    if clock.clock.virtual:
+        event = asyncio.get_event_loop().next_event()
+        if event is not None and (end is None or event < end):
+            end = event
+    if end is None:
+        raise RuntimeError("lightsleep() with no timeout and no wake source")
+    sleeps += 1
+    if end > now:
+        sleep_time += end - now
+        clock.clock.sleep(end - now)
+
+
+def reset():
+    """Forget every board (start of a fresh simulation)"""
+    global _current
+    del _boards[:]
+    _current = None
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_RISING = 1
+    IRQ_FALLING = 2
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.board = board()
+        self.id = id
+        self.mode = mode
+        # an undriven line idles high only with a pull-up
+        if value is None:
+            value = 1 if pull == self.PULL_UP else 0
+        self._value = value
+        self.handler = None
+        self.trigger = 0
+        self.board.pins[id] = self
+
+    def init(self, mode=-1, pull=-1, value=None):
+        if mode != -1:
+            self.mode = mode
+        if value is not None:
+            self._value = value
+
+    def value(self, v=None):
+        if v is None:
+            return self._value
+        self._value = v
+        listener = self.board.pin_listeners.get(self.id)
+        if listener:
+            listener(v)
+
+    def __call__(self, v=None):
+        return self.value(v)
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    def irq(self, handler=None, trigger=IRQ_RISING | IRQ_FALLING):
+        self.handler = handler
+        self.trigger = trigger if handler else 0
+
+    def detach_irq(self):
+        self.handler = None
+        self.trigger = 0
+
+    def drive(self, level):
+        """
+        Drive the pin from outside (button, radio DIO line, ...)
+
+        Runs the IRQ handler, like the hardware would, if the resulting edge
+        matches the trigger the firmware registered.
+        """
+        level = 1 if level else 0
+        previous = self._value
+        self._value = level
+        if level == previous:
+            return
+        edge = self.IRQ_RISING if level else self.IRQ_FALLING
+        if self.trigger & edge:
+            self.fire()
+
+    def pulse(self):
+        """Rising edge followed by a return to low (e.g. DIO0 on RxDone)"""
+        self.drive(1)
+        self.drive(0)
+
+    def fire(self):
+        """Run the IRQ handler regardless of the line level"""
+        global _irq_board
+        if self.handler:
+            _irq_board = self.board
+            try:
+                self.handler(self)
+            finally:
+                _irq_board = None
+
+
+class SPI:
+    def __init__(self, id=1, baudrate=1000000, polarity=0, phase=0, bits=8,
+                 sck=None, mosi=None, miso=None):
+        self.board = board()
+        self.baudrate = baudrate
+
+    def init(self, baudrate=1000000, polarity=0, phase=0):
+        self.baudrate = baudrate
+
+    def deinit(self):
+        pass
+
+    def write(self, buf):
+        device = self.board.spi_device
+        if device:
+            device.write(buf)
+
+    def readinto(self, buf, write=0x00):
+        device = self.board.spi_device
+        if device:
+            device.readinto(buf, write)
+            return
+        for i in range(len(buf)):
+            buf[i] = 0
+
+    def write_readinto(self, write_buf, read_buf):
+        device = self.board.spi_device
+        if device:
+            device.write_readinto(write_buf, read_buf)
+            return
+        for i in range(len(read_buf)):
+            read_buf[i] = 0
+
+
+class I2C:
+    def __init__(self, id, scl=None, sda=None, freq=400000):
+        self.board = board()
+        self.freq = freq
+        self.bytes_written = 0
+
+    def scan(self):
+        device = self.board.i2c_device
+        return [device.addr] if device else []
+
+    def writeto(self, addr, buf):
+        self.bytes_written += len(buf)
+        device = self.board.i2c_device
+        if device:
+            device.message(bytes(buf))
+
+    def writevto(self, addr, vector):
+        message = b"".join(bytes(buf) for buf in vector)
+        self.bytes_written += len(message)
+        device = self.board.i2c_device
+        if device:
+            device.message(message)
+
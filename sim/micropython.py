@@ -0,0 +1,43 @@
+# micropython module stand-in: const() and the soft-IRQ scheduler
+
+from sim import machine
+
+# MICROPY_SCHEDULER_DEPTH defaults to 4
+SCHEDULE_DEPTH = 4
+
+
+def const(value):
+    return value
+
+
+def schedule(func, arg):
+    """Queue func(arg) on the board whose IRQ handler is running"""
+    board = machine._irq_board or machine.board()
+    if len(board.scheduled) >= SCHEDULE_DEPTH:
+        raise RuntimeError("schedule queue full")
+    board.scheduled.append((func, arg))
+
+
+def run_scheduled():
+    """
+    Run pending schedule() callbacks, as the VM does between bytecodes
+
+    Returns:
+        Number of callbacks run
+    """
+    count = 0
+    for board in machine.boards():
+        while board.scheduled:
+            func, arg = board.scheduled.pop(0)
+            with board:
+                func(arg)
+            count += 1
+    return count
+
+
+def alloc_emergency_exception_buf(size):
+    pass
+
+
+def mem_info(verbose=False):
+    pass
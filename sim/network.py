@@ -0,0 +1,145 @@
+# Multi-node LoRa network simulation
+# Usage: python -m sim.network [nodes ...] [--mac plain|lbt|sniff ...] [--sniff-ms MS]
+#                               [--seconds S] [--interval S] [--area M] [--seed N]
+#
+# Runs N VirtualPetApp instances at virtual time on one shared Channel. Pets
+# are placed uniformly in an area x area square; each sends a state sync
+# (VirtualPetApp._send_state) at exponentially distributed intervals with the
+# given mean, so the offered load grows linearly with N. Drawing is skipped.
+# Reports delivered packets per second (per receiving pet), the collision rate
+# among in-range listening receivers, channel airtime per second and the
+# end-to-end sync latency from the sender's send() (which only queues the
+# packet for the duty-cycled TX task) until the receiving app has handled it.
+#
+# Each node count runs once per --mac: plain (send when the duty cycle
+# allows), lbt (CAD listen-before-talk with random backoff) and sniff (lbt
+# plus sniff-mode RX: sleep --sniff-ms between wake-up CADs, long preamble).
+# "radio on" is the mean share of time a pet's radio spent in RX, CAD or TX.
+
+import argparse
+import os
+import random
+import time as host_time
+from contextlib import redirect_stdout
+
+import sim
+
+sim.install(virtual_time=True)
+
+from sim import clock, machine
+from sim.app import SimulatedPet
+from sim.channel import Channel
+from config import (
+    LORA_SPREADING_FACTOR, LORA_BANDWIDTH, LORA_CODING_RATE, LORA_PREAMBLE_LENGTH,
+)
+from lora_link import FRAME_OVERHEAD
+from lora_scheduler import time_on_air_us
+from sync_codec import SYNC_LEN
+from utils.aio import asyncio, sleep_ms
+
+DEFAULT_NODES = (2, 10, 50, 100, 200)
+
+
+MACS = ("plain", "lbt", "sniff")
+
+
+def build(n, area, seed, mac="lbt", sniff_ms=500):
+    machine.reset()
+    clock.use(clock.VirtualClock())
+    rng = random.Random(seed)
+    channel = Channel(seed=seed)
+    pets = []
+    for i in range(n):
+        pet = SimulatedPet(device_id=i, render=False)
+        # every pet's light sleep would end at every other pet's events on
+        # the shared loop: host time spent without changing what goes on air
+        pet.app.power.light_sleep = False
+        pet.app.lora.lbt = mac != "plain"
+        if mac == "sniff":
+            pet.app.lora.set_sniff(sniff_ms)
+        channel.add(pet.radio, (rng.uniform(0, area), rng.uniform(0, area)))
+        handle = pet.app._handle_packet
+
+        def tracked(data, handle=handle, radio=pet.radio):
+            channel.handled(radio, data)
+            handle(data)
+
+        pet.app._handle_packet = tracked
+        send = pet.app.lora.send
+
+        def submitted(data, send=send, radio=pet.radio):
+            channel.submitted(radio)
+            return send(data)
+
+        pet.app.lora.send = submitted
+        pets.append(pet)
+    return channel, pets, rng
+
+
+async def traffic(pet, interval, rng):
+    while pet.app.running:
+        await sleep_ms(int(rng.expovariate(1 / interval) * 1000))
+        if pet.app.running:
+            with pet.board:
+                pet.app._send_state()
+
+
+def run(n, seconds, interval, area, seed, mac="lbt", sniff_ms=500):
+    """Simulate n pets for `seconds` of virtual time; returns channel stats"""
+    with open(os.devnull, "w") as quiet, redirect_stdout(quiet):
+        channel, pets, rng = build(n, area, seed, mac, sniff_ms)
+        started = clock.clock.now()
+        on_before = sum(pet.radio.on_time() for pet in pets)
+
+        async def session():
+            await asyncio.gather(*(pet.app.run_async() for pet in pets),
+                                 *(traffic(pet, interval, rng) for pet in pets))
+
+        def stop():
+            for pet in pets:
+                pet.app.stop()
+
+        sim.run(session(), seconds=seconds, stop=stop)
+    stats = channel.stats(seconds)
+    stats['per_receiver'] = stats['delivered_per_s'] / max(n - 1, 1)
+    elapsed = clock.clock.now() - started  # includes the wind-down after stop()
+    stats['radio_on'] = (sum(pet.radio.on_time() for pet in pets) - on_before) / (n * elapsed)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-node LoRa network simulation")
+    parser.add_argument("nodes", type=int, nargs="*", default=DEFAULT_NODES)
+    parser.add_argument("--seconds", type=float, default=120, help="virtual run time")
+    parser.add_argument("--interval", type=float, default=30, help="mean seconds between syncs per pet")
+    parser.add_argument("--area", type=float, default=1000, help="side of the square, metres")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--mac", choices=MACS, nargs="+", default=MACS)
+    parser.add_argument("--sniff-ms", type=int, default=500, help="sleep between wake-up CADs")
+    args = parser.parse_args()
+    seconds, interval, area = args.seconds, args.interval, args.area
+
+    frame = SYNC_LEN + FRAME_OVERHEAD + 1  # plus the ADR control byte
+    airtime = time_on_air_us(frame, LORA_SPREADING_FACTOR, LORA_BANDWIDTH, LORA_CODING_RATE,
+                             LORA_PREAMBLE_LENGTH) / 1000000
+    print(f"SF{LORA_SPREADING_FACTOR} BW {LORA_BANDWIDTH / 1000:g} kHz CR 4/{LORA_CODING_RATE}: "
+          f"{airtime * 1000:.0f} ms per {frame}-byte sync frame; one sync per pet every {interval:g} s, "
+          f"{area:g} m square, {seconds:g} s virtual")
+    print(f"{'pets':>5} {'mac':6} {'offered':>8} {'sent':>6} {'air/s':>6} {'deliv/s':>8} {'per rx':>7} "
+          f"{'collide':>8} {'radio on':>8} {'lat mean':>9} {'lat p95':>8} {'wall':>6}")
+    for n in args.nodes:
+        for mac in args.mac:
+            start = host_time.perf_counter()
+            s = run(n, seconds, interval, area, args.seed, mac, args.sniff_ms)
+            wall = host_time.perf_counter() - start
+            offered = n * airtime / interval
+            mean = f"{s['latency_mean'] * 1000:7.0f}ms" if s['latency_mean'] is not None else "      -  "
+            p95 = f"{s['latency_p95'] * 1000:6.0f}ms" if s['latency_p95'] is not None else "     - "
+            print(f"{n:5d} {mac:6} {offered:8.2f} {s['transmissions']:6d} {s['utilisation']:6.2f} "
+                  f"{s['delivered_per_s']:8.2f} {s['per_receiver']:7.3f} "
+                  f"{s['collision_rate'] * 100:7.1f}% {s['radio_on'] * 100:7.1f}% "
+                  f"{mean:>9} {p95:>8} {wall:5.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# SSD1306 OLED controller model behind the simulated I2C bus
+
+from sim import machine
+
+
+class SSD1306:
+    """
+    SSD1306 controller on the simulated I2C bus
+
+    Decodes command and data messages into GDDRAM (8 pages x 128 columns,
+    same MONO_VLSB layout as the driver buffer), honouring the column/page
+    address window in horizontal addressing mode. Tracks display on/off,
+    inversion and contrast, and counts bytes received and frames (data
+    messages).
+    """
+
+    # commands followed by this many argument bytes
+    ARGS = {0x20: 1, 0x21: 2, 0x22: 2, 0x81: 1, 0x8D: 1, 0xA8: 1, 0xD3: 1,
+            0xD5: 1, 0xD9: 1, 0xDA: 1, 0xDB: 1}
+
+    def __init__(self, width=128, height=64, addr=0x3C):
+        self.addr = addr
+        self.width = width
+        self.height = height
+        self.pages = height // 8
+        self.gddram = bytearray(self.pages * width)
+        self.bytes_received = 0
+        self.data_bytes = 0
+        self.data_messages = 0
+        self.on = False
+        self.inverted = False
+        self.contrast = 0xFF
+        self._cmd = []
+        self._col_window = (0, width - 1)
+        self._page_window = (0, self.pages - 1)
+        self._col = 0
+        self._page = 0
+
+    def attach(self, board=None):
+        """Make this controller the device on the board's I2C bus (current board by default)"""
+        (board or machine.board()).i2c_device = self
+        return self
+
+    def message(self, data):
+        self.bytes_received += len(data)
+        if not data:
+            return
+        control = data[0]
+        if control & 0x40:
+            self.data_messages += 1
+            for b in data[1:]:
+                self._data(b)
+        else:
+            for b in data[1:]:
+                self._command(b)
+
+    def _command(self, b):
+        self._cmd.append(b)
+        op = self._cmd[0]
+        if len(self._cmd) <= self.ARGS.get(op, 0):
+            return
+        args = self._cmd[1:]
+        self._cmd = []
+        if op == 0x21:
+            self._col_window = (args[0], args[1])
+            self._col = args[0]
+        elif op == 0x22:
+            self._page_window = (args[0], args[1])
+            self._page = args[0]
+        elif op == 0x81:
+            self.contrast = args[0]
+        elif op & 0xFE == 0xAE:
+            self.on = bool(op & 1)
+        elif op & 0xFE == 0xA6:
+            self.inverted = bool(op & 1)
+
+    def _data(self, b):
+        self.data_bytes += 1
+        if 0 <= self._col < self.width and 0 <= self._page < self.pages:
+            self.gddram[self._page * self.width + self._col] = b
+        self._col += 1
+        if self._col > self._col_window[1]:
+            self._col = self._col_window[0]
+            self._page += 1
+            if self._page > self._page_window[1]:
+                self._page = self._page_window[0]
+
+    def pixel(self, x, y):
+        """Lit state of a panel pixel (before inversion)"""
+        return (self.gddram[(y >> 3) * self.width + x] >> (y & 7)) & 1
+
+    def render(self, on="#", off="."):
+        """The panel image as text, one line per row"""
+        rows = []
+        for y in range(self.pages * 8):
+            rows.append("".join(on if self.pixel(x, y) ^ self.inverted else off
+                                for x in range(self.width)))
+        return "\n".join(rows)
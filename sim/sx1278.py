@@ -0,0 +1,313 @@
+# SX1278 LoRa transceiver model behind the simulated SPI bus
+
+import asyncio
+
+from sim import clock, machine
+
+REG_FIFO = 0x00
+REG_OP_MODE = 0x01
+REG_FRF_MSB = 0x06
+REG_PA_CONFIG = 0x09
+REG_FIFO_ADDR_PTR = 0x0d
+REG_FIFO_TX_BASE_ADDR = 0x0e
+REG_FIFO_RX_BASE_ADDR = 0x0f
+REG_FIFO_RX_CURRENT_ADDR = 0x10
+REG_IRQ_FLAGS = 0x12
+REG_RX_NB_BYTES = 0x13
+REG_PKT_SNR_VALUE = 0x1b
+REG_PKT_RSSI_VALUE = 0x1a
+REG_MODEM_CONFIG_1 = 0x1d
+REG_MODEM_CONFIG_2 = 0x1e
+REG_PREAMBLE_MSB = 0x20
+REG_PREAMBLE_LSB = 0x21
+REG_PAYLOAD_LENGTH = 0x22
+REG_MODEM_CONFIG_3 = 0x26
+REG_DIO_MAPPING_1 = 0x40
+REG_VERSION = 0x42
+
+MODE_MASK = 0x07
+MODE_SLEEP = 0x00
+MODE_STDBY = 0x01
+MODE_TX = 0x03
+MODE_RX_CONTINUOUS = 0x05
+MODE_RX_SINGLE = 0x06
+MODE_CAD = 0x07
+
+CAD_SYMBOLS = 2
+
+IRQ_CAD_DETECTED = 0x01
+IRQ_CAD_DONE = 0x04
+IRQ_TX_DONE = 0x08
+IRQ_RX_DONE = 0x40
+
+DIO0_SOURCES = (IRQ_RX_DONE, IRQ_TX_DONE, IRQ_CAD_DONE, 0)  # RegDioMapping1 bits 7-6
+
+BANDWIDTHS = (7800, 10400, 15600, 20800, 31250, 41700, 62500, 125000, 250000, 500000)
+
+
+class SX1278:
+    """
+    SX1278 register file and 256-byte FIFO
+
+    Chip select framing, burst auto-increment, FIFO pointer handling and
+    write-1-to-clear RegIrqFlags follow the datasheet. Entering TX captures
+    the payload (FifoTxBaseAddr, RegPayloadLength) into `transmitted` and
+    calls on_transmit(payload). TxDone is raised at once unless timed_tx is
+    set; then the radio stays in TX for the packet's time on air and TxDone
+    follows on the running event loop (or on the first RegIrqFlags read
+    past the deadline). deliver() plays a received packet in. DIO0 pulses
+    when the raised flag is the one RegDioMapping1 routes to it (00 RxDone,
+    01 TxDone, 10 CadDone).
+
+    CAD runs for two symbols the same way (at once unless timed_tx); at the
+    end cad_probe(radio), if set, decides CadDetected. Time spent in each
+    mode is accumulated for radio-on accounting (mode_time()), and rx_since
+    records when the radio last entered RX.
+
+    Counts chip-select bracketed transactions and SPI calls. With a
+    VirtualClock, spi_cost_us charges each transaction to the clock, so a
+    firmware busy-wait on a register advances time as it would on the MCU.
+    """
+
+    def __init__(self, ss_pin, dio0_pin=None):
+        self.regs = bytearray(128)
+        self.regs[REG_VERSION] = 0x12
+        self.regs[REG_OP_MODE] = MODE_STDBY
+        self.regs[REG_FIFO_RX_BASE_ADDR] = 0x00
+        self.regs[REG_FIFO_TX_BASE_ADDR] = 0x80
+        self.fifo = bytearray(256)
+        self.ss_pin = ss_pin
+        self.dio0_pin = dio0_pin
+        self.board = None
+        self.transactions = 0
+        self.calls = 0
+        self.transmitted = []
+        self.on_transmit = None
+        self.timed_tx = False
+        self.spi_cost_us = 0
+        self.tx_end = None
+        self.cad_end = None
+        self.cad_probe = None
+        self.cads = 0
+        self.rx_since = None
+        self._mode_time = {}
+        self._mode_since = clock.clock.now()
+        self._selected = False
+        self._address = None
+        self._write = False
+
+    def attach(self, board=None):
+        """Make this chip the device on the board's SPI bus (current board by default)"""
+        self.board = board or machine.board()
+        self.board.spi_device = self
+        self.board.pin_listeners[self.ss_pin] = lambda v: self.select(v == 0)
+        return self
+
+    @property
+    def mode(self):
+        return self.regs[REG_OP_MODE] & MODE_MASK
+
+    @property
+    def receiving(self):
+        return self.mode in (MODE_RX_CONTINUOUS, MODE_RX_SINGLE)
+
+    def _set_mode(self, value):
+        """Write RegOpMode, accounting the time spent in the mode it leaves"""
+        old = self.mode
+        now = clock.clock.now()
+        self._mode_time[old] = self._mode_time.get(old, 0.0) + now - self._mode_since
+        self._mode_since = now
+        self.regs[REG_OP_MODE] = value
+        if self.receiving and old not in (MODE_RX_CONTINUOUS, MODE_RX_SINGLE):
+            self.rx_since = now
+        elif not self.receiving:
+            self.rx_since = None
+
+    def _set_standby(self):
+        self._set_mode((self.regs[REG_OP_MODE] & ~MODE_MASK) | MODE_STDBY)
+
+    def mode_time(self):
+        """Seconds spent in each mode so far, {MODE_*: seconds}"""
+        totals = dict(self._mode_time)
+        totals[self.mode] = totals.get(self.mode, 0.0) + clock.clock.now() - self._mode_since
+        return totals
+
+    def on_time(self):
+        """Seconds with the receiver or transmitter running (RX, CAD, TX)"""
+        totals = self.mode_time()
+        return sum(totals.get(m, 0.0) for m in (MODE_TX, MODE_RX_CONTINUOUS, MODE_RX_SINGLE, MODE_CAD))
+
+    def modem(self):
+        """
+        Decode the modem configuration the firmware programmed
+
+        Returns:
+            dict with frequency (Hz), sf, bandwidth (Hz), coding_rate (4/x
+            denominator), preamble (symbols), explicit_header, crc,
+            low_data_rate and tx_power (dBm)
+        """
+        regs = self.regs
+        config1 = regs[REG_MODEM_CONFIG_1]
+        config2 = regs[REG_MODEM_CONFIG_2]
+        pa = regs[REG_PA_CONFIG]
+        if pa & 0x80:
+            tx_power = 2 + (pa & 0x0F)  # PA_BOOST
+        else:
+            tx_power = 10.8 + 0.6 * ((pa >> 4) & 0x07) - (15 - (pa & 0x0F))
+        frf = (regs[REG_FRF_MSB] << 16) | (regs[REG_FRF_MSB + 1] << 8) | regs[REG_FRF_MSB + 2]
+        return {
+            'frequency': frf * 32000000 >> 19,
+            'sf': config2 >> 4,
+            'bandwidth': BANDWIDTHS[min(config1 >> 4, len(BANDWIDTHS) - 1)],
+            'coding_rate': ((config1 >> 1) & 0x07) + 4,
+            'preamble': (regs[REG_PREAMBLE_MSB] << 8) | regs[REG_PREAMBLE_LSB],
+            'explicit_header': not config1 & 0x01,
+            'crc': bool(config2 & 0x04),
+            'low_data_rate': bool(regs[REG_MODEM_CONFIG_3] & 0x08),
+            'tx_power': tx_power,
+        }
+
+    def select(self, active):
+        if active and not self._selected:
+            self.transactions += 1
+            self._address = None
+            if self.spi_cost_us and clock.clock.virtual:
+                clock.clock.advance(self.spi_cost_us / 1000000)
+        self._selected = active
+
+    def _clock(self, out_byte):
+        if self._address is None:
+            self._address = out_byte & 0x7F
+            self._write = bool(out_byte & 0x80)
+            return 0
+        addr = self._address
+        if addr == REG_FIFO:
+            ptr = self.regs[REG_FIFO_ADDR_PTR]
+            self.regs[REG_FIFO_ADDR_PTR] = (ptr + 1) & 0xFF
+            if self._write:
+                self.fifo[ptr] = out_byte
+                return 0
+            return self.fifo[ptr]
+        self._address = (addr + 1) & 0x7F  # burst auto-increment
+        if not self._write:
+            if addr == REG_IRQ_FLAGS:
+                now = clock.clock.now()
+                if self.tx_end is not None and now >= self.tx_end:
+                    self.complete_tx()
+                if self.cad_end is not None and now >= self.cad_end:
+                    self.complete_cad()
+            return self.regs[addr]
+        if addr == REG_IRQ_FLAGS:
+            self.regs[addr] &= ~out_byte & 0xFF
+        elif addr == REG_OP_MODE:
+            entering = out_byte & MODE_MASK if out_byte & MODE_MASK != self.mode else None
+            if self.mode == MODE_TX and entering is not None:
+                self.tx_end = None  # TX abandoned
+            if self.mode == MODE_CAD and entering is not None:
+                self.cad_end = None
+            self._set_mode(out_byte)
+            if entering == MODE_TX:
+                self._start_tx()
+            elif entering == MODE_CAD:
+                self._start_cad()
+        else:
+            self.regs[addr] = out_byte
+        return 0
+
+    def _start_tx(self):
+        base = self.regs[REG_FIFO_TX_BASE_ADDR]
+        length = self.regs[REG_PAYLOAD_LENGTH]
+        payload = bytes(self.fifo[(base + i) & 0xFF] for i in range(length))
+        self.transmitted.append(payload)
+        if self.on_transmit:
+            self.on_transmit(payload)
+        if not self.timed_tx:
+            self.complete_tx()
+            return
+        self.tx_end = clock.clock.now() + self.airtime(length) / 1000000
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        loop.call_at(self.tx_end, self._tx_deadline, self.tx_end)
+
+    def _tx_deadline(self, end):
+        if self.tx_end == end:
+            self.complete_tx()
+
+    def _start_cad(self):
+        self.cads += 1
+        if not self.timed_tx:
+            self.complete_cad()
+            return
+        modem = self.modem()
+        self.cad_end = clock.clock.now() + CAD_SYMBOLS * (1 << modem['sf']) / modem['bandwidth']
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        loop.call_at(self.cad_end, self._cad_deadline, self.cad_end)
+
+    def _cad_deadline(self, end):
+        if self.cad_end == end:
+            self.complete_cad()
+
+    def complete_cad(self):
+        """End of a CAD: CadDone (plus CadDetected if cad_probe saw a preamble), back to standby"""
+        self.cad_end = None
+        detected = bool(self.cad_probe and self.cad_probe(self))
+        self._set_standby()
+        self.regs[REG_IRQ_FLAGS] |= IRQ_CAD_DETECTED if detected else 0
+        self._raise_irq(IRQ_CAD_DONE)
+
+    def airtime(self, payload_len):
+        """Time on air (us) of a payload with the programmed modem settings"""
+        # firmware module: import after sim.install() so it binds sim.time
+        from lora_scheduler import time_on_air_us
+
+        modem = self.modem()
+        return time_on_air_us(payload_len, modem['sf'], modem['bandwidth'],
+                              modem['coding_rate'], modem['preamble'],
+                              not modem['explicit_header'], modem['crc'],
+                              modem['low_data_rate'])
+
+    def complete_tx(self):
+        """End of the packet on air: TxDone, back to standby"""
+        self.tx_end = None
+        self._set_standby()
+        self._raise_irq(IRQ_TX_DONE)
+
+    def _raise_irq(self, mask):
+        self.regs[REG_IRQ_FLAGS] |= mask
+        if self.dio0_pin is not None and DIO0_SOURCES[self.regs[REG_DIO_MAPPING_1] >> 6] & mask:
+            pin = self.board.pin(self.dio0_pin) if self.board else None
+            if pin:
+                pin.pulse()
+
+    def deliver(self, payload, rssi=-60, snr=10):
+        """A packet arrives over the air (lands at FifoRxBaseAddr)"""
+        addr = self.regs[REG_FIFO_RX_BASE_ADDR]
+        for i, b in enumerate(payload):
+            self.fifo[(addr + i) & 0xFF] = b
+        self.regs[REG_FIFO_RX_CURRENT_ADDR] = addr
+        self.regs[REG_RX_NB_BYTES] = len(payload)
+        self.regs[REG_PKT_RSSI_VALUE] = max(0, min(255, int(rssi) + 157))
+        self.regs[REG_PKT_SNR_VALUE] = max(-128, min(127, int(round(snr * 4)))) & 0xFF
+        if self.mode == MODE_RX_SINGLE:
+            self._set_standby()
+        self._raise_irq(IRQ_RX_DONE)
+
+    def write(self, buf):
+        self.calls += 1
+        for b in buf:
+            self._clock(b)
+
+    def readinto(self, buf, write=0x00):
+        self.calls += 1
+        for i in range(len(buf)):
+            buf[i] = self._clock(write)
+
+    def write_readinto(self, write_buf, read_buf):
+        self.calls += 1
+        for i in range(len(write_buf)):
+            read_buf[i] = self._clock(write_buf[i])
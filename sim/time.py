@@ -0,0 +1,60 @@
+# time/utime module stand-in: MicroPython's time API on the simulation clock
+#
+# Anything not defined here (monotonic, perf_counter, strftime, ...) falls
+# through to the host time module, so stdlib code imported after install()
+# keeps working.
+
+import time as _time
+
+from sim import clock as _clock
+
+TICKS_PERIOD = 1 << 30
+TICKS_MAX = TICKS_PERIOD - 1
+TICKS_HALFPERIOD = TICKS_PERIOD // 2
+
+
+def __getattr__(name):
+    return getattr(_time, name)
+
+
+def time():
+    c = _clock.clock
+    if c.virtual and c.integer_time:
+        return int(c.epoch())
+    return c.epoch()
+
+
+def time_ns():
+    return int(_clock.clock.epoch() * 1000000000)
+
+
+def sleep(seconds):
+    _clock.clock.sleep(seconds)
+
+
+def sleep_ms(ms):
+    _clock.clock.sleep(ms / 1000)
+
+
+def sleep_us(us):
+    _clock.clock.sleep(us / 1000000)
+
+
+def ticks_ms():
+    return int(_clock.clock.now() * 1000) & TICKS_MAX
+
+
+def ticks_us():
+    return int(_clock.clock.now() * 1000000) & TICKS_MAX
+
+
+ticks_cpu = ticks_us
+
+
+def ticks_add(ticks, delta):
+    return (ticks + delta) & TICKS_MAX
+
+
+def ticks_diff(ticks1, ticks2):
+    diff = (ticks1 - ticks2) & TICKS_MAX
+    return diff - TICKS_PERIOD if diff >= TICKS_HALFPERIOD else diff
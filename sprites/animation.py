@@ -0,0 +1,229 @@
+# Animation Timelines - precompiled per-state frame timelines and transition clips
+
+from utils import clock
+
+# Play modes
+LOOP = 'loop'  # repeat
+PINGPONG = 'pingpong'  # forward then back, repeated
+ONCE = 'once'  # play through and hold the last frame (transition clips)
+
+def _gcd(a, b):
+    while b:
+        a, b = b, a % b
+    return a
+
+class Timeline:
+    def __init__(self, entries, mode=LOOP, counts=None):
+        """
+        Compile (sprite, frame, duration) entries into a flat timeline
+        
+        Ping-pong is unrolled (0 1 2 3 2 1), so every mode plays a straight
+        run of entries, repeated or once. The run is cut into slots of the
+        greatest common divisor of the durations, and a slot table maps each
+        slot to its entry: finding the entry at any elapsed time is one
+        division and one table read, and the entry's end time says when the
+        frame next changes.
+        
+        Args:
+            entries: (sprite name, frame index, duration ms) per frame
+            mode: LOOP, PINGPONG or ONCE
+            counts: Frames per sprite name; frame indices are reduced modulo
+                    the count here so the renderer never has to (optional)
+        """
+        entries = tuple(entries)
+        if mode == PINGPONG:
+            entries += entries[-2:0:-1]
+        if not 0 < len(entries) <= 255:
+            raise ValueError("a timeline has 1-255 frames")
+        self.names = []
+        self.frames = bytearray(len(entries))
+        self.ends = []  # ms from the start at which each entry ends
+        slot_ms = 0
+        total = 0
+        for i, (name, frame, ms) in enumerate(entries):
+            if ms <= 0:
+                raise ValueError("frame durations must be positive")
+            if counts is not None:
+                if not counts.get(name):
+                    raise ValueError("no sprite frames for %s" % name)
+                frame %= counts[name]
+            self.names.append(name)
+            self.frames[i] = frame
+            total += ms
+            self.ends.append(total)
+            slot_ms = _gcd(slot_ms, ms)
+        self.names = tuple(self.names)
+        self.ends = tuple(self.ends)
+        self.period = total
+        self.slot_ms = slot_ms
+        self.loop = mode != ONCE
+        self.still = len(entries) == 1  # nothing ever changes
+        self._slots = bytearray(total // slot_ms)
+        start = 0
+        for i, end in enumerate(self.ends):
+            for slot in range(start // slot_ms, end // slot_ms):
+                self._slots[slot] = i
+            start = end
+    
+    def __len__(self):
+        return len(self.ends)
+    
+    def entry(self, elapsed):
+        """Index of the entry showing elapsed ms after the start"""
+        if elapsed >= self.period:
+            if not self.loop:
+                return len(self.ends) - 1
+            elapsed %= self.period
+        return self._slots[elapsed // self.slot_ms]
+    
+    def remaining(self, entry, elapsed):
+        """
+        Get the time left on an entry
+        
+        Args:
+            entry: Entry showing at elapsed (from entry())
+            elapsed: ms after the start
+        
+        Returns:
+            ms until the entry ends, or None if the frame never changes again
+        """
+        if self.still:
+            return None
+        if elapsed >= self.period:
+            if not self.loop:
+                return None
+            elapsed %= self.period
+        return self.ends[entry] - elapsed
+    
+    def offset(self, frame):
+        """Start (ms) of the first entry showing frame, 0 if none does"""
+        for i in range(len(self.ends)):
+            if self.frames[i] == frame:
+                return self.ends[i - 1] if i else 0
+        return 0
+
+class Animator:
+    def __init__(self, clips, transitions=None, counts=None):
+        """
+        Plays each state's timeline, with transition clips between states
+        
+        Everything is compiled here, once; playing only keeps the start
+        tick of the current timeline. A transition clip plays once when the
+        state changes between its two states, then the new state's timeline
+        starts where it ended.
+        
+        Args:
+            clips: {state name: (frame indices, durations ms, mode)}
+            transitions: {(from state, to state): ((sprite, frame, ms), ...)}
+            counts: Frames per sprite name (see Timeline)
+        """
+        self.clips = {}
+        for name, (frames, durations, mode) in clips.items():
+            entries = [(name, frame, ms) for frame, ms in zip(frames, durations)]
+            self.clips[name] = Timeline(entries, mode, counts)
+        self.transitions = {}
+        for key, entries in (transitions or {}).items():
+            self.transitions[key] = Timeline(entries, ONCE, counts)
+        self.timeline = None
+        self.after = None  # state timeline that follows a transition
+        self.started = 0  # ticks_ms the timeline started at
+        self.entry = 0
+        self.sprite = None  # sprite name and frame on show
+        self.frame = 0
+    
+    def _clip(self, name):
+        clip = self.clips.get(name)
+        if clip is None:
+            # no clip configured: the state's first frame as a still
+            clip = self.clips[name] = Timeline(((name, 0, 1),))
+        return clip
+    
+    def play(self, name, now, previous=None):
+        """
+        Start a state's timeline, through the transition from previous if there is one
+        
+        Args:
+            name: State name
+            now: ticks_ms
+            previous: State name being left
+        """
+        transition = self.transitions.get((previous, name))
+        if transition is None:
+            self.timeline = self._clip(name)
+            self.after = None
+        else:
+            self.timeline = transition
+            self.after = self._clip(name)
+        self.started = now
+        self._show(0)
+    
+    def seek(self, frame, now):
+        """
+        Jump to the first entry showing frame (a partner's animation phase)
+        
+        Ignored during a transition, so it always plays out.
+        
+        Returns:
+            True if the frame on show changed
+        """
+        if self.after is not None or self.frame == frame:
+            return False
+        timeline = self.timeline
+        self.started = clock.add(now, -timeline.offset(frame))
+        entry = timeline.entry(clock.diff(now, self.started))
+        if entry == self.entry:
+            return False
+        self._show(entry)
+        return True
+    
+    def update(self, now):
+        """
+        Advance to the entry due at now
+        
+        Returns:
+            True if the frame on show changed
+        """
+        timeline = self.timeline
+        elapsed = clock.diff(now, self.started)
+        if elapsed >= timeline.period:
+            if self.after is not None:
+                # transition over: the state's timeline starts where it ended
+                self.started = clock.add(self.started, timeline.period)
+                elapsed -= timeline.period
+                self.timeline = timeline = self.after
+                self.after = None
+                self.entry = -1
+            if elapsed >= timeline.period and timeline.loop:
+                # keep the start within a period, so ticks never wrap
+                wrapped = elapsed % timeline.period
+                self.started = clock.add(self.started, elapsed - wrapped)
+                elapsed = wrapped
+        elif elapsed < 0:
+            # not updated for half a ticks period: restart
+            self.started = now
+            elapsed = 0
+        entry = timeline.entry(elapsed)
+        if entry == self.entry:
+            return False
+        sprite = self.sprite
+        frame = self.frame
+        self._show(entry)
+        return self.sprite != sprite or self.frame != frame
+    
+    def next_change_ms(self, now):
+        """Milliseconds until the frame next changes, or None if it never does"""
+        timeline = self.timeline
+        elapsed = clock.diff(now, self.started)
+        if self.after is not None:
+            # a transition's last frame ends with it, bringing the state's timeline
+            return max(timeline.ends[timeline.entry(elapsed)] - elapsed, 0)
+        remaining = timeline.remaining(timeline.entry(elapsed), elapsed)
+        if remaining is None:
+            return None
+        return max(remaining, 0)
+    
+    def _show(self, entry):
+        timeline = self.timeline
+        self.entry = entry
+        self.sprite = timeline.names[entry]
+        self.frame = timeline.frames[entry]
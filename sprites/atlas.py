@@ -0,0 +1,140 @@
+# Sprite Atlas - packed binary sprite file, read one frame at a time
+
+import struct
+
+# File layout (little-endian), written by tools/build_atlas.py:
+#   header   magic, version, sprite count, frame count, names length
+#   sprites  per sprite: frame count, width, height, name length
+#   names    sprite names back to back (ASCII)
+#   frames   per frame: data offset in the file, data length, format,
+#            changed rect (x, y, w, h; w = 0 for none) of an XOR delta
+#   data     frame payloads
+MAGIC = b'SPAT'
+VERSION = 1
+HEADER = '<4sBBHH'
+SPRITE = '<BBBB'
+FRAME = '<IHB4B'
+HEADER_SIZE = struct.calcsize(HEADER)
+SPRITE_SIZE = struct.calcsize(SPRITE)
+FRAME_SIZE = struct.calcsize(FRAME)
+
+# Frame formats
+FORMAT_RAW = 0  # MONO_HMSB rows, as drawn
+FORMAT_RLE = 1  # run-length keyframe
+FORMAT_XOR = 2  # run-length XOR delta against the previous frame
+
+class SpriteAtlas:
+    def __init__(self, path=None):
+        """
+        Initialize a sprite index, from an atlas file if given
+        
+        Only the index is read up front: names, sizes and where each
+        frame's payload is. payload() reads one frame with readinto into a
+        buffer allocated here and reused for every read. Frames can also be
+        added from memory (add()), then payload() returns their bytes as is.
+        
+        Args:
+            path: Atlas file (OSError if it cannot be opened)
+        """
+        self.sprites = {}  # name -> (first frame, frame count, width, height)
+        self.offsets = []
+        self.lengths = []
+        self.formats = bytearray()
+        self.rects = []  # (x, y, w, h) an XOR frame changes, else None
+        self.data = []  # payload bytes of frames added from memory, else None
+        self.frame_bytes = 0  # largest decoded frame
+        self.reads = 0
+        self.read_bytes = 0
+        self._file = None
+        self._buffer = None
+        self._view = None
+        if path is not None:
+            self._load(path)
+    
+    def _load(self, path):
+        f = open(path, 'rb')
+        try:
+            header = f.read(HEADER_SIZE)
+            if len(header) != HEADER_SIZE:
+                raise ValueError("sprite atlas truncated")
+            magic, version, sprite_count, frame_count, names_len = struct.unpack(HEADER, header)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("not a version %d sprite atlas" % VERSION)
+            index = bytearray(sprite_count * SPRITE_SIZE + names_len + frame_count * FRAME_SIZE)
+            if f.readinto(index) != len(index):
+                raise ValueError("sprite atlas truncated")
+        except Exception:
+            f.close()
+            raise
+        
+        names = sprite_count * SPRITE_SIZE
+        pos = names
+        first = 0
+        for i in range(sprite_count):
+            count, width, height, name_len = struct.unpack_from(SPRITE, index, i * SPRITE_SIZE)
+            name = bytes(index[pos:pos + name_len]).decode()
+            pos += name_len
+            self.sprites[name] = (first, count, width, height)
+            self.frame_bytes = max(self.frame_bytes, ((width + 7) // 8) * height)
+            first += count
+        
+        longest = 0
+        frames = names + names_len
+        for i in range(frame_count):
+            offset, length, fmt, x, y, w, h = struct.unpack_from(FRAME, index, frames + i * FRAME_SIZE)
+            self.offsets.append(offset)
+            self.lengths.append(length)
+            self.formats.append(fmt)
+            self.rects.append((x, y, w, h) if w else None)
+            self.data.append(None)
+            longest = max(longest, length)
+        self._file = f
+        self._buffer = bytearray(longest)
+        self._view = memoryview(self._buffer)
+    
+    def add(self, name, width, height, frames):
+        """
+        Add (or replace) a sprite held in memory
+        
+        Args:
+            name: Sprite name
+            width, height: Size of every frame
+            frames: List of (format, payload bytes, XOR rect or None)
+        """
+        if not 0 < len(frames) <= 255 or width > 255 or height > 255:
+            raise ValueError("a sprite has 1-255 frames of up to 255x255")
+        self.sprites[name] = (len(self.formats), len(frames), width, height)
+        for fmt, payload, rect in frames:
+            self.offsets.append(0)
+            self.lengths.append(len(payload))
+            self.formats.append(fmt)
+            self.rects.append(rect)
+            self.data.append(payload)
+        self.frame_bytes = max(self.frame_bytes, ((width + 7) // 8) * height)
+    
+    def payload(self, frame):
+        """
+        Get a frame's encoded payload
+        
+        Args:
+            frame: Frame number (a sprite's first frame plus its index)
+        
+        Returns:
+            Buffer with the payload, valid until the next payload() call
+        """
+        data = self.data[frame]
+        if data is not None:
+            return data
+        length = self.lengths[frame]
+        view = self._view[:length]
+        self._file.seek(self.offsets[frame])
+        if self._file.readinto(view) != length:
+            raise ValueError("sprite atlas truncated")
+        self.reads += 1
+        self.read_bytes += length
+        return view
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
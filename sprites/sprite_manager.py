@@ -1,11 +1,284 @@
 # Sprite Management and Animation
 
-from sprites.sprite_data import SPRITE_DATA
+from config import SPRITE_ATLAS, SPRITE_CACHE_FRAMES, DEBUG
+from sprites.atlas import SpriteAtlas, FORMAT_RAW, FORMAT_RLE, FORMAT_XOR
+import framebuf
+
+# Compressed frame encodings (see tools/sprite_compress.py)
+ENCODING_RLE = 'rle'  # keyframe: run-length encoded pixels
+ENCODING_XOR = 'xor'  # delta: run-length encoded XOR against previous frame
+
+# Constant fill sources so zero/full runs are copied natively
+_ZEROS = memoryview(bytes(128))
+_ONES = memoryview(b'\xff' * 128)
+
+def decode_rle_into(dst, src, xor=False):
+    """
+    Stream-decode a run-length encoded frame into dst
+    
+    Control byte c < 0x80 is followed by c + 1 literal bytes; c >= 0x80 is
+    followed by one byte repeated (c & 0x7F) + 1 times.
+    
+    Args:
+        dst: Writable buffer (memoryview) receiving the pixels
+        src: Encoded bytes
+        xor: XOR the decoded bytes into dst instead of overwriting
+    
+    Returns:
+        Number of bytes written to dst
+    """
+    src = memoryview(src)
+    end = len(src)
+    i = 0
+    pos = 0
+    while i < end:
+        c = src[i]
+        if c < 0x80:
+            n = c + 1
+            if xor:
+                for k in range(n):
+                    dst[pos + k] ^= src[i + 1 + k]
+            else:
+                dst[pos:pos + n] = src[i + 1:i + 1 + n]
+            i += n + 1
+        else:
+            n = (c & 0x7F) + 1
+            value = src[i + 1]
+            if xor:
+                if value:
+                    for k in range(pos, pos + n):
+                        dst[k] ^= value
+            elif value == 0x00:
+                dst[pos:pos + n] = _ZEROS[:n]
+            elif value == 0xFF:
+                dst[pos:pos + n] = _ONES[:n]
+            else:
+                for k in range(pos, pos + n):
+                    dst[k] = value
+            i += 2
+        pos += n
+    return pos
+
+def delta_rect(src, width, height):
+    """
+    Bounding box of the bytes an encoded XOR delta changes
+    
+    Returns:
+        (x, y, w, h) in pixels relative to the sprite, or None if no change
+    """
+    stride = (width + 7) // 8
+    end = len(src)
+    i = 0
+    pos = 0
+    first = -1
+    last = -1
+    col_lo = stride
+    col_hi = -1
+    while i < end:
+        c = src[i]
+        if c < 0x80:
+            n = c + 1
+            for k in range(n):
+                if src[i + 1 + k]:
+                    idx = pos + k
+                    if first < 0:
+                        first = idx
+                    last = idx
+                    col_lo = min(col_lo, idx % stride)
+                    col_hi = max(col_hi, idx % stride)
+            i += n + 1
+        else:
+            n = (c & 0x7F) + 1
+            if src[i + 1]:
+                if first < 0:
+                    first = pos
+                last = pos + n - 1
+                if n >= stride or pos // stride != (pos + n - 1) // stride:
+                    col_lo = 0
+                    col_hi = stride - 1
+                else:
+                    col_lo = min(col_lo, pos % stride)
+                    col_hi = max(col_hi, (pos + n - 1) % stride)
+            i += 2
+        pos += n
+    if first < 0:
+        return None
+    x = col_lo * 8
+    y = first // stride
+    return (x, y, min((col_hi + 1) * 8, width) - x, last // stride - y + 1)
+
+NO_SLOT = 0xFF
 
 class SpriteManager:
-    def __init__(self):
-        """Initialize sprite manager"""
-        self.sprites = SPRITE_DATA
+    def __init__(self, path=SPRITE_ATLAS, cache_frames=SPRITE_CACHE_FRAMES):
+        """
+        Initialize sprite manager
+        
+        Frames are read from the sprite atlas one at a time as they are
+        drawn; without an atlas file, sprite_data.py is imported instead.
+        Decoded frames are kept in cache_frames preallocated buffers, least
+        recently drawn evicted first, so an animation loop that fits is read
+        and decoded once and after that only blitted. A miss on the frame
+        after (or before) a cached one applies a single XOR delta to a copy
+        of it; any other miss replays from the nearest keyframe.
+        
+        Args:
+            path: Sprite atlas file
+            cache_frames: Number of decoded frames kept (1-254)
+        """
+        if not 0 < cache_frames < NO_SLOT:
+            raise ValueError("cache_frames must be 1-254")
+        try:
+            self.atlas = SpriteAtlas(path)
+        except OSError:
+            if DEBUG:
+                print("Sprites: no atlas, loading sprite_data")
+            self.atlas = SpriteAtlas()
+            from sprites.sprite_data import SPRITE_DATA
+            for name, frames in SPRITE_DATA.items():
+                self._add_frames(name, frames)
+        
+        # Cache slots, chained from most to least recently drawn like
+        # utils/peer_table.py; every slot is in the chain, free ones hold
+        # no frame and sit at the back
+        size = self.atlas.frame_bytes
+        self.slots = cache_frames
+        self._pool = bytearray(size * cache_frames)
+        pool = memoryview(self._pool)
+        self._buffers = [pool[i * size:(i + 1) * size] for i in range(cache_frames)]
+        self._cached = [{'width': 0, 'height': 0, 'fbuf': None} for _ in range(cache_frames)]
+        self._frame_in = [-1] * cache_frames  # frame number held by each slot
+        self._slot_of = bytearray(b'\xff' * len(self.atlas.formats))  # frame number -> slot
+        self._prev = bytearray(cache_frames)
+        self._next = bytearray(cache_frames)
+        self.head = NO_SLOT
+        self.tail = NO_SLOT
+        for slot in range(cache_frames):
+            self._push_front(slot)
+        self.hits = 0
+        self.misses = 0
+        
+        self._placeholder = self._prepare_frame({
+            'width': 32,
+            'height': 32,
+            'data': b'\xff' * 128  # 32x32 bitmap = 128 bytes
+        })
+    
+    def _prepare_frame(self, frame):
+        """
+        Attach a MONO_HMSB blit source to a frame dictionary
+        
+        Sprite data stores rows of bytes with the LSB as the left pixel,
+        which is exactly the MONO_HMSB layout. FrameBuffer needs a writable
+        buffer, so the read-only bytes are described with the
+        (buffer, width, height, format) tuple that blit() accepts instead;
+        this references the bytes in place rather than copying them.
+        """
+        if 'fbuf' not in frame:
+            if not isinstance(frame['data'], bytes):
+                frame['data'] = bytes(frame['data'])
+            frame['fbuf'] = (
+                frame['data'],
+                frame['width'],
+                frame['height'],
+                framebuf.MONO_HMSB
+            )
+        return frame
+    
+    def _add_frames(self, name, frames):
+        """Index sprite_data-style frame dictionaries in the atlas"""
+        width = frames[0]['width']
+        height = frames[0]['height']
+        entries = []
+        for frame in frames:
+            data = frame['data']
+            if not isinstance(data, bytes):
+                data = bytes(data)
+            encoding = frame.get('encoding')
+            if encoding == ENCODING_XOR:
+                entries.append((FORMAT_XOR, data, delta_rect(data, width, height)))
+            elif encoding == ENCODING_RLE:
+                entries.append((FORMAT_RLE, data, None))
+            else:
+                entries.append((FORMAT_RAW, data, None))
+        self.atlas.add(name, width, height, entries)
+    
+    def _unlink(self, slot):
+        prev = self._prev[slot]
+        nxt = self._next[slot]
+        if prev == NO_SLOT:
+            self.head = nxt
+        else:
+            self._next[prev] = nxt
+        if nxt == NO_SLOT:
+            self.tail = prev
+        else:
+            self._prev[nxt] = prev
+    
+    def _push_front(self, slot):
+        head = self.head
+        self._prev[slot] = NO_SLOT
+        self._next[slot] = head
+        if head == NO_SLOT:
+            self.tail = slot
+        else:
+            self._prev[head] = slot
+        self.head = slot
+    
+    def _load(self, frame, sprite):
+        """
+        Decode a frame into the least recently drawn slot
+        
+        Args:
+            frame: Frame number in the atlas
+            sprite: The sprite's atlas entry (first, count, width, height)
+        
+        Returns:
+            The slot
+        """
+        first, count, width, height = sprite
+        size = ((width + 7) // 8) * height
+        atlas = self.atlas
+        formats = atlas.formats
+        
+        # A delta's base: the frame before, or the frame after (its delta
+        # XORed again steps back: a ping-pong clip)
+        base = NO_SLOT
+        delta = frame
+        if formats[frame] == FORMAT_XOR and frame > first:
+            base = self._slot_of[frame - 1]
+            if base == NO_SLOT and frame + 1 < first + count and formats[frame + 1] == FORMAT_XOR:
+                base = self._slot_of[frame + 1]
+                delta = frame + 1
+        
+        slot = self.tail
+        old = self._frame_in[slot]
+        if old >= 0:
+            self._slot_of[old] = NO_SLOT
+        dst = self._buffers[slot]
+        if base != NO_SLOT:
+            if base != slot:
+                dst[:size] = self._buffers[base][:size]
+            decode_rle_into(dst, atlas.payload(delta), True)
+        else:
+            start = frame
+            while start > first and formats[start] == FORMAT_XOR:
+                start -= 1
+            if formats[start] == FORMAT_RAW:
+                dst[:size] = atlas.payload(start)[:size]
+            else:
+                decode_rle_into(dst, atlas.payload(start))
+            for i in range(start + 1, frame + 1):
+                decode_rle_into(dst, atlas.payload(i), True)
+        
+        cached = self._cached[slot]
+        if cached['width'] != width or cached['height'] != height:
+            cached['width'] = width
+            cached['height'] = height
+            cached['fbuf'] = framebuf.FrameBuffer(dst, width, height, framebuf.MONO_HMSB)
+        self._frame_in[slot] = frame
+        self._slot_of[frame] = slot
+        return slot
     
     def get_sprite(self, state_name, frame_idx=0):
         """
@@ -16,24 +289,82 @@ class SpriteManager:
             frame_idx: Animation frame index (0-3)
         
         Returns:
-            Dictionary with 'width', 'height', and 'data' keys
+            Dictionary with 'width', 'height' and 'fbuf' keys. This is a
+            cache slot: draw it before fetching more frames, which may
+            evict it.
         """
-        if state_name not in self.sprites:
+        sprite = self.atlas.sprites.get(state_name)
+        if sprite is None:
             return self._get_placeholder_sprite()
+        return self.get_frame(state_name, frame_idx % sprite[1])
+    
+    def get_frame(self, state_name, frame_idx):
+        """
+        get_sprite() for a frame index already in range
+        
+        Animation timelines reduce their frame indices when they are
+        compiled, so per frame this is one lookup and, on a cache hit, a
+        move to the front of the chain.
+        """
+        sprite = self.atlas.sprites.get(state_name)
+        if sprite is None:
+            return self._placeholder
+        frame = sprite[0] + frame_idx
+        slot = self._slot_of[frame]
+        if slot == NO_SLOT:
+            slot = self._load(frame, sprite)
+            self.misses += 1
+        else:
+            self.hits += 1
+        if slot != self.head:
+            self._unlink(slot)
+            self._push_front(slot)
+        return self._cached[slot]
+    
+    def has_sprite(self, state_name):
+        """True if the atlas has frames for state_name"""
+        return state_name in self.atlas.sprites
+    
+    def frame_counts(self):
+        """Frames per sprite name (for animation timelines)"""
+        return {name: sprite[1] for name, sprite in self.atlas.sprites.items()}
+    
+    def clear(self):
+        """Drop every cached frame; they are read again when next drawn"""
+        for slot in range(self.slots):
+            frame = self._frame_in[slot]
+            if frame >= 0:
+                self._slot_of[frame] = NO_SLOT
+                self._frame_in[slot] = -1
+    
+    def step_rect(self, state_name, prev_idx, frame_idx):
+        """
+        Region that changes going from prev_idx to frame_idx of a state
         
-        state_sprites = self.sprites[state_name]
-        if isinstance(state_sprites, list):
-            frame_idx = frame_idx % len(state_sprites)
-            return state_sprites[frame_idx]
-        return state_sprites
+        Returns:
+            (x, y, w, h) relative to the sprite, (0, 0, 0, 0) if the frames
+            are the same, or None if the whole sprite should be redrawn
+        """
+        sprite = self.atlas.sprites.get(state_name)
+        if sprite is None:
+            return None
+        first, count = sprite[0], sprite[1]
+        prev_idx %= count
+        frame_idx %= count
+        if prev_idx == frame_idx:
+            return (0, 0, 0, 0)
+        if frame_idx == prev_idx - 1:
+            frame_idx = prev_idx  # stepping back undoes prev_idx's delta
+        elif frame_idx != prev_idx + 1:
+            return None
+        frame = first + frame_idx
+        if self.atlas.formats[frame] != FORMAT_XOR:
+            return None
+        return self.atlas.rects[frame] or (0, 0, 0, 0)
     
     def _get_placeholder_sprite(self):
         """Return a simple placeholder sprite"""
-        return {
-            'width': 32,
-            'height': 32,
-            'data': [0xFF] * 128  # 32x32 bitmap = 128 bytes
-        }
+        return self._placeholder
     
     def add_custom_sprite(self, state_name, frames):
         """
@@ -41,9 +372,11 @@ class SpriteManager:
         
         Args:
             state_name: State name
-            frames: List of frame dictionaries or single frame dict
+            frames: List of uncompressed frame dictionaries or single frame dict
         """
-        if isinstance(frames, list):
-            self.sprites[state_name] = frames
-        else:
-            self.sprites[state_name] = [frames]
+        if not isinstance(frames, list):
+            frames = [frames]
+        if ((frames[0]['width'] + 7) // 8) * frames[0]['height'] > len(self._buffers[0]):
+            raise ValueError("sprite larger than a cache slot")
+        self._add_frames(state_name, frames)
+        self._slot_of.extend(b'\xff' * len(frames))
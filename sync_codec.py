@@ -0,0 +1,105 @@
+# Sync Packet Codec - bit-packed, versioned pet state
+
+SYNC_VERSION = 1
+SYNC_LEN = 3  # device id + 16 packed bits
+
+# v1 layout of the 16-bit word after the device id (MSB first):
+#   15-14 version | 13-11 state | 10 error | 9-6 contact | 5-4 hearts | 3-2 phase | 1-0 reserved
+VERSION_SHIFT = 14
+STATE_SHIFT = 11
+ERROR_SHIFT = 10
+CONTACT_SHIFT = 6
+HEARTS_SHIFT = 4
+PHASE_SHIFT = 2
+STATE_MASK = 0x07
+CONTACT_MASK = 0x0F  # contact health in 16 steps
+HEARTS_MASK = 0x03
+PHASE_MASK = 0x03
+
+def quantize_contact(percent):
+    """Contact health 0-100 -> 0-15 (rounded)"""
+    percent = int(percent)
+    if percent <= 0:
+        return 0
+    if percent >= 100:
+        return CONTACT_MASK
+    return (percent * CONTACT_MASK + 50) // 100
+
+def contact_percent(level):
+    """0-15 -> contact health 0-100 (rounded)"""
+    return (level * 100 + CONTACT_MASK // 2) // CONTACT_MASK
+
+class SyncPacket:
+    def __init__(self):
+        """
+        One sync message, filled in place by decode_into()
+        
+        Fields:
+            device_id: Sender (0-255)
+            version: Codec version it was packed with
+            state: Pet state id (0-7)
+            error: Sender is showing the no-signals error
+            contact: Contact health, quantized 0-15 (see contact_percent)
+            hearts: Wireless signal sprites (0-3)
+            phase: Animation frame (0-3)
+        """
+        self.device_id = 0
+        self.version = SYNC_VERSION
+        self.state = 0
+        self.error = False
+        self.contact = 0
+        self.hearts = 0
+        self.phase = 0
+
+def encode_into(buffer, packet):
+    """
+    Pack a sync message
+    
+    Fields are masked to their width, so out-of-range values cannot spill
+    into neighbours.
+    
+    Args:
+        buffer: bytearray of at least SYNC_LEN bytes
+        packet: SyncPacket to pack
+    
+    Returns:
+        Number of bytes written (SYNC_LEN)
+    """
+    word = (
+        SYNC_VERSION << VERSION_SHIFT
+        | (packet.state & STATE_MASK) << STATE_SHIFT
+        | (1 << ERROR_SHIFT if packet.error else 0)
+        | (packet.contact & CONTACT_MASK) << CONTACT_SHIFT
+        | (packet.hearts & HEARTS_MASK) << HEARTS_SHIFT
+        | (packet.phase & PHASE_MASK) << PHASE_SHIFT
+    )
+    buffer[0] = packet.device_id & 0xFF
+    buffer[1] = word >> 8
+    buffer[2] = word & 0xFF
+    return SYNC_LEN
+
+def decode_into(packet, data):
+    """
+    Unpack a sync message into a preallocated SyncPacket
+    
+    Args:
+        packet: SyncPacket to fill (left untouched on failure)
+        data: Received body (bytes, bytearray or memoryview)
+    
+    Returns:
+        True if data is a sync of a version this codec reads
+    """
+    if len(data) < SYNC_LEN:
+        return False
+    word = (data[1] << 8) | data[2]
+    version = word >> VERSION_SHIFT
+    if version != SYNC_VERSION:
+        return False
+    packet.device_id = data[0]
+    packet.version = version
+    packet.state = (word >> STATE_SHIFT) & STATE_MASK
+    packet.error = bool(word & (1 << ERROR_SHIFT))
+    packet.contact = (word >> CONTACT_SHIFT) & CONTACT_MASK
+    packet.hearts = (word >> HEARTS_SHIFT) & HEARTS_MASK
+    packet.phase = (word >> PHASE_SHIFT) & PHASE_MASK
+    return True
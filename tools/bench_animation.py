@@ -0,0 +1,151 @@
+# Host checks and benchmark: precompiled animation timelines
+# Usage: python tools/bench_animation.py [seconds]
+#
+# Checks every configured clip and transition: Timeline.entry() against a
+# linear scan of the entries at every millisecond of three periods, and
+# Animator.next_change_ms() against the frame changes update() actually makes
+# when stepped one millisecond at a time (never early, never late). Then
+# compares, per state, the renderer wakeups of the old fixed frame timer
+# (one per ANIMATION_FRAME_MS) with sleeping until the next frame change, and
+# times one update() + next_change_ms() against the old modulo step. Exits
+# non-zero if a check fails.
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+sim.install()
+
+from config import ANIMATION_CLIPS, ANIMATION_FRAME_MS, ANIMATION_TRANSITIONS
+from sprites.animation import Animator
+from sprites.sprite_data import SPRITE_DATA
+from utils import clock
+
+
+def scan(timeline, elapsed):
+    """Entry at elapsed ms by walking the entries (the reference)"""
+    if elapsed >= timeline.period:
+        if not timeline.loop:
+            return len(timeline) - 1
+        elapsed %= timeline.period
+    for i, end in enumerate(timeline.ends):
+        if elapsed < end:
+            return i
+
+
+def check_timeline(timeline):
+    """Number of milliseconds at which entry() disagrees with the scan"""
+    return sum(timeline.entry(t) != scan(timeline, t) for t in range(3 * timeline.period))
+
+
+def check_deadlines(animator, first, state, seconds):
+    """
+    Step an animator 1 ms at a time from first through its transition to
+    state, and count frame changes that came before or after the deadline
+    next_change_ms() announced
+    """
+    now = 0
+    animator.play(first, now)
+    animator.play(state, now, first)
+    shown = (animator.sprite, animator.frame)
+    delay = animator.next_change_ms(now)
+    due = None if delay is None else now + delay
+    early = late = changes = 0
+    for now in range(1, seconds * 1000):
+        changed = animator.update(now)
+        if changed:
+            changes += 1
+            if due is None or now < due:
+                early += 1
+        elif due is not None and now >= due and (animator.sprite, animator.frame) != shown:
+            late += 1
+        if changed or due is not None and now >= due:
+            shown = (animator.sprite, animator.frame)
+            delay = animator.next_change_ms(now)
+            due = None if delay is None else now + delay
+    return changes, early, late
+
+
+def wakeups(animator, state, seconds):
+    """Renderer wakeups in seconds of state when it sleeps until the next change"""
+    now = 0
+    animator.play(state, now)
+    count = 0
+    delay = animator.next_change_ms(now)
+    while delay is not None:
+        now += max(delay, 1)
+        if now >= seconds * 1000:
+            break
+        animator.update(now)
+        count += 1
+        delay = animator.next_change_ms(now)
+    return count
+
+
+def time_per_call(fn, n):
+    start = time.perf_counter()
+    for i in range(n):
+        fn(i)
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main():
+    seconds = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+
+    ok = True
+    counts = {name: len(frames) for name, frames in SPRITE_DATA.items()}
+    animator = Animator(ANIMATION_CLIPS, ANIMATION_TRANSITIONS, counts)
+
+    print("timeline entry() vs linear scan, 3 periods at 1 ms")
+    timelines = [(name, animator.clips[name]) for name in ANIMATION_CLIPS]
+    timelines += [(f"{a}->{b}", t) for (a, b), t in animator.transitions.items()]
+    for name, timeline in timelines:
+        wrong = check_timeline(timeline)
+        passed = wrong == 0
+        print(f"  {name:16} {len(timeline):3} entries, {timeline.period:5} ms period, "
+              f"{timeline.slot_ms:4} ms slots: {wrong} wrong: {passed}")
+        ok = ok and passed
+
+    print("\nnext_change_ms() vs frame changes, 10 s stepped at 1 ms")
+    pairs = list(ANIMATION_TRANSITIONS) + [(name, name) for name in ANIMATION_CLIPS]
+    for first, state in pairs:
+        changes, early, late = check_deadlines(animator, first, state, 10)
+        passed = early == 0 and late == 0
+        print(f"  {first:>8} -> {state:8} {changes:4} changes, {early} early, {late} late: {passed}")
+        ok = ok and passed
+
+    print(f"\nrenderer wakeups over {seconds} s: fixed {ANIMATION_FRAME_MS} ms timer vs next change")
+    fixed = seconds * 1000 // ANIMATION_FRAME_MS
+    for state in ANIMATION_CLIPS:
+        timed = wakeups(animator, state, seconds)
+        passed = timed <= fixed
+        print(f"  {state:8} {fixed:6} -> {timed:6}: {passed}")
+        ok = ok and passed
+
+    n = 200000
+    frame = [0]
+    count = counts["happy"]
+
+    def legacy(i):
+        frame[0] = (frame[0] + 1) % count
+
+    animator.play("happy", 0)
+
+    def timeline(i):
+        now = clock.add(0, i * 7)
+        animator.update(now)
+        animator.next_change_ms(now)
+
+    print(f"\nper step: modulo {time_per_call(legacy, n):.2f} us, "
+          f"update + next_change_ms {time_per_call(timeline, n):.2f} us (host)")
+
+    print(f"\nAll checks pass: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+# Host benchmark: full vs dirty-page SSD1306 flush
+# Usage: python tools/bench_display_flush.py [frames]
+#
+# Renders GraphicsEngine frames into sim.SSD1306, which decodes the I2C
+# command/data stream into its own GDDRAM and counts bytes. Every frame the controller image is checked against the driver buffer, so a
+# missed damage rectangle or a wrong shadow diff shows up as a mismatch.
+# "idle" redraws an unchanged screen, "invalidated" marks the whole screen
+# every frame so only the shadow-buffer diff limits what is sent.
+
+import contextlib
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+sim.install()
+
+from graphics import GraphicsEngine
+from health_system import HealthSystem
+from pet_state import PetState
+from config import ANIMATION_FRAME_MS
+from utils import clock
+from utils.i2c_display import Display
+
+# ~25 ms at 400 kHz for a 1 KB frame: 9 clocks per byte
+I2C_US_PER_BYTE = 9 / 400000 * 1e6
+
+
+def scenario(name, frames):
+    """Yield (animate, contact_health, wireless_health, state) per frame"""
+    for i in range(frames):
+        if name == "idle":
+            yield False, 100, 100, 0
+        elif name in ("animating", "invalidated"):
+            yield True, 100 - i // 4, 100, 0
+        elif name == "hud only":
+            yield False, 100 - i // 2, 100 - 34 * ((i // 20) % 3), 0
+        else:  # mood changes every 10 frames
+            yield True, 100 - i, 100, (i // 10) % 4
+
+
+def run(name, frames, dirty):
+    controller = sim.SSD1306().attach()
+    display = Display()
+    if not dirty:
+        display.show = display.show_full
+    engine = GraphicsEngine(display)
+    health = HealthSystem()
+    pet = PetState()
+
+    start = controller.bytes_received
+    per_frame = []
+    mismatches = 0
+    now = clock.now()
+    for animate, contact, wireless, state in scenario(name, frames):
+        if animate:
+            now = clock.add(now, ANIMATION_FRAME_MS)
+            pet.update_animation(now)
+        health.contact_health = contact
+        health.wireless_health = wireless
+        pet.set_state(state)
+        if name == "invalidated":
+            engine.invalidate()
+        before = controller.bytes_received
+        engine.draw_frame(pet, health)
+        per_frame.append(controller.bytes_received - before)
+        if controller.gddram != display.display.buffer:
+            mismatches += 1
+    total = controller.bytes_received - start
+    skipped, saved = display.get_flush_stats()
+    return total / frames, max(per_frame), mismatches, skipped, saved
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    print(f"I2C bytes per frame over {frames} frames (full flush vs dirty pages)")
+    for name in ("idle", "animating", "invalidated", "hud only", "mood changes"):
+        with contextlib.redirect_stdout(io.StringIO()):
+            full = run(name, frames, dirty=False)
+            part = run(name, frames, dirty=True)
+        print(f"  {name:13} full {full[0]:7.1f} B ({full[0] * I2C_US_PER_BYTE / 1000:5.1f} ms)"
+              f"   dirty {part[0]:7.1f} B ({part[0] * I2C_US_PER_BYTE / 1000:5.1f} ms, max {part[1]} B)"
+              f"   skipped {part[3]:3d}  saved {part[4]:6d} B   mismatched frames {full[2]}/{part[2]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# Host benchmark: per-pixel sprite drawing vs framebuf blit
+# Usage: python tools/bench_draw.py [frames]
+#
+# Runs GraphicsEngine.draw_frame against the pure-Python framebuf stand-in in
+# sim/. On the device blit() is native C, so the call counts matter more than
+# the absolute host timings.
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+sim.install()
+
+from config import DISPLAY_WIDTH, DISPLAY_HEIGHT
+from graphics import GraphicsEngine
+from health_system import HealthSystem
+from pet_state import PetState
+from sprites.sprite_data import SPRITE_DATA
+from utils.i2c_display import Display
+from sprite_compress import decompress_frames
+
+
+class CountingDisplay(Display):
+    """Display wrapper that counts Python-level drawing calls"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def pixel(self, x, y, color):
+        self.calls += 1
+        super().pixel(x, y, color)
+
+    def blit(self, fbuf, x, y, key=-1):
+        self.calls += 1
+        super().blit(fbuf, x, y, key)
+
+
+class LegacySpriteManager:
+    """Raw (uncompressed) frames, looked up the original way"""
+
+    def __init__(self):
+        self.sprites = {}
+        for name, frames in SPRITE_DATA.items():
+            if 'encoding' in frames[0]:
+                frames = [{'width': f['width'], 'height': f['height'], 'data': raw}
+                          for f, raw in zip(frames, decompress_frames(frames))]
+            self.sprites[name] = frames
+
+    def get_sprite(self, state_name, frame_idx=0):
+        frames = self.sprites[state_name]
+        return frames[frame_idx % len(frames)]
+
+    get_frame = get_sprite
+
+    def step_rect(self, state_name, prev_idx, frame_idx):
+        return None  # no delta metadata: redraw the whole sprite
+
+
+class LegacyGraphicsEngine(GraphicsEngine):
+    """GraphicsEngine with the original per-pixel _draw_bitmap"""
+
+    def __init__(self, display):
+        super().__init__(display)
+        self.sprite_manager = LegacySpriteManager()
+
+    def _draw_bitmap(self, bitmap_data, x, y):
+        width = bitmap_data.get('width', 0)
+        height = bitmap_data.get('height', 0)
+        data = bitmap_data.get('data', [])
+
+        if not data:
+            return
+
+        for byte_idx, byte_val in enumerate(data):
+            row = byte_idx // ((width + 7) // 8)
+            col = (byte_idx % ((width + 7) // 8)) * 8
+
+            for bit in range(8):
+                if col + bit < width and row < height:
+                    if byte_val & (1 << bit):
+                        px = x + col + bit
+                        py = y + row
+                        if 0 <= px < DISPLAY_WIDTH and 0 <= py < DISPLAY_HEIGHT:
+                            self.display.pixel(px, py, 1)
+
+
+def run(engine_cls, frames):
+    display = CountingDisplay()
+    engine = engine_cls(display)
+    health = HealthSystem()
+    pet = PetState()
+    states = (0, 2)  # "happy" and "sad" are full 128x64 frames
+
+    buffers = []
+    start = time.perf_counter()
+    for i in range(frames):
+        pet.set_state(states[(i // 4) % len(states)])
+        # fixed frames, not the state's timeline (or a transition)
+        pet.sprite_name = pet.get_state_name()
+        pet.animation_frame = i % len(SPRITE_DATA[pet.sprite_name])
+        engine.draw_frame(pet, health)
+        if i < 8:
+            buffers.append(bytes(display.display.buffer))
+    elapsed = time.perf_counter() - start
+    return elapsed / frames * 1000, display.calls / frames, buffers
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+
+    old_ms, old_calls, old_buffers = run(LegacyGraphicsEngine, frames)
+    new_ms, new_calls, new_buffers = run(GraphicsEngine, frames)
+
+    print(f"draw_frame over {frames} frames (host, pure-Python framebuf)")
+    print(f"  per-pixel: {old_ms:8.2f} ms/frame  {old_calls:7.1f} display calls/frame")
+    print(f"  blit:      {new_ms:8.2f} ms/frame  {new_calls:7.1f} display calls/frame")
+    print(f"  speedup:   {old_ms / new_ms:8.2f}x")
+    print(f"  identical output: {old_buffers == new_buffers}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# Host benchmark: per-pixel health HUD vs prerendered HUD layer
+# Usage: python tools/bench_hud.py [frames]
+#
+# Times GraphicsEngine._draw_health_indicators against the original per-pixel
+# version while the health values step down the way they do on the device
+# (the bar changes every few frames, the hearts rarely). Call counts are
+# Python-level display calls per frame; on the device each of them is a native
+# framebuf operation, so they matter more than the host timings. Runs on
+# virtual time, so health does not decay between the two engines' frames.
+# Exits non-zero if the composite frames differ.
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+sim.install(virtual_time=True)
+
+from graphics import (
+    GraphicsEngine, HEART_SIZE, HEART_SPACING, HEART_X, HEART_Y,
+    BAR_WIDTH, BAR_HEIGHT, BAR_X, BAR_Y, CONTACT_ICON_X,
+)
+from health_system import HealthSystem
+from pet_state import PetState
+from sprites.sprite_data import SPRITE_DATA
+from utils.i2c_display import Display
+
+
+class CountingDisplay(Display):
+    """Display wrapper that counts Python-level drawing calls"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def fill(self, color):
+        self.calls += 1
+        super().fill(color)
+
+    def load(self, buffer):
+        self.calls += 1
+        super().load(buffer)
+
+    def pixel(self, x, y, color):
+        self.calls += 1
+        super().pixel(x, y, color)
+
+    def blit(self, fbuf, x, y, key=-1):
+        self.calls += 1
+        super().blit(fbuf, x, y, key)
+
+
+class LegacyGraphicsEngine(GraphicsEngine):
+    """GraphicsEngine with the original per-pixel health indicators"""
+
+    def _draw_health_indicators(self, health_system):
+        self.display.fill(0)
+        signal_sprites = health_system.get_wireless_signal_sprites()
+        for i in range(3):
+            if i < signal_sprites:
+                self._draw_heart_icon(HEART_X + 1, HEART_Y + i * (HEART_SIZE + HEART_SPACING) + 1)
+
+        self._draw_contact_icon(CONTACT_ICON_X, BAR_Y)
+
+        for px in range(BAR_WIDTH):
+            self.display.pixel(BAR_X + px, BAR_Y, 1)
+            self.display.pixel(BAR_X + px, BAR_Y + BAR_HEIGHT - 1, 1)
+        for py in range(BAR_HEIGHT):
+            self.display.pixel(BAR_X, BAR_Y + py, 1)
+            self.display.pixel(BAR_X + BAR_WIDTH - 1, BAR_Y + py, 1)
+
+        contact_pixels = health_system.get_contact_health_pixels(BAR_HEIGHT)
+        self._track_hud((signal_sprites, contact_pixels))
+        if contact_pixels > 0:
+            for px in range(BAR_WIDTH):
+                for py in range(contact_pixels):
+                    self.display.pixel(BAR_X + px, BAR_Y + (BAR_HEIGHT - py - 1), 1)
+
+    def _draw_heart_icon(self, x, y):
+        if "empty_heart_icon" in SPRITE_DATA and SPRITE_DATA["empty_heart_icon"]:
+            self._draw_bitmap(self.sprite_manager.get_sprite("empty_heart_icon"), x, y)
+
+    def _draw_contact_icon(self, x, y):
+        if "contact_icon" in SPRITE_DATA and SPRITE_DATA["filled_heart_icon"]:
+            self._draw_bitmap(self.sprite_manager.get_sprite("filled_heart_icon"), x, y)
+
+
+def health_at(health, i):
+    health.contact_health = max(0, 100 - i)
+    health.wireless_health = 100 - 34 * ((i // 30) % 4)
+
+
+def run(engine_cls, frames):
+    display = CountingDisplay()
+    engine = engine_cls(display)
+    health = HealthSystem()
+    pet = PetState()
+
+    elapsed = 0.0
+    calls = 0
+    buffers = []
+    for i in range(frames):
+        health_at(health, i)
+        display.calls = 0
+        start = time.perf_counter()
+        engine._draw_health_indicators(health)
+        elapsed += time.perf_counter() - start
+        calls += display.calls
+
+        # whole frame on top of the HUD, to check the composite is unchanged
+        engine.draw_frame(pet, health)
+        buffers.append(bytes(display.display.buffer))
+    return elapsed / frames * 1000, calls / frames, buffers
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+
+    old_ms, old_calls, old_buffers = run(LegacyGraphicsEngine, frames)
+    new_ms, new_calls, new_buffers = run(GraphicsEngine, frames)
+
+    print(f"health HUD over {frames} frames (host, pure-Python framebuf)")
+    print(f"  per-pixel: {old_ms:8.3f} ms/frame  {old_calls:7.1f} display calls/frame")
+    print(f"  layer:     {new_ms:8.3f} ms/frame  {new_calls:7.1f} display calls/frame")
+    print(f"  speedup:   {old_ms / new_ms:8.1f}x")
+    identical = old_buffers == new_buffers
+    print(f"  identical output: {identical}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+# Host benchmark: button input-to-pixel latency
+# Usage: python tools/bench_input_latency.py [presses]
+#
+# Presses the button (30 ms low pulses at random intervals) and measures the
+# time until the first display.show() after the press handler ran. Compares
+# the old single loop (everything polled, then time.sleep(0.05)) with the
+# asyncio runtime in VirtualPetApp.run_async. Real wall-clock time on the
+# host, with the pure-Python framebuf stand-in doing the drawing.
+
+import contextlib
+import io
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+sim.install()
+
+from config import BUTTON_PIN, LORA_SS_PIN, LORA_DIO0_PIN
+from main import VirtualPetApp
+from utils.aio import asyncio
+
+PRESS_MS = 30
+
+
+class Probe:
+    """Timestamps button presses, handler runs and display flushes"""
+
+    def __init__(self, app):
+        self.app = app
+        self.shows = []
+        self.handled = []
+        show = app.display.show
+        handler = app.on_button_pressed
+
+        def timed_show():
+            show()
+            self.shows.append(time.perf_counter())
+
+        def timed_handler():
+            self.handled.append(time.perf_counter())
+            app.health.wireless_health = 100  # keep it out of the error state
+            handler()
+
+        app.display.show = timed_show
+        app.button.on_press = timed_handler
+
+    def latencies(self, presses):
+        results = []
+        missed = 0
+        bounds = presses[1:] + [float('inf')]
+        for pressed, next_press in zip(presses, bounds):
+            handled = [h for h in self.handled if pressed <= h < next_press]
+            if not handled:
+                missed += 1
+                continue
+            shown = [s for s in self.shows if s > handled[0]]
+            if shown:
+                results.append((shown[0] - pressed) * 1000)
+        return results, missed
+
+
+def make_app():
+    sim.SX1278(LORA_SS_PIN, LORA_DIO0_PIN).attach()
+    app = VirtualPetApp(device_id=1)
+    return app, Probe(app), sim.board().pin(BUTTON_PIN)
+
+
+def legacy_loop(app):
+    """The original VirtualPetApp.run body: poll everything, then sleep 50 ms"""
+    while app.running:
+        app._check_error_timeout()
+        app._check_inputs()
+        app.graphics.update(app.pet_state, app.health)
+        app._check_lora_updates()
+        time.sleep(0.05)
+
+
+def run_legacy(count, rng):
+    app, probe, button = make_app()
+    worker = threading.Thread(target=legacy_loop, args=(app,))
+    worker.start()
+    presses = []
+    for _ in range(count):
+        time.sleep(rng.uniform(0.1, 0.2))
+        presses.append(time.perf_counter())
+        button.drive(0)
+        time.sleep(PRESS_MS / 1000)
+        button.drive(1)
+    time.sleep(0.2)
+    app.running = False
+    worker.join()
+    return probe.latencies(presses)
+
+
+def run_async(count, rng):
+    app, probe, button = make_app()
+    presses = []
+
+    async def injector():
+        for _ in range(count):
+            await asyncio.sleep(rng.uniform(0.1, 0.2))
+            presses.append(time.perf_counter())
+            button.drive(0)
+            await asyncio.sleep(PRESS_MS / 1000)
+            button.drive(1)
+        await asyncio.sleep(0.2)
+        app.stop()
+
+    async def main():
+        await asyncio.gather(app.run_async(), injector())
+
+    asyncio.run(main())
+    return probe.latencies(presses)
+
+
+def summary(name, latencies, missed, count):
+    latencies.sort()
+    if not latencies:
+        print(f"  {name:8} no presses seen ({missed}/{count} missed)")
+        return
+    mean = sum(latencies) / len(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(f"  {name:8} mean {mean:6.1f} ms  p95 {p95:6.1f} ms  max {latencies[-1]:6.1f} ms"
+          f"  missed {missed}/{count}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    with contextlib.redirect_stdout(io.StringIO()):
+        legacy = run_legacy(count, random.Random(1))
+        runtime = run_async(count, random.Random(1))
+    print(f"Input-to-pixel latency, {count} presses of {PRESS_MS} ms")
+    summary("loop", *legacy, count)
+    summary("asyncio", *runtime, count)
+
+
+if __name__ == "__main__":
+    main()
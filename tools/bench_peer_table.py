@@ -0,0 +1,191 @@
+# Host benchmark: fixed-capacity peer table vs a dict of lists
+# Usage: python tools/bench_peer_table.py [records]
+#
+# Checks PeerTable against an OrderedDict LRU model under a random mix of
+# syncs, removals and expiry (same peers, same recency order, same fields),
+# and that recording syncs neither grows the heap nor resizes any of its
+# arrays once the table is full. Then times record() at 16 to 255 slots, for
+# a working set that fits and for 256 pets churning through the table,
+# against a dict of per-peer lists that evicts by scanning for the oldest
+# entry (what a dict needs without the linked list). Exits non-zero if a
+# check fails.
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+sim.install()
+
+from sync_codec import SyncPacket
+from utils.peer_table import NO_SLOT, PeerTable
+
+CAPACITIES = (16, 64, 128, 255)
+TIMEOUT = 500
+
+
+class DictTable:
+    """Peers in a dict of [state, phase, contact, hearts, error, seq, rssi, last seen]"""
+
+    def __init__(self, slots):
+        self.slots = slots
+        self.peers = {}
+
+    def record(self, packet, rssi, seq, now):
+        entry = self.peers.get(packet.device_id)
+        if entry is None:
+            if len(self.peers) >= self.slots:
+                oldest = min(self.peers, key=lambda k: self.peers[k][7])
+                del self.peers[oldest]
+            entry = self.peers[packet.device_id] = [0] * 8
+        entry[0] = packet.state
+        entry[1] = packet.phase
+        entry[2] = packet.contact
+        entry[3] = packet.hearts
+        entry[4] = packet.error
+        entry[5] = seq
+        entry[6] = rssi
+        entry[7] = now
+
+
+def make_packets(count, rng):
+    packets = []
+    for device_id in range(count):
+        packet = SyncPacket()
+        packet.device_id = device_id
+        packet.state = rng.randrange(8)
+        packet.phase = rng.randrange(4)
+        packet.contact = rng.randrange(16)
+        packet.hearts = rng.randrange(4)
+        packet.error = rng.random() < 0.1
+        packets.append(packet)
+    return packets
+
+
+def recency(table):
+    order = []
+    slot = table.head
+    while slot != NO_SLOT:
+        order.append(table.ids[slot])
+        slot = table.after(slot)
+    return order
+
+
+def check_model(slots, steps, rng):
+    """Same contents and order as an OrderedDict LRU, newest first"""
+    table = PeerTable(slots)
+    model = OrderedDict()
+    packets = make_packets(256, rng)
+    for now in range(steps):
+        op = rng.random()
+        device_id = rng.randrange(256) if op < 0.5 else rng.randrange(min(256, slots + slots // 2 + 1))
+        if op < 0.9:
+            packet = packets[device_id]
+            rssi, seq = -rng.randrange(40, 130), rng.randrange(32)
+            table.record(packet, rssi, seq, now)
+            model.pop(device_id, None)
+            if len(model) >= slots:
+                model.popitem(last=False)
+            model[device_id] = (packet.state, packet.phase, packet.contact, packet.hearts,
+                                packet.error, seq, rssi, now)
+        elif op < 0.97:
+            if table.remove(device_id) != (model.pop(device_id, None) is not None):
+                return False
+        else:
+            stale = [k for k, v in model.items() if now - v[7] >= TIMEOUT]
+            for k in stale:
+                del model[k]
+            if table.expire(now, TIMEOUT) != len(stale):
+                return False
+            if table.live(now, TIMEOUT) != len(model):
+                return False
+        if len(table) != len(model) or recency(table) != list(reversed(model)):
+            return False
+        for device_id, fields in model.items():
+            slot = table.find(device_id)
+            if slot is None or slot >= len(table):
+                return False
+            got = (table.state[slot], table.phase[slot], table.contact[slot], table.hearts[slot],
+                   bool(table.error[slot]), table.seq[slot], table.rssi[slot], table.last_seen[slot])
+            if got != fields:
+                return False
+    return True
+
+
+def feed(table, packets, ids, start):
+    for now, device_id in enumerate(ids, start):
+        table.record(packets[device_id], -90, now & 31, now)
+
+
+def check_no_growth(slots, records, rng):
+    """Net heap growth (bytes) once the table is full, and no array resized"""
+    table = PeerTable(slots)
+    packets = make_packets(256, rng)
+    ids = [rng.randrange(256) for _ in range(records)]
+    arrays = [table._index, table.ids, table.state, table.rssi, table.last_seen,
+              table._prev, table._next]
+    sizes = [len(a) for a in arrays]
+    # ticks and counters stay above CPython's small-int cache in both
+    # passes, so the int objects it boxes them in (traced from the start)
+    # replace each other one for one
+    table.evictions = 1 << 20
+    tracemalloc.start()
+    # (the first pass also absorbs one-off allocations of the harness)
+    feed(table, packets, list(range(256)) + ids, 1 << 20)
+    before = tracemalloc.take_snapshot()
+    feed(table, packets, ids, 1 << 21)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    ignore = (tracemalloc.Filter(False, tracemalloc.__file__),)
+    growth = sum(stat.size_diff for stat in after.filter_traces(ignore).compare_to(
+        before.filter_traces(ignore), "filename"))
+    resized = [len(a) for a in arrays] != sizes
+    return growth, resized
+
+
+def timed(table, packets, ids):
+    start = time.perf_counter()
+    record = table.record
+    for now, device_id in enumerate(ids):
+        record(packets[device_id], -90, now & 31, now)
+    return len(ids) / (time.perf_counter() - start)
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(1)
+
+    ok = True
+    for slots in (1, 2) + CAPACITIES:
+        passed = check_model(slots, 4000, rng)
+        print(f"{slots:3d} slots: matches LRU model: {passed}")
+        ok = ok and passed
+    for slots in CAPACITIES:
+        growth, resized = check_no_growth(slots, records, rng)
+        passed = growth <= 0 and not resized
+        print(f"{slots:3d} slots: {records} records, heap growth {growth} B, arrays resized {resized}")
+        ok = ok and passed
+
+    packets = make_packets(256, rng)
+    print(f"\nrecord() calls per second ({records} syncs)")
+    print(f"  {'slots':>5} {'workload':10} {'PeerTable':>10} {'dict+scan':>10}")
+    for slots in CAPACITIES:
+        fits = [rng.randrange(slots) for _ in range(records)]
+        churn = [rng.randrange(256) for _ in range(records)]
+        for name, ids in (("fits", fits), ("256 churn", churn)):
+            table_rate = timed(PeerTable(slots), packets, ids)
+            dict_rate = timed(DictTable(slots), packets, ids)
+            print(f"  {slots:5d} {name:10} {table_rate:10.0f} {dict_rate:10.0f}")
+
+    print(f"\nAll checks pass: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+# Host benchmark: sprite atlas vs sprite_data.py at boot and while running
+# Usage: python tools/bench_sprite_atlas.py [runs]
+#
+# Boots SpriteManager, and the whole VirtualPetApp on the host simulator,
+# once from the packed atlas (sprites/atlas.bin, tools/build_atlas.py) and
+# once from sprite_data.py, each in a fresh interpreter with an empty
+# bytecode cache, so importing sprite_data compiles it from source as
+# MicroPython does with a .py file (the code modules are imported before the
+# clock starts, so only loading sprites differs). Reports the median boot
+# time and the tracemalloc peak and retained heap (CPython object sizes:
+# compare them, do not read them as device bytes). Then plays 120 s of
+# virtual time with the pet's mood stepping through every state, per cache
+# size, and counts atlas reads and cache misses. Exits non-zero if the atlas
+# boot is not faster and smaller at its peak, imports sprite_data, or draws a
+# frame different from sprite_data.py's.
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+MISSING = os.path.join(ROOT, "sprites", "no-atlas.bin")
+CACHE_SIZES = (1, 2, 3, 4, 6, 8)
+PLAY_SECONDS = 120
+
+
+def probe(mode, target, cache_frames):
+    """Child process: boot one way and report time and heap as JSON"""
+    import time
+    import tracemalloc
+
+    import sim
+
+    sim.install(virtual_time=target == "app")
+    import config
+
+    if mode == "data":
+        config.SPRITE_ATLAS = MISSING
+    config.SPRITE_CACHE_FRAMES = cache_frames
+    config.DEBUG = False
+
+    # the code itself is imported first: only loading sprites is compared
+    import contextlib
+    import io
+
+    import main
+    from sprites.sprite_manager import SpriteManager
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    if target == "manager":
+        manager = SpriteManager()
+    else:
+        with contextlib.redirect_stdout(io.StringIO()):
+            pet = sim.SimulatedPet()
+        manager = pet.app.graphics.sprite_manager
+    boot = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = dict(boot_ms=boot * 1000, retained=retained, peak=peak,
+                  imported_data="sprites.sprite_data" in sys.modules)
+    if target == "app":
+        result.update(play(pet, manager))
+    print(json.dumps(result))
+
+
+def play(pet, manager):
+    """Run the app with the mood stepping through every state; count reads and check frames"""
+    import contextlib
+    import io
+
+    import sim
+    from config import PET_STATES
+    from utils.aio import sleep_ms
+
+    app = pet.app
+    app.health.on_wireless_sync = lambda: True  # stay out of the error state
+    app.pet_state.update_state_from_health = lambda contact_health: None
+    drawn = []
+    get_frame = manager.get_frame
+
+    def recorded(name, idx):
+        sprite = get_frame(name, idx)
+        size = ((sprite['width'] + 7) // 8) * sprite['height']
+        drawn.append((name, idx, bytes(sprite['fbuf'].buf[:size])))
+        return sprite
+
+    manager.get_frame = recorded
+
+    async def moods():
+        step = PLAY_SECONDS * 1000 // (2 * len(PET_STATES))
+        for i in range(2 * len(PET_STATES)):
+            app.pet_state.set_state(i % len(PET_STATES))
+            await sleep_ms(step)
+        app.stop()
+
+    async def session():
+        import asyncio
+
+        asyncio.get_event_loop().create_task(moods())
+        await app.run_async()
+
+    reads = manager.atlas.reads
+    read_bytes = manager.atlas.read_bytes
+    misses = manager.misses
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim.run(session())
+
+    from sprites.sprite_data import SPRITE_DATA
+    sys.path.insert(0, os.path.join(ROOT, "tools"))
+    from sprite_compress import decompress_frames
+
+    wrong = 0
+    reference = {}
+    for name, idx, data in drawn:
+        if name not in reference:
+            frames = SPRITE_DATA[name]
+            size = ((frames[0]['width'] + 7) // 8) * frames[0]['height']
+            if 'encoding' in frames[0]:
+                reference[name] = decompress_frames(frames)
+            else:
+                reference[name] = [bytes(frame['data'][:size]) for frame in frames]
+        wrong += data != reference[name][idx]
+    return dict(frames=len(drawn), reads=manager.atlas.reads - reads,
+                read_bytes=manager.atlas.read_bytes - read_bytes, misses=manager.misses - misses, wrong=wrong)
+
+
+def run_probe(mode, target, cache_frames=None):
+    """Run probe() in a fresh interpreter with an empty bytecode cache"""
+    with tempfile.TemporaryDirectory() as cache:
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=cache)
+        args = [sys.executable, os.path.abspath(__file__), "--probe", mode, target, str(cache_frames or 0)]
+        out = subprocess.run(args, cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def boot(mode, target, runs):
+    from config import SPRITE_CACHE_FRAMES
+
+    results = [run_probe(mode, target, SPRITE_CACHE_FRAMES) for _ in range(runs)]
+    return dict(
+        boot_ms=statistics.median(r["boot_ms"] for r in results),
+        retained=results[0]["retained"],
+        peak=results[0]["peak"],
+        imported_data=results[0]["imported_data"],
+    )
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--probe":
+        probe(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+        return 0
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    from config import SPRITE_ATLAS, SPRITE_CACHE_FRAMES
+
+    atlas_path = os.path.join(ROOT, SPRITE_ATLAS)
+    if not os.path.exists(atlas_path):
+        print(f"{SPRITE_ATLAS} missing: run tools/build_atlas.py")
+        return 1
+    data_path = os.path.join(ROOT, "sprites", "sprite_data.py")
+    print(f"sprite_data.py {os.path.getsize(data_path)} B source, "
+          f"{SPRITE_ATLAS} {os.path.getsize(atlas_path)} B; {SPRITE_CACHE_FRAMES} cached frames")
+
+    ok = True
+    print(f"\nboot, median of {runs} fresh interpreters (host, tracemalloc)")
+    print(f"  {'':30} {'boot ms':>8} {'peak B':>9} {'retained B':>11}")
+    for target, label in (("manager", "SpriteManager"), ("app", "VirtualPetApp")):
+        data = boot("data", target, runs)
+        atlas = boot("atlas", target, runs)
+        for mode, r in (("sprite_data.py", data), ("atlas", atlas)):
+            print(f"  {label + ', ' + mode:30} {r['boot_ms']:8.2f} {r['peak']:9d} {r['retained']:11d}")
+        passed = (atlas["boot_ms"] < data["boot_ms"] and atlas["peak"] < data["peak"]
+                  and not atlas["imported_data"])
+        print(f"  {label}: {data['boot_ms'] / atlas['boot_ms']:.1f}x faster, peak "
+              f"{data['peak'] / atlas['peak']:.1f}x lower, sprite_data imported: "
+              f"{atlas['imported_data']}: {passed}")
+        ok = ok and passed
+
+    print(f"\n{PLAY_SECONDS} s virtual, mood stepping through every state, by cache size")
+    print(f"  {'frames':>6} {'drawn':>6} {'misses':>7} {'reads':>6} {'read B':>7}  ok")
+    for cache_frames in CACHE_SIZES:
+        r = run_probe("atlas", "app", cache_frames)
+        passed = r["wrong"] == 0 and not r["imported_data"]
+        print(f"  {cache_frames:6d} {r['frames']:6d} {r['misses']:7d} {r['reads']:6d} "
+              f"{r['read_bytes']:7d}  {passed}")
+        ok = ok and passed
+
+    print(f"\nAll checks pass: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
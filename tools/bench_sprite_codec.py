@@ -0,0 +1,74 @@
+# Host benchmark: compressed sprite container
+# Usage: python tools/bench_sprite_codec.py [iterations]
+#
+# Reports the compression ratio of every compressed state in sprite_data.py
+# and the per-frame time of SpriteManager stepping through the animation
+# with a one-frame cache (one atlas read and XOR delta per step), jumping
+# straight to a frame (keyframe replay) and drawing from a warm cache.
+# Decoded output is checked against the reference decoder.
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+sim.install()
+
+from sprites.sprite_data import SPRITE_DATA
+from sprites.sprite_manager import SpriteManager
+from sprite_compress import decompress_frames
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    manager = SpriteManager()
+    single = SpriteManager(cache_frames=1)
+
+    print(f"{'state':10} {'frames':>6} {'raw B':>7} {'packed B':>9} {'ratio':>6} "
+          f"{'step us':>8} {'jump us':>8} {'hit us':>8}  ok")
+    for name, frames in SPRITE_DATA.items():
+        if 'encoding' not in frames[0]:
+            continue
+        size = ((frames[0]['width'] + 7) // 8) * frames[0]['height']
+        raw = size * len(frames)
+        packed = sum(len(f['data']) for f in frames)
+        count = len(frames)
+
+        # Sequential playback through one cache slot: each call reads and
+        # applies one delta
+        single.get_frame(name, 0)
+        start = time.perf_counter()
+        for i in range(iterations):
+            single.get_frame(name, (i + 1) % count)
+        step_us = (time.perf_counter() - start) / iterations * 1e6
+
+        # Random access: force a replay from the keyframe every call
+        start = time.perf_counter()
+        for i in range(iterations):
+            single.clear()
+            single.get_frame(name, count - 1)
+        jump_us = (time.perf_counter() - start) / iterations * 1e6
+
+        # The whole loop cached: no read or decode at all
+        for idx in range(count):
+            manager.get_frame(name, idx)
+        start = time.perf_counter()
+        for i in range(iterations):
+            manager.get_frame(name, (i + 1) % count)
+        hit_us = (time.perf_counter() - start) / iterations * 1e6
+
+        reference = decompress_frames(frames)
+        ok = True
+        for idx in range(count):
+            sprite = manager.get_sprite(name, idx)
+            ok = ok and bytes(sprite['fbuf'].buf[:size]) == reference[idx]
+
+        print(f"{name:10} {count:6d} {raw:7d} {packed:9d} {raw / packed:6.1f} "
+              f"{step_us:8.1f} {jump_us:8.1f} {hit_us:8.1f}  {ok}")
+
+
+if __name__ == "__main__":
+    main()
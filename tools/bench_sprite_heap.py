@@ -0,0 +1,81 @@
+# Host measurement: import-time heap footprint of sprites/sprite_data.py
+# Usage: python tools/bench_sprite_heap.py
+#
+# Compares the bytes-literal sprite module against the same data written the
+# old way (lists of ints). tracemalloc numbers are CPython object sizes; the
+# MicroPython estimates assume a 32-bit port where small ints are stored
+# inline in list slots and frozen bytes live in flash.
+
+import importlib.util
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+sim.install()
+
+from sprites import sprite_data
+
+
+def write_list_module(path):
+    """Write the current sprite data back out in the legacy list-of-ints format"""
+    with open(path, "w") as f:
+        f.write("SPRITE_DATA = {\n")
+        for name, frames in sprite_data.SPRITE_DATA.items():
+            f.write(f'    "{name}": [\n')
+            for frame in frames:
+                values = ", ".join(f"0x{b:02x}" for b in frame['data'])
+                f.write(f"        {{'width': {frame['width']}, 'height': {frame['height']}, "
+                        f"'data': [{values}]}},\n")
+            f.write("    ],\n")
+        f.write("}\n")
+
+
+def measure_import(path):
+    """Return (current, peak) traced bytes for importing the module at path"""
+    spec = importlib.util.spec_from_file_location("sprite_data_probe", path)
+    module = importlib.util.module_from_spec(spec)
+    tracemalloc.start()
+    spec.loader.exec_module(module)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, peak
+
+
+def micropython_estimate():
+    """Rough MicroPython heap bytes for the frame payloads only"""
+    list_bytes = 0
+    bytes_bytes = 0
+    for frames in sprite_data.SPRITE_DATA.values():
+        for frame in frames:
+            n = len(frame['data'])
+            list_bytes += 16 + 4 * n   # mp_obj_list_t + item array
+            bytes_bytes += 16 + n      # mp_obj_str_t + data (0 when frozen)
+    return list_bytes, bytes_bytes
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = os.path.join(tmp, "sprite_data_lists.py")
+        write_list_module(legacy_path)
+        old_cur, old_peak = measure_import(legacy_path)
+        new_cur, new_peak = measure_import(sprite_data.__file__)
+
+    list_est, bytes_est = micropython_estimate()
+
+    print("Import-time heap of sprite_data (host, tracemalloc)")
+    print(f"  int lists:     retained {old_cur:8d} B   peak {old_peak:8d} B")
+    print(f"  bytes literal: retained {new_cur:8d} B   peak {new_peak:8d} B")
+    print(f"  retained saving: {old_cur - new_cur} B ({old_cur / max(new_cur, 1):.1f}x)")
+    print("MicroPython frame payload estimate (32-bit port)")
+    print(f"  int lists:          {list_est:8d} B heap")
+    print(f"  bytes (.py/.mpy):   {bytes_est:8d} B heap")
+    print(f"  bytes (frozen):     {0:8d} B heap")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
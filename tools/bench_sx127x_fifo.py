@@ -0,0 +1,138 @@
+# Host benchmark: SX127x FIFO access, per-byte vs burst
+# Usage: python tools/bench_sx127x_fifo.py [packets]
+#
+# Drives the SX127x driver against sim.SX1278, which emulates the register
+# file and FIFO pointer behind the SPI stand-in and records every chip-select
+# bracketed transaction.
+# Reports SPI transactions, SPI driver calls and the peak transient heap
+# (CPython object sizes, so memoryview slices look larger than on the device)
+# per packet for the original per-byte FIFO code and the burst path, and
+# checks both move the same bytes.
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+sim.install()
+
+import drivers.sx127x as sx127x
+from drivers.sx127x import (
+    SX127x, REG_FIFO, REG_FIFO_ADDR_PTR, REG_FIFO_RX_CURRENT_ADDR,
+    REG_RX_NB_BYTES, REG_PAYLOAD_LENGTH
+)
+from machine import SPI
+
+SS_PIN = 3
+
+
+class LegacySX127x(SX127x):
+    """Original per-byte FIFO access and allocating transfer()"""
+
+    def write(self, buffer):
+        currentLength = self.read_register(REG_PAYLOAD_LENGTH)
+        size = min(len(buffer), (sx127x.MAX_PKT_LENGTH - sx127x.FifoTxBaseAddr - currentLength))
+        for i in range(size):
+            self.write_register(REG_FIFO, buffer[i])
+        self.write_register(REG_PAYLOAD_LENGTH, currentLength + size)
+        return size
+
+    def read_payload(self):
+        self.write_register(REG_FIFO_ADDR_PTR, self.read_register(REG_FIFO_RX_CURRENT_ADDR))
+        packet_length = self.read_register(REG_RX_NB_BYTES)
+        payload = bytearray()
+        for i in range(packet_length):
+            payload.append(self.read_register(REG_FIFO))
+        return bytes(payload)
+
+    def read_register(self, address, byteorder='big', signed=False):
+        response = self.transfer(address & 0x7f)
+        return int.from_bytes(response, byteorder)
+
+    def transfer(self, address, value=0x00):
+        response = bytearray(1)
+        self._pin_ss.value(0)
+        self._spi.write(bytes([address]))
+        self._spi.write_readinto(bytes([value]), response)
+        self._pin_ss.value(1)
+        return response
+
+    def collect_garbage(self):
+        pass
+
+
+class BurstSX127x(SX127x):
+    def collect_garbage(self):
+        pass
+
+
+def make_radio(cls):
+    bus = sim.SX1278(SS_PIN).attach()
+    radio = cls(SPI(1), {'ss': SS_PIN, 'dio_0': 11}, dict(SX127x.default_parameters))
+    return radio, bus
+
+
+def measure(cls, payload, packets, rx_buffer=None):
+    radio, bus = make_radio(cls)
+
+    def tx():
+        radio.begin_packet()
+        radio.write(payload)
+
+    def rx():
+        bus.deliver(payload)
+        if rx_buffer is None:
+            return bytes(radio.read_payload())
+        n = radio.read_payload_into(rx_buffer)
+        return bytes(rx_buffer[:n])
+
+    results = {}
+    for name, op in (("tx", tx), ("rx", rx)):
+        op()  # warm up
+        bus.transactions = 0
+        bus.calls = 0
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        for _ in range(packets):
+            if name == "rx":
+                bus.deliver(payload)
+                if rx_buffer is None:
+                    radio.read_payload()
+                else:
+                    radio.read_payload_into(rx_buffer)
+            else:
+                op()
+        peak = tracemalloc.get_traced_memory()[1] - base
+        tracemalloc.stop()
+        results[name] = (bus.transactions / packets, bus.calls / packets, peak)
+
+    # correctness: what went into the FIFO and what came back out
+    tx()
+    sent = bytes(bus.fifo[:len(payload)])
+    received = rx()
+    return results, sent == payload and received == payload
+
+
+def main():
+    packets = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rx_buffer = bytearray(sx127x.MAX_PKT_LENGTH)
+
+    for size in (2, 32, 128):
+        payload = bytes((i * 7 + 3) & 0xFF for i in range(size))
+        old, old_ok = measure(LegacySX127x, payload, packets)
+        new, new_ok = measure(BurstSX127x, payload, packets, rx_buffer)
+        print(f"{size}-byte packet ({packets} packets)")
+        for name in ("tx", "rx"):
+            o = old[name]
+            n = new[name]
+            print(f"  {name} per-byte: {o[0]:6.1f} transactions {o[1]:6.1f} spi calls  peak heap {o[2]:6d} B")
+            print(f"  {name} burst:    {n[0]:6.1f} transactions {n[1]:6.1f} spi calls  peak heap {n[2]:6d} B")
+        print(f"  payload round-trip ok: per-byte={old_ok} burst={new_ok}")
+
+
+if __name__ == "__main__":
+    main()
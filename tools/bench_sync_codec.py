@@ -0,0 +1,181 @@
+# Host benchmark: bit-packed sync codec
+# Usage: python tools/bench_sync_codec.py [iterations]
+#
+# Checks the codec's properties exhaustively: every combination of field
+# values round-trips through encode_into/decode_into, out-of-range values are
+# masked to their field, every word with a foreign version is rejected
+# without touching the target, and contact health survives quantization to
+# within half a step. Then times encode and decode against the previous
+# 2-byte get_sync_packet/parse_sync_packet (which built a new bytes object
+# per sync; the codec fills preallocated buffers and SyncPackets) and
+# compares time on air at every ADR rate. Exits non-zero if a property does
+# not hold.
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+sim.install()
+
+from config import LORA_ADR_RATES, LORA_CODING_RATE, LORA_PREAMBLE_LENGTH, PET_STATES
+from lora_link import FRAME_OVERHEAD
+from lora_scheduler import time_on_air_us
+from sync_codec import (
+    SYNC_LEN, SYNC_VERSION, VERSION_SHIFT, SyncPacket, contact_percent, decode_into,
+    encode_into, quantize_contact,
+)
+
+FIELDS = ('device_id', 'state', 'error', 'contact', 'hearts', 'phase')
+
+
+class LegacyState:
+    """The previous PetState sync: [device_id, state], applied if the state is known"""
+
+    def __init__(self):
+        self.device_id = 1
+        self.current_state = 2
+        self.animation_frame = 0
+        self.is_dirty = False
+
+    def get_sync_packet(self):
+        return bytes([self.device_id & 0xFF, self.current_state & 0xFF])
+
+    def parse_sync_packet(self, packet):
+        if len(packet) >= 2:
+            state_id = packet[1]
+            if state_id in PET_STATES:
+                self.current_state = state_id
+                self.animation_frame = 0
+                self.is_dirty = True
+                return True
+        return False
+
+
+def fields(packet):
+    return tuple(getattr(packet, name) for name in FIELDS)
+
+
+def check_round_trip():
+    """Every field combination (four device ids) decodes to what was packed"""
+    out, back = SyncPacket(), SyncPacket()
+    buffer = bytearray(SYNC_LEN)
+    count = 0
+    for device_id in (0, 1, 0x7F, 0xFF):
+        for state in range(8):
+            for error in (False, True):
+                for contact in range(16):
+                    for hearts in range(4):
+                        for phase in range(4):
+                            out.device_id, out.state, out.error = device_id, state, error
+                            out.contact, out.hearts, out.phase = contact, hearts, phase
+                            if encode_into(buffer, out) != SYNC_LEN:
+                                return False, count
+                            if not decode_into(back, buffer) or fields(back) != fields(out):
+                                return False, count
+                            if back.version != SYNC_VERSION:
+                                return False, count
+                            count += 1
+    return True, count
+
+
+def check_masking():
+    """Out-of-range values are cut to their field width, neighbours intact"""
+    out, back = SyncPacket(), SyncPacket()
+    buffer = bytearray(SYNC_LEN)
+    for value in (4, 8, 16, 0x1FF, -1):
+        out.device_id, out.state, out.error = value, value, False
+        out.contact, out.hearts, out.phase = value, value, value
+        encode_into(buffer, out)
+        expected = (value & 0xFF, value & 7, False, value & 15, value & 3, value & 3)
+        if not decode_into(back, buffer) or fields(back) != expected:
+            return False
+    return True
+
+
+def check_rejects():
+    """Foreign versions and short bodies are refused, the target is untouched"""
+    back = SyncPacket()
+    back.state = 5
+    data = bytearray(SYNC_LEN)
+    rejected = 0
+    for word in range(1 << 16):
+        if word >> VERSION_SHIFT == SYNC_VERSION:
+            continue
+        data[1] = word >> 8
+        data[2] = word & 0xFF
+        if decode_into(back, data) or back.state != 5:
+            return False, rejected
+        rejected += 1
+    for short in (b"", b"\x01", b"\x01\x40"):
+        if decode_into(back, short):
+            return False, rejected
+        rejected += 1
+    return True, rejected
+
+
+def check_quantization():
+    """Worst contact health error after a round trip, in percent points"""
+    worst = max(abs(contact_percent(quantize_contact(p)) - p) for p in range(101))
+    stable = all(quantize_contact(contact_percent(q)) == q for q in range(16))
+    return worst <= 100 / 15 / 2 and stable, worst
+
+
+def timed(fn, iterations):
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - start)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    ok = True
+    passed, count = check_round_trip()
+    print(f"round trip: {count} field combinations: {passed}")
+    ok = ok and passed
+    passed = check_masking()
+    print(f"out-of-range values masked to their field: {passed}")
+    ok = ok and passed
+    passed, count = check_rejects()
+    print(f"foreign version / short body rejected, target untouched: {count} bodies: {passed}")
+    ok = ok and passed
+    passed, worst = check_quantization()
+    print(f"contact health 0-100 in 16 steps: worst error {worst} points: {passed}")
+    ok = ok and passed
+
+    legacy = LegacyState()
+    legacy_packet = legacy.get_sync_packet()
+    packet, back = SyncPacket(), SyncPacket()
+    packet.device_id, packet.state, packet.contact, packet.hearts = 1, 2, 11, 2
+    buffer = bytearray(SYNC_LEN)
+    encode_into(buffer, packet)
+    view = memoryview(buffer)
+
+    print(f"\n{iterations} calls each")
+    print(f"  {'codec':22} {'bytes':>5} {'encode/s':>10} {'decode/s':>10}")
+    for name, size, encode, decode in (
+        ("get/parse_sync_packet", len(legacy_packet),
+         legacy.get_sync_packet, lambda: legacy.parse_sync_packet(legacy_packet)),
+        ("encode/decode_into", SYNC_LEN,
+         lambda: encode_into(buffer, packet), lambda: decode_into(back, view)),
+    ):
+        print(f"  {name:22} {size:5d} {timed(encode, iterations):10.0f} {timed(decode, iterations):10.0f}")
+
+    print(f"\nTime on air of the framed sync ({FRAME_OVERHEAD} bytes framing + ADR control)")
+    for sf, bandwidth in LORA_ADR_RATES:
+        old, new = (time_on_air_us(n + FRAME_OVERHEAD + 1, sf, bandwidth, LORA_CODING_RATE,
+                                   LORA_PREAMBLE_LENGTH) / 1000 for n in (len(legacy_packet), SYNC_LEN))
+        print(f"  SF{sf}/{bandwidth / 1000:g}k: {old:7.1f} ms (state only) -> {new:7.1f} ms (all fields)")
+
+    print(f"\nAll properties hold: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+# Host benchmark: blocking LoRa send vs the duty-cycled TX scheduler
+# Usage: python tools/bench_tx_scheduler.py [seconds]
+#
+# A user mashes the button (a press every 0.3-0.8 s, wireless health topped
+# up so every press syncs) on one simulated pet at virtual time. The radio
+# model stays in TX for each packet's real time on air. Compares the old
+# send() (begin/write/end_packet, busy-waiting on TX_DONE inside the button
+# handler) with send() queueing into TxScheduler and the TX task polling for
+# TX_DONE. Reports the longest gap between rendered frames, packets on air
+# against presses, and airtime used against the duty-cycle budget.
+
+import contextlib
+import io
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+sim.install(virtual_time=True)
+
+from sim import clock, machine
+from config import ANIMATION_FRAME_MS, LORA_DUTY_CYCLE_PERCENT, LORA_DUTY_WINDOW_MS
+from utils.aio import asyncio
+
+
+def legacy_send(lora):
+    """The original LoRaCommunication.send: returns once TX_DONE is seen"""
+
+    def send(data):
+        lora.lora.begin_packet(implicit_header_mode=False)
+        lora.lora.write(data)
+        lora.lora.start_transmit()
+        while not lora.lora.tx_done():
+            clock.clock.advance(0.001)  # the busy-wait holds the CPU
+        lora.lora.receive()
+        return True
+
+    return send
+
+
+def run(seconds, blocking, rng):
+    machine.reset()
+    clock.use(clock.VirtualClock())
+    pet = sim.SimulatedPet()
+    pet.radio.timed_tx = True
+    app = pet.app
+    frames = []
+    update = app.graphics.update
+    handler = app.button.on_press
+    presses = []
+
+    def timed_update(*args, **kwargs):
+        frames.append(clock.clock.now())
+        return update(*args, **kwargs)
+
+    def topped_up_handler():
+        presses.append(clock.clock.now())
+        app.health.wireless_health = 100  # keep it out of the error state
+        handler()
+
+    app.graphics.update = timed_update
+    app.button.on_press = topped_up_handler
+    if blocking:
+        app.lora.send = legacy_send(app.lora)
+
+    async def masher():
+        while True:
+            await asyncio.sleep(rng.uniform(0.3, 0.8))
+            pet.press_button()
+
+    async def session():
+        task = asyncio.ensure_future(masher())
+        await app.run_async()
+        task.cancel()
+
+    sim.run(session(), seconds=seconds, stop=app.stop)
+    gaps = [b - a for a, b in zip(frames, frames[1:])]
+    airtime = sum(pet.radio.airtime(len(p)) for p in pet.radio.transmitted) / 1000000
+    return {
+        'presses': len(presses),
+        'sent': len(pet.radio.transmitted),
+        'coalesced': 0 if blocking else app.lora.scheduler.coalesced,
+        'max_gap_ms': max(gaps) * 1000 if gaps else 0.0,
+        'stalls': sum(1 for g in gaps if g * 1000 > 2 * ANIMATION_FRAME_MS),
+        'airtime': airtime,
+    }
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 120
+    budget = LORA_DUTY_WINDOW_MS * LORA_DUTY_CYCLE_PERCENT / 100 / 1000
+    window = LORA_DUTY_WINDOW_MS / 1000
+    allowed = budget + seconds * LORA_DUTY_CYCLE_PERCENT / 100
+    print(f"Button mashing for {seconds:g} s virtual; duty cycle {LORA_DUTY_CYCLE_PERCENT}% "
+          f"of {window:g} s = {budget:g} s airtime, {allowed:.1f} s allowed over the run "
+          f"(bucket starts full)")
+    print(f"  {'send':10} {'presses':>7} {'on air':>7} {'coalesced':>9} {'max gap':>9} "
+          f"{'stalls':>6} {'airtime':>8} {'of allowed':>10}")
+    for name, blocking in (("blocking", True), ("scheduler", False)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            s = run(seconds, blocking, random.Random(1))
+        print(f"  {name:10} {s['presses']:7d} {s['sent']:7d} {s['coalesced']:9d} "
+              f"{s['max_gap_ms']:7.0f}ms {s['stalls']:6d} {s['airtime']:7.1f}s "
+              f"{s['airtime'] / allowed * 100:9.0f}%")
+
+
+if __name__ == "__main__":
+    main()
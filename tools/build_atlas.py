@@ -0,0 +1,141 @@
+# Sprite Atlas Builder
+# Packs every sprite into one binary atlas file (see sprites/atlas.py) that
+# SpriteManager reads a frame at a time.
+# Usage: python tools/build_atlas.py [-o sprites/atlas.bin] [name=strip.png[:frame_width] ...]
+#
+# Sprites come from sprites/sprite_data.py, as they are stored there (raw,
+# or an RLE keyframe plus XOR deltas from tools/sprite_compress.py). Each
+# name=strip.png adds or replaces a sprite from a PNG holding its frames side
+# by side, frame_width pixels each (default: the whole image is one frame);
+# animations are compressed to a keyframe plus deltas. The changed rect of
+# every delta is computed here, so the device never scans a delta for it.
+
+import os
+import struct
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import sim
+
+sim.install()
+
+from sprites.atlas import (
+    MAGIC, VERSION, HEADER, SPRITE, FRAME, HEADER_SIZE, SPRITE_SIZE, FRAME_SIZE,
+    FORMAT_RAW, FORMAT_RLE, FORMAT_XOR,
+)
+from sprites.sprite_manager import delta_rect
+from sprite_compress import compress_frames, load_sprite_data
+
+ATLAS_PATH = os.path.join(ROOT, "sprites", "atlas.bin")
+
+FORMATS = {None: FORMAT_RAW, "rle": FORMAT_RLE, "xor": FORMAT_XOR}
+
+
+def png_frames(path, frame_width=None):
+    """
+    Cut a PNG strip into 1-bit frames (white = set pixel, LSB = left pixel)
+
+    Returns:
+        List of raw frame dictionaries
+    """
+    from PIL import Image
+
+    img = Image.open(path).convert("1")
+    width = frame_width or img.width
+    height = img.height
+    if img.width % width:
+        raise ValueError(f"{path}: {img.width} px is not a whole number of {width} px frames")
+    pixels = img.load()
+    frames = []
+    for left in range(0, img.width, width):
+        data = bytearray()
+        for y in range(height):
+            for x in range(0, width, 8):
+                byte = 0
+                for bit in range(min(8, width - x)):
+                    if pixels[left + x + bit, y] > 127:
+                        byte |= 1 << bit
+                data.append(byte)
+        frames.append({"width": width, "height": height, "data": bytes(data)})
+    return frames
+
+
+def pack(sprite_data):
+    """
+    Lay out an atlas file
+
+    Args:
+        sprite_data: {name: [frame dictionaries]} as in sprite_data.py
+
+    Returns:
+        The atlas bytes
+    """
+    sprites = bytearray()
+    names = bytearray()
+    records = []
+    payloads = bytearray()
+    for name, frames in sprite_data.items():
+        width = frames[0]["width"]
+        height = frames[0]["height"]
+        if not 0 < len(frames) <= 255 or width > 255 or height > 255:
+            raise ValueError(f"{name}: a sprite has 1-255 frames of up to 255x255")
+        encoded = name.encode()
+        sprites += struct.pack(SPRITE, len(frames), width, height, len(encoded))
+        names += encoded
+        size = ((width + 7) // 8) * height
+        for i, frame in enumerate(frames):
+            if (frame["width"], frame["height"]) != (width, height):
+                raise ValueError(f"{name}: every frame must be {width}x{height}")
+            fmt = FORMATS[frame.get("encoding")]
+            if fmt == FORMAT_XOR and i == 0:
+                raise ValueError(f"{name}: the first frame cannot be a delta")
+            data = bytes(frame["data"])
+            if fmt == FORMAT_RAW:
+                data = data[:size]  # only width x height bits are ever drawn
+            rect = delta_rect(data, width, height) if fmt == FORMAT_XOR else None
+            records.append((len(payloads), len(data), fmt, rect or (0, 0, 0, 0)))
+            payloads += data
+
+    start = HEADER_SIZE + len(sprites) + len(names) + len(records) * FRAME_SIZE
+    out = bytearray(struct.pack(HEADER, MAGIC, VERSION, len(sprite_data), len(records), len(names)))
+    out += sprites
+    out += names
+    for offset, length, fmt, rect in records:
+        out += struct.pack(FRAME, start + offset, length, fmt, *rect)
+    out += payloads
+    return bytes(out)
+
+
+def main():
+    args = sys.argv[1:]
+    path = ATLAS_PATH
+    if len(args) >= 2 and args[0] == "-o":
+        path = args[1]
+        args = args[2:]
+
+    sprite_data = load_sprite_data()
+    for arg in args:
+        name, _, source = arg.partition("=")
+        png, _, frame_width = source.partition(":")
+        if not name or not png:
+            print(f"Expected name=strip.png[:frame_width], got '{arg}'")
+            return 1
+        frames = png_frames(png, int(frame_width) if frame_width else None)
+        sprite_data[name] = compress_frames(frames) if len(frames) > 1 else frames
+
+    atlas = pack(sprite_data)
+    with open(path, "wb") as f:
+        f.write(atlas)
+
+    frames = sum(len(frames) for frames in sprite_data.values())
+    index = HEADER_SIZE + len(sprite_data) * SPRITE_SIZE + sum(len(n.encode()) for n in sprite_data)
+    index += frames * FRAME_SIZE
+    print(f"{path}: {len(sprite_data)} sprites, {frames} frames, "
+          f"{len(atlas)} bytes ({index} index + {len(atlas) - index} frame data)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
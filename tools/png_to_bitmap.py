@@ -16,7 +16,7 @@ def png_to_bitmap(input_path, output_name, width=32, height=32):
         height: Sprite height in pixels
     
     Returns:
-        Dictionary with sprite data
+        Tuple of (bitmap bytes, Python source for sprite_data.py)
     """
     try:
         img = Image.open(input_path).convert('1')  # Convert to 1-bit (black/white)
@@ -41,16 +41,22 @@ def png_to_bitmap(input_path, output_name, width=32, height=32):
                             byte_val |= (1 << bit)
                 bitmap_data.append(byte_val)
         
-        # Generate Python code
+        # Generate Python code (bytes literal, 16 bytes per line)
+        data_lines = "\n".join(
+            "            b'" + "".join(f"\\x{b:02x}" for b in bitmap_data[i:i + 16]) + "'"
+            for i in range(0, len(bitmap_data), 16)
+        )
         code = f"""
     "{output_name}": {{
         'width': {width},
         'height': {height},
-        'data': [{', '.join(f'0x{b:02X}' for b in bitmap_data)}]
+        'data': (
+{data_lines}
+        )
     }},
 """
         
-        return bitmap_data, code
+        return bytes(bitmap_data), code
     
     except Exception as e:
         print(f"Error processing image: {e}")
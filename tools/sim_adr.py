@@ -0,0 +1,113 @@
+# Host simulation: adaptive data rate over a path-loss channel
+# Usage: python tools/sim_adr.py [distance_m ...] [--seconds S] [--interval S]
+#
+# Two pets at a fixed distance share a sim.channel.Channel (log-distance path
+# loss, 20 dBm). Each sends a state sync at exponentially distributed
+# intervals. Runs every distance twice: with the fixed SF/bandwidth from
+# config.py and with LinkAdapter. A last pair of runs starts the pets 1 m
+# apart and moves them --walk metres apart halfway through, which needs the
+# fallback to the robust rate. Reports the rate the link ends on, airtime
+# per packet, delivery ratio, sync latency and rate changes.
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+sim.install(virtual_time=True)
+
+from sim import clock, machine
+from sim.app import SimulatedPet
+from sim.channel import Channel
+from sim.network import traffic
+from config import LORA_ADR_RATES
+from utils.aio import asyncio
+
+DEFAULT_DISTANCES = (1, 1000, 5000, 10000, 20000)
+
+
+def run(distance, adr, seconds, interval, seed, walk=None):
+    machine.reset()
+    clock.use(clock.VirtualClock())
+    rng = random.Random(seed)
+    channel = Channel(seed=seed)
+    pets = []
+    for i, position in enumerate(((0.0, 0.0), (float(distance), 0.0))):
+        pet = SimulatedPet(device_id=i + 1, render=False)
+        if not adr:
+            pet.app.lora.adr = None
+        channel.add(pet.radio, position)
+        handle = pet.app._handle_packet
+        send = pet.app.lora.send
+
+        def tracked(data, handle=handle, radio=pet.radio):
+            channel.handled(radio, data)
+            handle(data)
+
+        def submitted(data, send=send, radio=pet.radio):
+            channel.submitted(radio)
+            return send(data)
+
+        pet.app._handle_packet = tracked
+        pet.app.lora.send = submitted
+        pets.append(pet)
+
+    def walk_away():
+        channel.nodes[1].position = (walk, 0.0)
+        channel._links.clear()
+
+    async def session():
+        if walk is not None:
+            asyncio.get_event_loop().call_later(seconds / 2, walk_away)
+        await asyncio.gather(*(pet.app.run_async() for pet in pets),
+                             *(traffic(pet, interval, rng) for pet in pets))
+
+    def stop():
+        for pet in pets:
+            pet.app.stop()
+
+    sim.run(session(), seconds=seconds, stop=stop)
+    stats = channel.stats(seconds)
+    lora = pets[0].app.lora
+    stats['rate'] = LORA_ADR_RATES[lora.rate]
+    stats['airtime_ms'] = channel.airtime * 1000 / max(channel.transmissions, 1)
+    stats['delivery'] = channel.delivered / max(channel.transmissions, 1)
+    stats['changes'] = sum(pet.app.lora.adr.rate_changes for pet in pets) if adr else 0
+    stats['fallbacks'] = sum(pet.app.lora.adr.fallbacks for pet in pets) if adr else 0
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaptive data rate over a simulated link")
+    parser.add_argument("distances", type=float, nargs="*", default=DEFAULT_DISTANCES)
+    parser.add_argument("--seconds", type=float, default=600, help="virtual run time")
+    parser.add_argument("--interval", type=float, default=20, help="mean seconds between syncs per pet")
+    parser.add_argument("--walk", type=float, default=20000, help="metres apart after half the run")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"2 pets, one sync per pet every {args.interval:g} s, {args.seconds:g} s virtual")
+    print(f"{'distance':>9} {'mode':6} {'final rate':>12} {'sent':>5} {'air/pkt':>8} {'deliv':>6} "
+          f"{'lat mean':>9} {'changes':>7} {'fallback':>8}")
+    runs = [(distance, None) for distance in args.distances] + [(1, args.walk)]
+    for distance, walk in runs:
+        for adr in (False, True):
+            with contextlib.redirect_stdout(io.StringIO()):
+                s = run(distance, adr, args.seconds, args.interval, args.seed, walk)
+            sf, bandwidth = s['rate']
+            where = f"{distance:.0f}m" if walk is None else f"->{walk / 1000:g}km"
+            mean = f"{s['latency_mean'] * 1000:7.0f}ms" if s['latency_mean'] is not None else "      -  "
+            print(f"{where:>9} {'adr' if adr else 'fixed':6} "
+                  f"{f'SF{sf}/{bandwidth / 1000:g}k':>12} {s['transmissions']:5d} "
+                  f"{s['airtime_ms']:6.0f}ms {s['delivery'] * 100:5.0f}% {mean:>9} "
+                  f"{s['changes']:7d} {s['fallbacks']:8d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# Host simulation: animation frame pacing and button debounce on ticks_ms
+# Usage: python tools/sim_frame_pacing.py [seconds]
+#
+# Runs VirtualPetApp on virtual time with time.time() in whole seconds, as
+# on the ESP32 port. Counts animation frame changes per second against the
+# rate of the happy state's timeline (the pet is kept happy), then scripts
+# button presses (clean taps, a long hold and a bouncing contact) and counts
+# handler calls. Last, disassembles
+# the code run on every loop iteration and reports any time.time() call,
+# true division or float constant, i.e. anything that makes a float. Exits
+# non-zero if a check fails.
+
+import contextlib
+import dis
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+sim.install(virtual_time=True)
+
+from config import BUTTON_DEBOUNCE_MS, BUTTON_PIN
+from utils.aio import sleep_ms
+
+# (name, level changes as (ms after the previous change, level), presses expected)
+BUTTON_SCRIPTS = (
+    ("5 taps, 30 ms each", [(200, 0), (30, 1)] * 5, 5),
+    ("one 600 ms hold", [(200, 0), (600, 1)], 1),
+    ("bouncing press", [(200, 0), (3, 1), (2, 0), (4, 1), (2, 0), (150, 1), (3, 0), (2, 1)], 1),
+    ("taps 30 ms apart", [(200, 0), (30, 1), (30, 0), (30, 1)], 1),
+)
+
+
+def make_pet():
+    with contextlib.redirect_stdout(io.StringIO()):
+        pet = sim.SimulatedPet()
+    frames = []
+    animation = pet.app.pet_state.animation
+    update = animation.update
+
+    def counted(now):
+        changed = update(now)
+        if changed:
+            frames.append(1)
+        return changed
+
+    animation.update = counted
+    pet.app.health.on_wireless_sync = lambda: True  # stay out of the error state
+    return pet, frames
+
+
+def frame_rate(seconds):
+    pet, frames = make_pet()
+    # stay happy: contact health decays without contact, and other states
+    # have other timelines (and a transition clip on the way)
+    pet.app.pet_state.update_state_from_health = lambda contact_health: None
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim.run(pet.app.run_async(), seconds=seconds, stop=pet.app.stop)
+    return len(frames) / seconds
+
+
+def button_presses(changes):
+    pet, _ = make_pet()
+    presses = []
+    pet.app.button.on_press = lambda: presses.append(1)
+    pin = pet.board.pin(BUTTON_PIN)
+
+    async def script():
+        for delay, level in changes:
+            await sleep_ms(delay)
+            pin.drive(level)
+        await sleep_ms(200)
+        pet.app.stop()
+
+    async def session():
+        from utils.aio import asyncio
+        await asyncio.gather(pet.app.run_async(), script())
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim.run(session())
+    return len(presses)
+
+
+def float_sources():
+    """Float-making instructions in the per-iteration code paths"""
+    from graphics import GraphicsEngine
+    from health_system import HealthSystem
+    from main import VirtualPetApp
+    from pet_state import PetState
+    from power_manager import PowerManager, PowerMeter
+    from sprites.animation import Animator, Timeline
+    from sprites.atlas import SpriteAtlas
+    from sprites.sprite_manager import SpriteManager
+    from utils import clock
+    from utils.input_events import EdgeRing, InputButton, InputManager
+
+    functions = (
+        GraphicsEngine.update, HealthSystem.update, HealthSystem.next_change_ms,
+        HealthSystem._next_change, HealthSystem._contact_now, HealthSystem.contact_health.fget,
+        HealthSystem.get_contact_health_percent,
+        HealthSystem.get_contact_health_pixels, HealthSystem.get_wireless_signal_sprites,
+        EdgeRing.push, EdgeRing.pop, InputButton.feed, InputButton.advance, InputButton._change,
+        InputButton.next_deadline, InputManager._on_edge, InputManager.process,
+        InputManager.next_deadline_ms, VirtualPetApp._check_inputs, VirtualPetApp._check_error_timeout,
+        PetState.update_state_from_health, PetState.update_animation, PetState.nearby,
+        PowerManager.wait, PowerManager.idle_ms, PowerManager.step, PowerManager.next_wait,
+        PowerManager.sleep, PowerMeter.set, PowerMeter.radio,
+        Timeline.entry, Timeline.remaining, Animator.update, Animator.next_change_ms, Animator._show,
+        SpriteManager.get_frame, SpriteManager._load, SpriteManager._unlink,
+        SpriteManager._push_front, SpriteManager.step_rect, SpriteAtlas.payload,
+        clock.now, clock.elapsed, clock.clamp_since,
+    )
+    found = []
+    for fn in functions:
+        code = fn.__code__
+        names = [i.argval for i in dis.get_instructions(code)]
+        for i, ins in enumerate(dis.get_instructions(code)):
+            if ins.opname == "LOAD_CONST" and isinstance(ins.argval, float):
+                found.append(f"{fn.__qualname__}: float constant {ins.argval}")
+            elif ins.opname == "BINARY_OP" and ins.argrepr in ("/", "/="):
+                found.append(f"{fn.__qualname__}: true division")
+            elif ins.argval == "time" and i + 1 < len(names) and names[i + 1] == "time":
+                found.append(f"{fn.__qualname__}: time.time()")
+    return found
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    ok = True
+    happy = make_pet()[0].app.pet_state.animation.clips["happy"]
+    target = 1000 * len(happy) / happy.period
+    rate = frame_rate(seconds)
+    passed = abs(rate - target) <= 0.1 * target
+    print(f"animation: {rate:.1f} frames/s over {seconds:.0f} s virtual (target {target:.0f}): {passed}")
+    ok = ok and passed
+
+    print(f"\nbutton, {BUTTON_DEBOUNCE_MS} ms debounce")
+    for name, changes, expected in BUTTON_SCRIPTS:
+        presses = button_presses(changes)
+        passed = presses == expected
+        print(f"  {name:20} {presses} press(es), expected {expected}: {passed}")
+        ok = ok and passed
+
+    found = float_sources()
+    print(f"\nfloat sources in per-iteration code: {len(found)}")
+    for line in found:
+        print(f"  {line}")
+    ok = ok and not found
+
+    print(f"\nAll checks pass: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
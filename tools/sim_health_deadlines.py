@@ -0,0 +1,188 @@
+# Host simulation: lazy fixed-point health vs polled decay
+# Usage: python tools/sim_health_deadlines.py [seconds]
+#
+# Drives the original HealthSystem (float decay recomputed by update(),
+# polled, percent and pixels rounded down by int()) and the lazy one
+# through the same random syncs and contacts on virtual time, one
+# millisecond at a time, and compares what the screen shows: hearts,
+# contact bar pixels and mood. The original formula is evaluated exactly;
+# in floats it lands a millisecond early where elapsed / timeout * 100 is
+# a whole number, which is counted but not a failure. It also checks the
+# predicted deadline: update() must report every visible change on the
+# millisecond it happens, and the tool counts wakeups where nothing
+# changed. Then it runs VirtualPetApp for the same time and counts the
+# health task's mood and HUD passes against the old fixed 250 ms tick.
+# Exits non-zero if a check fails.
+
+import contextlib
+import io
+import os
+import random
+import sys
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+virtual = sim.install(virtual_time=True)
+
+from config import MOOD_THRESHOLDS
+from health_system import HealthSystem
+from utils import clock
+
+BAR_HEIGHT = 32
+OLD_TICK_MS = 250  # the health task's period before deadlines
+
+
+class PolledHealth:
+    """
+    The original HealthSystem: time.time() seconds, decay recomputed by
+    every update() as max(0, 100 - elapsed / timeout * 100), percent and
+    pixels truncated with int()
+
+    Args:
+        exact: Evaluate in Fraction rather than float arithmetic
+    """
+
+    def __init__(self, exact=True):
+        self.number = Fraction if exact else float
+        self.wireless_health = 100
+        self.contact_health = 100
+        self.last_contact_update = self.time()
+        self.contact_timeout = self.number(30)
+
+    def time(self):
+        return self.number(clock.now()) / 1000
+
+    def on_wireless_sync(self):
+        if self.wireless_health <= 0:
+            return False
+        self.wireless_health = max(0, self.wireless_health - 34)
+        self.contact_health = min(100, self.contact_health + 20)
+        self.last_contact_update = self.time()
+        return True
+
+    def on_physical_contact(self):
+        self.wireless_health = 100
+        self.contact_health = 100
+        self.last_contact_update = self.time()
+
+    def update(self):
+        contact_elapsed = self.time() - self.last_contact_update
+        self.contact_health = max(0, 100 - (contact_elapsed / self.contact_timeout * 100))
+
+    def get_contact_health_percent(self):
+        return int(self.contact_health)
+
+    def get_wireless_signal_sprites(self):
+        if self.wireless_health >= 67:
+            return 3
+        elif self.wireless_health >= 34:
+            return 2
+        elif self.wireless_health > 0:
+            return 1
+        return 0
+
+    def get_contact_health_pixels(self, max_height=32):
+        return int((self.contact_health / self.number(100)) * max_height)
+
+
+def mood(percent):
+    for state, threshold in enumerate(MOOD_THRESHOLDS):
+        if percent >= threshold:
+            return state
+    return len(MOOD_THRESHOLDS)
+
+
+def visible(health):
+    return (health.get_wireless_signal_sprites(), health.get_contact_health_pixels(BAR_HEIGHT),
+            mood(health.get_contact_health_percent()))
+
+
+def compare(seconds, rng):
+    """
+    Step the models 1 ms at a time; returns (mismatches, float mismatches,
+    missed, spurious, wakes, changes)
+    """
+    old, rounded, new = PolledHealth(), PolledHealth(exact=False), HealthSystem()
+    new.update()
+    shown = visible(new)
+    mismatches = rounding = missed = spurious = wakes = changes = 0
+    for _ in range(int(seconds * 1000)):
+        virtual.advance(0.001)
+        event = False
+        if rng.random() < 1 / 20000:
+            old.on_physical_contact()
+            rounded.on_physical_contact()
+            new.on_physical_contact()
+            event = True
+        elif rng.random() < 1 / 6000:
+            event = old.on_wireless_sync() | rounded.on_wireless_sync() | new.on_wireless_sync()
+        old.update()
+        rounded.update()
+        due = new.update()
+        now = visible(new)
+        if now != visible(old):
+            mismatches += 1
+        if now != visible(rounded):
+            rounding += 1
+        if due:
+            wakes += 1
+        if now != shown:
+            changes += 1
+            if not due:
+                missed += 1
+        elif due and not event:
+            spurious += 1
+        shown = now
+    return mismatches, rounding, missed, spurious, wakes, changes
+
+
+def app_passes(seconds):
+    """Health task passes in a scripted VirtualPetApp run"""
+    from sim.__main__ import session
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        pet = sim.SimulatedPet(render=False)
+    health = pet.app.health
+    passes = []
+    update = health.update
+
+    def counted():
+        due = update()
+        passes.append(due)
+        return due
+
+    health.update = counted
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim.run(session(pet, seconds), seconds=seconds, stop=pet.app.stop)
+    return len(passes), sum(passes)
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 300
+    rng = random.Random(1)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        mismatches, rounding, missed, spurious, wakes, changes = compare(seconds, rng)
+    print(f"{seconds:.0f} s virtual, 1 ms steps, random syncs and contacts")
+    print(f"  hearts/bar/mood differing from the original polled model: {mismatches} ms "
+          f"({rounding} ms from its float evaluation, off by one ulp on exact boundaries)")
+    print(f"  visible changes {changes}, reported by update() on time: {changes - missed}, missed {missed}")
+    print(f"  update() True {wakes} times, {spurious} with nothing visible changed")
+    ok = mismatches == 0 and missed == 0
+
+    polled = int(seconds * 1000) // OLD_TICK_MS
+    calls, due = app_passes(seconds)
+    print(f"\nVirtualPetApp, {seconds:.0f} s scripted (python -m sim)")
+    print(f"  health task: {calls} wakeups, {due} mood/HUD passes; "
+          f"polling every {OLD_TICK_MS} ms ran {polled}")
+    print(f"  recomputations avoided: {polled - due} ({100 * (polled - due) / polled:.0f}%)")
+
+    print(f"\nAll checks pass: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+# Host simulation: replay recorded button edge traces through the input subsystem
+# Usage: python tools/sim_input_trace.py [taps]
+#
+# Each trace is a list of (ms, level) edges on an active-low input, the form
+# a logic analyser capture of the pin takes, with the press/long/double
+# events it must produce. Traces are replayed twice: straight into an
+# InputButton (feed/advance), and live on virtual time by driving BUTTON_PIN
+# and ONEWIRE_PIN of a running VirtualPetApp, where the pin IRQ fills the
+# edge ring and the input task classifies. Both must give the expected
+# events at the expected ticks. Last, random short taps are played to the
+# IRQ path and to the previous polled handler (level read every 10 ms in
+# the input task, or every 50 ms in the original main loop) to count missed
+# presses. Exits non-zero if a check fails.
+
+import contextlib
+import io
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+sim.install(virtual_time=True)
+
+from config import BUTTON_DEBOUNCE_MS, BUTTON_PIN, DOUBLE_PRESS_MS, LONG_PRESS_MS, ONEWIRE_PIN
+from utils import clock
+from utils.input_events import InputButton
+
+PRESS, LONG, DOUBLE = "press", "long", "double"
+
+# name, edges (ms, level), expected events (ms, kind)
+TRACES = (
+    ("clean tap", [(100, 0), (180, 1)], [(100, PRESS)]),
+    ("4 ms tap", [(100, 0), (104, 1)], [(100, PRESS)]),
+    ("bouncing press and release",
+     [(100, 0), (101, 1), (103, 0), (104, 1), (106, 0), (300, 1), (301, 0), (302, 1)],
+     [(100, PRESS)]),
+    ("bounce settling released", [(100, 0), (130, 1), (132, 0), (133, 1)], [(100, PRESS)]),
+    ("long press", [(100, 0), (1100, 1)], [(100, PRESS), (100 + LONG_PRESS_MS, LONG)]),
+    ("long then quick tap", [(100, 0), (1000, 1), (1100, 0), (1160, 1)],
+     [(100, PRESS), (100 + LONG_PRESS_MS, LONG), (1100, PRESS)]),
+    ("double press", [(100, 0), (160, 1), (300, 0), (360, 1)], [(100, PRESS), (300, DOUBLE)]),
+    ("triple press", [(100, 0), (160, 1), (300, 0), (360, 1), (500, 0), (560, 1)],
+     [(100, PRESS), (300, DOUBLE), (500, PRESS)]),
+    ("two presses apart", [(100, 0), (160, 1), (160 + DOUBLE_PRESS_MS + 1, 0),
+                           (220 + DOUBLE_PRESS_MS + 1, 1)],
+     [(100, PRESS), (160 + DOUBLE_PRESS_MS + 1, PRESS)]),
+    ("re-press inside debounce", [(100, 0), (200, 1), (200 + BUTTON_DEBOUNCE_MS - 10, 0),
+                                  (400, 1)],
+     [(100, PRESS), (200 + BUTTON_DEBOUNCE_MS - 10 + BUTTON_DEBOUNCE_MS, DOUBLE)]),
+)
+
+
+def watch(button, events, base=0):
+    button.on_press = lambda: events.append((button.event_ticks - base, PRESS))
+    button.on_long = lambda: events.append((button.event_ticks - base, LONG))
+    button.on_double = lambda: events.append((button.event_ticks - base, DOUBLE))
+
+
+def replay(edges):
+    """Feed a trace straight into an InputButton"""
+    button = InputButton(BUTTON_DEBOUNCE_MS, LONG_PRESS_MS, DOUBLE_PRESS_MS)
+    events = []
+    watch(button, events)
+    for ms, level in edges:
+        button.feed(ms, level)
+    button.advance(edges[-1][0] + LONG_PRESS_MS + DOUBLE_PRESS_MS)
+    return events
+
+
+def replay_live(edges, pin_id):
+    """Drive the trace on a running VirtualPetApp's pin"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        pet = sim.SimulatedPet(render=False)
+    app = pet.app
+    button = app.button if pin_id == BUTTON_PIN else app.contact_button
+    pin = pet.board.pin(pin_id)
+    events = []
+
+    async def script():
+        from utils.aio import asyncio, sleep_ms
+
+        base = clock.now()
+        watch(button, events, base)
+        loop = asyncio.get_event_loop()
+        for ms, level in edges:
+            # mid-millisecond, so ticks_ms() in the IRQ reads exactly base + ms
+            loop.call_at((base + ms + 0.5) / 1000, pin.drive, level)
+        await sleep_ms(edges[-1][0] + LONG_PRESS_MS + DOUBLE_PRESS_MS)
+        app.stop()
+
+    async def session():
+        from utils.aio import asyncio
+
+        await asyncio.gather(app.run_async(), script())
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim.run(session())
+    return events, app.inputs.ring.dropped
+
+
+def taps(count, rng):
+    """Random clean taps of 2-40 ms, 150-400 ms apart"""
+    edges = []
+    t = 100
+    for _ in range(count):
+        width = rng.randint(2, 40)
+        edges.append((t, 0))
+        edges.append((t + width, 1))
+        t += width + rng.randint(150, 400)
+    return edges
+
+
+def polled_presses(edges, period_ms, phase):
+    """The previous handler: level read every period_ms, press on a stable edge"""
+    level_at = 1
+    pressed = False
+    last_change = None
+    presses = 0
+    i = 0
+    t = phase
+    end = edges[-1][0] + period_ms
+    while t <= end:
+        while i < len(edges) and edges[i][0] <= t:
+            level_at = edges[i][1]
+            i += 1
+        now_pressed = level_at == 0
+        if now_pressed != pressed:
+            if now_pressed and (last_change is None or t - last_change > BUTTON_DEBOUNCE_MS):
+                presses += 1
+            pressed = now_pressed
+            last_change = t
+        t += period_ms
+    return presses
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(1)
+
+    ok = True
+    print(f"debounce {BUTTON_DEBOUNCE_MS} ms, long press {LONG_PRESS_MS} ms, double press {DOUBLE_PRESS_MS} ms")
+    print(f"  {'trace':28} {'replay':7} {'button':7} {'contact':7}")
+    for name, edges, expected in TRACES:
+        direct = replay(edges) == expected
+        live_button, _ = replay_live(edges, BUTTON_PIN)
+        live_contact, _ = replay_live(edges, ONEWIRE_PIN)
+        button_ok = live_button == expected
+        contact_ok = live_contact == expected
+        print(f"  {name:28} {str(direct):7} {str(button_ok):7} {str(contact_ok):7}")
+        if not (direct and button_ok and contact_ok):
+            print(f"    expected {expected}\n    replay   {replay(edges)}\n    live     {live_button}")
+        ok = ok and direct and button_ok and contact_ok
+
+    edges = taps(count, rng)
+    events, dropped = replay_live(edges, BUTTON_PIN)
+    seen = sum(1 for _, kind in events if kind != LONG)
+    print(f"\n{count} taps of 2-40 ms (presses seen, missed)")
+    print(f"  pin IRQ + edge ring:      {seen:4d} {count - seen:4d}  (ring drops {dropped})")
+    ok = ok and seen == count
+    for period in (10, 50):
+        seen = polled_presses(edges, period, rng.randrange(period))
+        print(f"  polled every {period:2d} ms:      {seen:4d} {count - seen:4d}")
+
+    print(f"\nAll checks pass: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+# Host simulation: OneWire contact sensing, blocking reset vs phased state machine
+# Usage: python tools/sim_onewire_timing.py [checks]
+#
+# First times one contact check on the host clock for the previous
+# reset_detect(), which slept through the 480 us reset pulse and busy-polled
+# the presence window, and for OneWireContact.step(), which spreads the same
+# exchange over three scheduler ticks: that difference is the time taken out
+# of the cooperative loop per check. Then, on virtual time, plays a contact
+# partner that answers each reset with a presence pulse of varying delay,
+# width and pin IRQ latency while a render task stalls the loop, and checks
+# every pulse is detected (and no absent or out-of-window one is). Last,
+# runs VirtualPetApp with ONEWIRE_PRESENCE on and the partner touching for
+# a few seconds. Exits non-zero if a check fails.
+
+import contextlib
+import io
+import os
+import sys
+import time as host_time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+from sim.clock import RealClock, VirtualClock, use
+
+sim.install()
+
+import time
+
+from config import ONEWIRE_PIN
+from utils.onewire_contact import OneWireContact
+
+
+class BlockingContact:
+    """The previous reset_detect(): sleeps and busy-polls inside one call"""
+
+    def __init__(self, pin):
+        self.pin = pin
+
+    def reset_detect(self):
+        self.pin.value(0)
+        time.sleep_us(480)
+        self.pin.value(1)
+        time.sleep_us(65)
+        start = time.ticks_us()
+        while time.ticks_diff(time.ticks_us(), start) < 240:
+            if self.pin.value() == 0:
+                return True
+        return False
+
+
+def make_board(line):
+    """A board with the contact line; line: 'absent' or 'shorted'"""
+    board = sim.Board()
+    board.activate()
+    with contextlib.redirect_stdout(io.StringIO()):
+        contact = OneWireContact(ONEWIRE_PIN, sample_ms=0)
+    contact.contact_debounce_ms = 0
+    pin = contact.pin
+    if line == "shorted":
+        def listener(level):
+            if level:
+                pin._value = 0  # released, but the contact keeps it low
+        board.pin_listeners[ONEWIRE_PIN] = listener
+    return contact
+
+
+def host_cost(line, checks):
+    """Mean host microseconds per check: (blocking, phased, steps per check)"""
+    use(RealClock())
+    contact = make_board(line)
+    blocking = BlockingContact(contact.pin)
+    found = 0
+    start = host_time.perf_counter()
+    for _ in range(checks):
+        found += blocking.reset_detect()
+    old = (host_time.perf_counter() - start) / checks * 1e6
+
+    inside = 0.0
+    steps = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        while contact.checks < checks:
+            start = host_time.perf_counter()
+            delay = contact.step()
+            inside += host_time.perf_counter() - start
+            steps += 1
+            host_time.sleep(delay / 1000)  # the loop runs other tasks meanwhile
+    new = inside / checks * 1e6
+    expected = checks if line == "shorted" else 0
+    ok = found == expected and contact.presences == expected
+    return old, new, steps / checks, ok
+
+
+class Partner:
+    """
+    A pet at the other end of the contact: answers every reset pulse with a
+    presence pulse delay_us after the release, width_us long, which the pin
+    IRQ sees latency_us late
+    """
+
+    def __init__(self, pin, delay_us, width_us, latency_us):
+        self.pin = pin
+        self.delay = delay_us / 1e6
+        self.width = width_us / 1e6
+        self.latency = latency_us / 1e6
+        self.low_at = None
+        self.touching = True
+        self.pulses = 0
+        pin.board.pin_listeners[pin.id] = self.listener
+
+    def listener(self, level):
+        from utils.aio import asyncio
+
+        now = clock_now()
+        if not level:
+            self.low_at = now
+            return
+        if not self.touching or self.low_at is None or now - self.low_at < 480e-6:
+            return
+        loop = asyncio.get_event_loop()
+        loop.call_at(now + self.delay, self.fall)
+        loop.call_at(now + self.delay + self.width, self.rise)
+        self.pulses += 1
+
+    def fall(self):
+        from utils.aio import asyncio
+
+        self.pin._value = 0
+        asyncio.get_event_loop().call_later(self.latency, self.fire)
+
+    def fire(self):
+        if self.pin.handler:
+            self.pin.handler(self.pin)
+
+    def rise(self):
+        self.pin._value = 1
+
+
+def clock_now():
+    return sim.clock.clock.now()
+
+
+def presence_run(delay_us, width_us, latency_us, checks=20, stall_ms=20):
+    """Presences detected by step() against the partner's pulses"""
+    virtual = use(VirtualClock())
+    board = sim.Board()
+    board.activate()
+    with contextlib.redirect_stdout(io.StringIO()):
+        contact = OneWireContact(ONEWIRE_PIN)
+    contact.contact_debounce_ms = 0
+    partner = Partner(contact.pin, delay_us, width_us, latency_us)
+
+    async def sensing():
+        from utils.aio import sleep_ms
+
+        while contact.checks < checks:
+            await sleep_ms(contact.step())
+
+    async def render():
+        from utils.aio import sleep_ms
+
+        while contact.checks < checks:
+            virtual.advance(stall_ms / 1000)  # a frame that blocks the loop
+            await sleep_ms(7)
+
+    async def session():
+        from utils.aio import asyncio
+
+        await asyncio.gather(sensing(), render())
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim.run(session())
+    return contact.presences, partner.pulses
+
+
+def app_run(seconds=10, touch=(3, 6)):
+    """VirtualPetApp with OneWire sensing: contact callbacks inside/outside the touch"""
+    use(VirtualClock())
+    import main
+
+    main.ONEWIRE_PRESENCE = True
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            pet = sim.SimulatedPet(render=False)
+    finally:
+        main.ONEWIRE_PRESENCE = False
+    app = pet.app
+    partner = Partner(app.contact.pin, 30, 120, 50)
+    partner.touching = False
+    calls = []
+    on_contact = app.health.on_physical_contact
+
+    def counted():
+        calls.append(clock_now())
+        on_contact()
+
+    app.health.on_physical_contact = counted
+
+    async def script():
+        from utils.aio import sleep_ms
+
+        await sleep_ms(touch[0] * 1000)
+        partner.touching = True
+        await sleep_ms((touch[1] - touch[0]) * 1000)
+        partner.touching = False
+        await sleep_ms((seconds - touch[1]) * 1000)
+        app.stop()
+
+    async def session():
+        from utils.aio import asyncio
+
+        await asyncio.gather(app.run_async(), script())
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim.run(session())
+    inside = sum(1 for t in calls if touch[0] <= t <= touch[1] + 0.2)
+    return inside, len(calls) - inside, app.contact.checks
+
+
+def main():
+    checks = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    ok = True
+    print(f"host time per contact check, {checks} checks")
+    print(f"  {'line':8} {'blocking':>10} {'phased':>10} {'steps':>6}  (us in the loop per check)")
+    for line in ("absent", "shorted"):
+        old, new, steps, passed = host_cost(line, checks)
+        print(f"  {line:8} {old:10.0f} {new:10.1f} {steps:6.1f}  detections correct: {passed}")
+        print(f"  {'':8} at 10 checks/s: {old * 10 / 1000:.2f} ms/s blocked -> {new * 10 / 1000:.3f} ms/s")
+        ok = ok and passed
+
+    print("\npresence pulses vs detections (virtual time, a 20 ms render stall every 27 ms)")
+    print(f"  {'delay':>5} {'width':>5} {'irq lag':>7} {'pulses':>6} {'found':>5}")
+    for delay in (15, 30, 60):
+        for width in (60, 120, 240):
+            for latency in (0, 50, 150):
+                found, pulses = presence_run(delay, width, latency)
+                passed = found == pulses == 20
+                if not passed or (width == 120 and latency == 50):
+                    print(f"  {delay:5d} {width:5d} {latency:7d} {pulses:6d} {found:5d}  {passed}")
+                ok = ok and passed
+    if ok:
+        print("  (other combinations: all pulses found)")
+
+    found, pulses = presence_run(600, 120, 0)
+    passed = found == 0
+    print(f"  pulse 600 us after the release (outside the window): {found} found: {passed}")
+    ok = ok and passed
+
+    inside, outside, sampled = app_run()
+    passed = inside > 0 and outside == 0
+    print(f"\napp, touching 3-6 s of 10 s: {sampled} checks, {inside} contact(s) while touching, "
+          f"{outside} otherwise: {passed}")
+    ok = ok and passed
+
+    print(f"\nAll checks pass: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+# Host simulation: power manager time-in-state and estimated current
+# Usage: python tools/sim_power.py [seconds]
+#
+# Runs VirtualPetApp on virtual time with the button pressed twice and a
+# peer sync arriving every 60 s (from 30 s), under four power settings:
+# always on (no light sleep, no display timeouts), light sleep only, light
+# sleep with display dimming and turn-off, and the same with the radio
+# sniffing while the display is off. Each drawn frame is charged
+# FRAME_COST_MS of CPU time (the virtual clock otherwise makes drawing
+# free) and each light-sleep wakeup WAKE_COST_MS. The esp32 module is the
+# ESP32-C3's (sim/esp32.py), which has no EXT wakeup, so as on the device
+# every sleep is capped at the power manager's wake_poll_ms and inputs are
+# seen on those timer wakeups. Each sync is played in after its wake-up
+# preamble, so a sniffing radio has to catch it with a CAD. Prints the
+# PowerMeter's time in state and estimated mA per component, and checks it
+# against what the simulator itself saw: machine.lightsleep() time, the
+# SX1278 model's mode times and the SSD1306 model's on/contrast commands.
+# Also checks that every press and sync still got through. Exits non-zero
+# if a check fails.
+
+import asyncio
+import contextlib
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+sim.install(virtual_time=True)
+
+from sim import clock as sim_clock, machine
+from sim.sx1278 import MODE_CAD, MODE_RX_CONTINUOUS, MODE_RX_SINGLE, MODE_SLEEP, MODE_STDBY, MODE_TX
+from power_manager import (
+    COMPONENT_NAMES, CPU, DISPLAY, RADIO, STATE_NAMES, CPU_LIGHT_SLEEP,
+    DISPLAY_ON, DISPLAY_DIM, DISPLAY_OFF,
+    RADIO_METER_RX, RADIO_METER_CAD, RADIO_METER_TX, RADIO_METER_SLEEP,
+)
+from utils import clock
+
+FRAME_COST_MS = 8  # CPU time of one drawn frame on the device (estimate)
+WAKE_COST_MS = 1  # CPU time of one light-sleep wakeup and the pass back to sleep (estimate)
+PRESSES_AT = (5, 200)  # s
+SYNC_EVERY = 60  # s
+
+# name, main.py settings
+SETTINGS = (
+    ("always on", dict(POWER_LIGHTSLEEP=False, POWER_DIM_MS=0, POWER_OFF_MS=0)),
+    ("light sleep", dict(POWER_DIM_MS=0, POWER_OFF_MS=0)),
+    ("+ display dim/off", dict()),
+    ("+ idle radio sniff", dict(LORA_IDLE_SNIFF_MS=1000)),
+)
+
+# SX1278 model mode -> meter state (standby only bridges operations)
+RADIO_MODES = {
+    MODE_RX_CONTINUOUS: RADIO_METER_RX,
+    MODE_RX_SINGLE: RADIO_METER_RX,
+    MODE_STDBY: RADIO_METER_RX,
+    MODE_CAD: RADIO_METER_CAD,
+    MODE_TX: RADIO_METER_TX,
+    MODE_SLEEP: RADIO_METER_SLEEP,
+}
+
+
+def sync_times(seconds):
+    """Seconds into the run at which a peer sync arrives"""
+    return range(SYNC_EVERY // 2, int(seconds), SYNC_EVERY)
+
+
+def panel_timeline(panel):
+    """Record (time, state) whenever the panel's on/contrast changes"""
+    timeline = []
+    command = panel._command
+
+    def state():
+        if not panel.on:
+            return DISPLAY_OFF
+        return DISPLAY_ON if panel.contrast == 0xFF else DISPLAY_DIM
+
+    def watched(b):
+        command(b)
+        current = state()
+        if not timeline or timeline[-1][1] != current:
+            timeline.append((sim_clock.clock.now(), current))
+
+    panel._command = watched
+    timeline.append((sim_clock.clock.now(), state()))
+    return timeline
+
+
+def timeline_ms(timeline, start, end):
+    """Milliseconds per display state between start and end (seconds)"""
+    times = [0.0] * len(STATE_NAMES[DISPLAY])
+    for i, (t, state) in enumerate(timeline):
+        until = timeline[i + 1][0] if i + 1 < len(timeline) else end
+        overlap = min(until, end) - max(t, start)
+        if overlap > 0:
+            times[state] += overlap * 1000
+    return times
+
+
+def run(overrides, seconds):
+    import lora_comm
+    import main
+
+    sim_clock.use(sim_clock.VirtualClock())
+    machine.reset()
+    saved = {name: getattr(main, name) for name in overrides}
+    saved_sniff = lora_comm.LORA_IDLE_SNIFF_MS
+    for name, value in overrides.items():
+        setattr(main, name, value)
+    lora_comm.LORA_IDLE_SNIFF_MS = overrides.get("LORA_IDLE_SNIFF_MS", saved_sniff)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            pet = sim.SimulatedPet()
+    finally:
+        for name, value in saved.items():
+            setattr(main, name, value)
+        lora_comm.LORA_IDLE_SNIFF_MS = saved_sniff
+
+    pet.radio.timed_tx = True  # TX and CAD take their real time
+    app = pet.app
+    virtual = sim_clock.clock
+    timeline = panel_timeline(pet.panel)
+    update = app.graphics.update
+
+    def costly_update(*args, **kwargs):
+        virtual.advance(FRAME_COST_MS / 1000)  # the CPU is busy drawing
+        return update(*args, **kwargs)
+
+    app.graphics.update = costly_update
+    sleep = app.power.sleep
+
+    def costly_sleep(wait):
+        slept = sleep(wait)
+        if slept:
+            virtual.advance(WAKE_COST_MS / 1000)  # awake again, back in the event loop
+        return slept
+
+    app.power.sleep = costly_sleep
+    presses = []
+    pressed = app.on_button_pressed
+    app.button.on_press = lambda: (presses.append(1), pressed())
+    syncs = []
+    handle = app._handle_packet
+    app._handle_packet = lambda data: (syncs.append(1), handle(data))
+
+    def over_the_air(frame):
+        # the peer's preamble first (CAD sees it), then the frame, which is
+        # only received if the radio is listening by then
+        lora = app.lora
+        end = virtual.now() + lora.parameters['preamble_length'] * lora._symbol_us() / 1000000
+        pet.radio.cad_probe = lambda radio: virtual.now() < end
+
+        def arrive():
+            if pet.radio.mode in (MODE_RX_CONTINUOUS, MODE_RX_SINGLE):
+                pet.receive(frame)
+
+        asyncio.get_event_loop().call_at(end, arrive)
+
+    def script():
+        # inputs as loop callbacks: no task but the app's own wakes the CPU
+        from lora_link import encode
+        from sync_codec import SYNC_LEN, SyncPacket, encode_into
+
+        loop = asyncio.get_event_loop()
+        begin = loop.time()
+        for t in PRESSES_AT:
+            loop.call_at(begin + t, pet.press_button)
+        peer = SyncPacket()
+        peer.device_id = 2
+        body = bytearray(SYNC_LEN)
+        for seq, t in enumerate(sync_times(seconds)):
+            size = encode_into(body, peer)
+            loop.call_at(begin + t, over_the_air, encode(seq, body[:size]))
+        loop.call_at(begin + seconds, app.stop)
+
+    async def session():
+        script()
+        await app.run_async()
+
+    start = virtual.now()
+    start_ticks = clock.now()
+    meter_start = app.power.meter.totals(start_ticks)
+    slept_start = machine.sleep_time
+    modes_start = pet.radio.mode_time()
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim.run(session())
+    end = virtual.now()
+    end_ticks = clock.now()
+
+    meter = [[b - a for a, b in zip(first, last)]
+             for first, last in zip(meter_start, app.power.meter.totals(end_ticks))]
+    truth = [[0.0] * len(names) for names in STATE_NAMES]
+    truth[CPU][CPU_LIGHT_SLEEP] = (machine.sleep_time - slept_start) * 1000
+    truth[CPU][0] = (end - start) * 1000 - truth[CPU][CPU_LIGHT_SLEEP]
+    truth[DISPLAY] = timeline_ms(timeline, start, end)
+    modes = pet.radio.mode_time()
+    for mode, seconds_in in modes.items():
+        truth[RADIO][RADIO_MODES[mode]] += (seconds_in - modes_start.get(mode, 0.0)) * 1000
+    currents = app.power.meter.average_ma(end_ticks)
+    return dict(meter=meter, truth=truth, elapsed=clock.diff(end_ticks, start_ticks),
+                currents=currents, presses=len(presses), syncs=len(syncs),
+                sleeps=app.power.sleeps, wake_poll_ms=app.power.wake_poll_ms)
+
+
+def compare(result):
+    """Worst meter-vs-simulator difference as a share of the run, per component"""
+    worst = []
+    for component in range(len(COMPONENT_NAMES)):
+        diff = max(abs(m - t) for m, t in zip(result["meter"][component], result["truth"][component]))
+        worst.append(diff / result["elapsed"])
+    return worst
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 400
+
+    ok = True
+    print(f"{seconds:.0f} s virtual, presses at {PRESSES_AT} s, a sync every {SYNC_EVERY} s, "
+          f"{FRAME_COST_MS} ms CPU per drawn frame, {WAKE_COST_MS} ms per wakeup")
+    totals = []
+    for name, overrides in SETTINGS:
+        result = run(overrides, seconds)
+        poll = result["wake_poll_ms"]
+        print(f"\n{name}: {sum(result['currents']):.2f} mA, {result['sleeps']} light sleeps"
+              + (f" (capped at {poll} ms)" if poll else ""))
+        worst = compare(result)
+        for component, component_name in enumerate(COMPONENT_NAMES):
+            elapsed = sum(result["meter"][component]) or 1
+            states = "  ".join(
+                f"{state} {t * 100 / elapsed:5.1f}%"
+                for state, t in zip(STATE_NAMES[component], result["meter"][component])
+            )
+            print(f"  {component_name:8} {result['currents'][component]:7.2f} mA  {states}"
+                  f"   (vs simulator: {worst[component] * 100:.2f}%)")
+        passed = (max(worst) <= 0.005 and result["presses"] == len(PRESSES_AT)
+                  and result["syncs"] == len(sync_times(seconds)))
+        print(f"  presses {result['presses']}/{len(PRESSES_AT)}, "
+              f"syncs {result['syncs']}/{len(sync_times(seconds))}: {passed}")
+        ok = ok and passed
+        totals.append(sum(result["currents"]))
+
+    passed = totals[2] < totals[1] < totals[0] and totals[3] < totals[2]
+    print(f"\nestimated current: {totals[0]:.2f} -> {totals[3]:.2f} mA "
+          f"({totals[0] / totals[3]:.1f}x battery life): {passed}")
+    ok = ok and passed
+
+    print(f"\nAll checks pass: {ok}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+# Host simulation: sync delivery and overhead of the link layer under loss
+# Usage: python tools/sim_reliable_sync.py [loss ...] [--corruption P] [--seconds S] [--interval S]
+#
+# Two pets 1 km apart share a sim.channel.Channel that loses each reception
+# with the given probability and flips one bit in --corruption of the rest.
+# Each pet sends a numbered sync at exponentially distributed intervals.
+# Every loss rate runs twice: sequence numbers and CRC only (LORA_ACK off)
+# and with ACKs and retransmission. Reports the share of syncs the other pet
+# applied, duplicates and corrupted frames that reached the application
+# (both must be 0), frames on air per sync (retransmissions and ACKs
+# included), airtime per sync, and the fixed per-frame overhead against the
+# unframed 2-byte sync. Exits non-zero if a duplicate or corrupted frame got
+# through.
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+sim.install(virtual_time=True)
+
+from sim import clock, machine
+from sim.app import SimulatedPet
+from sim.channel import Channel
+from config import LORA_ACK_RETRIES, LORA_ADR_RATES, LORA_CODING_RATE, LORA_PREAMBLE_LENGTH
+from lora_link import FRAME_OVERHEAD
+from lora_scheduler import time_on_air_us
+from utils.aio import asyncio, sleep_ms
+
+DEFAULT_LOSS = (0.0, 0.1, 0.3, 0.5)
+
+
+def run(loss, corruption, ack, seconds, interval, seed):
+    machine.reset()
+    clock.use(clock.VirtualClock())
+    rng = random.Random(seed)
+    random.seed(seed)  # firmware backoff and initial sequence numbers
+    channel = Channel(seed=seed, loss=loss, corruption=corruption)
+    pets = []
+    sent = []  # per pet: sync numbers handed to send()
+    applied = []  # per pet: bodies its application received
+    for i, position in enumerate(((0.0, 0.0), (1000.0, 0.0))):
+        pet = SimulatedPet(device_id=i + 1, render=False)
+        pet.app.lora.link.ack = ack
+        channel.add(pet.radio, position)
+        received = []
+        pet.app._handle_packet = lambda data, received=received: received.append(bytes(data))
+        pets.append(pet)
+        sent.append([])
+        applied.append(received)
+
+    async def traffic(i):
+        pet = pets[i]
+        k = 0
+        while pet.app.running:
+            await sleep_ms(int(rng.expovariate(1 / interval) * 1000))
+            if pet.app.running:
+                with pet.board:
+                    pet.app.lora.send(bytes([pet.app.device_id, k]))
+                sent[i].append(k)
+                k = (k + 1) & 0xFF
+
+    async def session():
+        await asyncio.gather(*(pet.app.run_async() for pet in pets),
+                             *(traffic(i) for i in range(len(pets))))
+
+    def stop():
+        for pet in pets:
+            pet.app.stop()
+
+    sim.run(session(), seconds=seconds, stop=stop)
+
+    syncs = delivered = duplicates = corrupt = 0
+    for i, pet in enumerate(pets):
+        sender = pet.app.device_id
+        numbers = set(sent[i])
+        got = applied[1 - i]
+        valid = [b[1] for b in got if len(b) == 2 and b[0] == sender and b[1] in numbers]
+        syncs += len(sent[i])
+        delivered += len(set(valid))
+        duplicates += len(valid) - len(set(valid))
+        corrupt += len(got) - len(valid)
+    links = [pet.app.lora.link for pet in pets]
+    return {
+        'syncs': syncs,
+        'delivery': delivered / max(syncs, 1),
+        'duplicates': duplicates,
+        'corrupt': corrupt,
+        'frames': channel.transmissions / max(syncs, 1),
+        'airtime_ms': channel.airtime * 1000 / max(syncs, 1),
+        'crc_dropped': sum(link.crc_errors for link in links),
+        'dup_dropped': sum(link.duplicates for link in links),
+        'retransmits': sum(link.retransmits for link in links),
+        'unacked': sum(link.unacked for link in links),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reliable sync under simulated loss")
+    parser.add_argument("loss", type=float, nargs="*", default=DEFAULT_LOSS)
+    parser.add_argument("--corruption", type=float, default=0.05, help="share of receptions with a flipped bit")
+    parser.add_argument("--seconds", type=float, default=3600, help="virtual run time")
+    parser.add_argument("--interval", type=float, default=60, help="mean seconds between syncs per pet")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"2 pets 1 km apart, one sync per pet every {args.interval:g} s, {args.seconds:g} s virtual, "
+          f"{args.corruption * 100:g}% of receptions corrupted, {LORA_ACK_RETRIES} retries")
+    # 2-byte sync + ADR control, unframed and framed
+    for sf, bandwidth in (LORA_ADR_RATES[0], LORA_ADR_RATES[-1]):
+        legacy, framed = (time_on_air_us(n, sf, bandwidth, LORA_CODING_RATE, LORA_PREAMBLE_LENGTH) / 1000
+                          for n in (3, 3 + FRAME_OVERHEAD))
+        print(f"  SF{sf}/{bandwidth / 1000:g}k: {FRAME_OVERHEAD} bytes framing (header + CRC-8) "
+              f"{legacy:.1f} -> {framed:.1f} ms on air")
+    print(f"{'loss':>5} {'mode':7} {'syncs':>5} {'deliv':>6} {'frames/sync':>11} {'air/sync':>9} "
+          f"{'retx':>5} {'unacked':>7} {'crc drop':>8} {'dup drop':>8} {'dup app':>7} {'bad app':>7}")
+    ok = True
+    for loss in args.loss:
+        for ack in (False, True):
+            with contextlib.redirect_stdout(io.StringIO()):
+                s = run(loss, args.corruption, ack, args.seconds, args.interval, args.seed)
+            print(f"{loss * 100:4.0f}% {'ack' if ack else 'seq+crc':7} {s['syncs']:5d} "
+                  f"{s['delivery'] * 100:5.1f}% {s['frames']:11.2f} {s['airtime_ms']:7.0f}ms "
+                  f"{s['retransmits']:5d} {s['unacked']:7d} {s['crc_dropped']:8d} {s['dup_dropped']:8d} "
+                  f"{s['duplicates']:7d} {s['corrupt']:7d}")
+            ok = ok and s['duplicates'] == 0 and s['corrupt'] == 0
+    print(f"No duplicate or corrupted sync reached the application: {ok}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
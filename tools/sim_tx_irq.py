@@ -0,0 +1,166 @@
+# Host simulation: rendering and SPI traffic while a LoRa packet is on air
+# Usage: python tools/sim_tx_irq.py [syncs]
+#
+# One pet at virtual time sends a state sync every 3 s (a button press). The
+# radio model keeps each packet in TX for its real time on air and charges
+# every SPI transaction 50 us of CPU, so a busy-wait advances time as it
+# would on the ESP32. Compares:
+#   blocking  end_packet() spinning on REG_IRQ_FLAGS inside the button handler
+#   polled    TX task sleeps for the airtime, then reads TX_DONE
+#   irq       DIO0 mapped to TxDone wakes the TX task
+# For every packet it checks that the animation kept its pace while it was on
+# air (animation frame changes strictly between TX start and TxDone, against
+# the airtime over the happy clip's frame time; the pet is kept happy and
+# event redraws are not counted), that the send() handle resolved as sent and
+# that the radio went back to RX continuous with DIO0 on RxDone. Exits
+# non-zero if a check fails.
+
+import contextlib
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sim
+
+sim.install(virtual_time=True)
+
+from sim import clock, machine
+from sim.sx1278 import MODE_RX_CONTINUOUS, REG_DIO_MAPPING_1
+from lora_comm import TxHandle
+from utils.aio import asyncio
+
+SPI_COST_US = 50
+INTERVAL_S = 3
+
+
+def blocking_send(lora):
+    """The original LoRaCommunication.send around SX127x.end_packet"""
+
+    def send(data):
+        lora.lora.begin_packet(implicit_header_mode=False)
+        lora.lora.write(data)
+        lora.lora.end_packet()
+        lora.lora.receive()
+        return True
+
+    return send
+
+
+def frame_ms(app):
+    """Frame time of the happy clip"""
+    happy = app.pet_state.animation.clips["happy"]
+    return happy.period / len(happy)
+
+
+def run(mode, syncs):
+    machine.reset()
+    clock.use(clock.VirtualClock())
+    pet = sim.SimulatedPet()
+    radio = pet.radio
+    radio.timed_tx = True
+    radio.spi_cost_us = SPI_COST_US
+    app = pet.app
+    if mode == "blocking":
+        app.lora.send = blocking_send(app.lora)
+    elif mode == "polled":
+        app.lora.lora.attach_dio0(None)
+        app.lora.irq_receive = False
+
+    app.pet_state.update_state_from_health = lambda contact_health: None  # stay happy
+    frames = []  # times the animation frame changed
+    windows = []  # [start, end, spi transactions at start, at end, back in rx at]
+    handles = []
+    animation = app.pet_state.animation
+    update = animation.update
+    complete_tx = radio.complete_tx
+    receive = app.lora.lora.receive
+    send = app.lora.send
+
+    def timed_update(now):
+        changed = update(now)
+        if changed:
+            frames.append(clock.clock.now())
+        return changed
+
+    def on_transmit(payload):
+        windows.append([clock.clock.now(), None, radio.transactions, None, None])
+
+    def timed_complete_tx():
+        complete_tx()
+        windows[-1][1] = clock.clock.now()
+        windows[-1][3] = radio.transactions
+
+    def timed_receive(*args):
+        receive(*args)
+        if windows and windows[-1][1] is not None and windows[-1][4] is None:
+            rx = radio.mode == MODE_RX_CONTINUOUS and radio.regs[REG_DIO_MAPPING_1] >> 6 == 0
+            windows[-1][4] = clock.clock.now() if rx else False
+
+    def tracked_send(data):
+        handle = send(data)
+        handles.append(handle)
+        return handle
+
+    animation.update = timed_update
+    radio.on_transmit = on_transmit
+    radio.complete_tx = timed_complete_tx
+    app.lora.lora.receive = timed_receive
+    app.lora.send = tracked_send
+
+    async def presser():
+        for _ in range(syncs):
+            await asyncio.sleep(INTERVAL_S)
+            app.health.wireless_health = 100  # every press syncs
+            pet.press_button()
+
+    async def session():
+        task = asyncio.ensure_future(presser())
+        await app.run_async()
+        task.cancel()
+
+    sim.run(session(), seconds=(syncs + 1) * INTERVAL_S, stop=app.stop)
+
+    done = [w for w in windows if w[1] is not None]
+    airtime = sum(w[1] - w[0] for w in done)
+    rendered = sum(1 for t in frames if any(w[0] < t < w[1] for w in done))
+    spi = sum(w[3] - w[2] for w in done)
+    turnaround = [w[4] - w[1] for w in done if w[4] not in (None, False)]
+    back_to_rx = len(done) == syncs and len(turnaround) == len(done)
+    if mode == "blocking":
+        resolved = len(handles) == syncs
+    else:
+        resolved = len(handles) == syncs and all(h.state == TxHandle.SENT for h in handles)
+    return {
+        'sent': len(done),
+        'airtime_ms': airtime * 1000 / max(len(done), 1),
+        'frames': rendered / max(len(done), 1),
+        'expected': airtime * 1000 / frame_ms(app) / max(len(done), 1),
+        'spi': spi / max(len(done), 1),
+        'turnaround_ms': max(turnaround) * 1000 if turnaround else float('nan'),
+        'back_to_rx': back_to_rx,
+        'resolved': resolved,
+    }
+
+
+def main():
+    syncs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"{syncs} syncs, {SPI_COST_US} us per SPI transaction, happy animation")
+    print(f"  {'mode':9} {'sent':>4} {'airtime':>9} {'anim frames in TX':>17} {'SPI/packet':>11} "
+          f"{'TxDone->RX':>11}  rx  handle")
+    ok = True
+    for mode in ("blocking", "polled", "irq"):
+        with contextlib.redirect_stdout(io.StringIO()):
+            s = run(mode, syncs)
+        print(f"  {mode:9} {s['sent']:4d} {s['airtime_ms']:7.0f}ms {s['frames']:7.1f} of {s['expected']:5.1f}"
+              f"    {s['spi']:11.1f} {s['turnaround_ms']:9.1f}ms  {s['back_to_rx']!s:5} {s['resolved']}")
+        if mode != "blocking":
+            ok = (ok and s['sent'] == syncs and s['back_to_rx'] and s['resolved']
+                  and s['expected'] - 2 <= s['frames'] <= s['expected'] + 1)
+    print(f"Rendering continues during TX and the radio returns to RX: {ok}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+# Sprite Compression Utility
+# Rewrites sprites/sprite_data.py with animated states stored as a compressed
+# container: an RLE keyframe followed by RLE-coded XOR deltas against the
+# previous frame. SpriteManager decodes them (see decode_rle_into).
+# Rebuild sprites/atlas.bin afterwards (tools/build_atlas.py).
+# Usage: python tools/sprite_compress.py [state ...]
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SPRITE_DATA_PATH = os.path.join(ROOT, "sprites", "sprite_data.py")
+
+# States with multi-frame animations worth compressing
+DEFAULT_STATES = ("happy", "angry", "sad", "sleeping")
+
+HEADER = '''# Sprite Bitmap Data
+
+# Sprite format:
+# {
+#     'width': 32,
+#     'height': 32,
+#     'data': b'...'  # LSB = left pixel, columns then rows
+# }
+#
+# Frame data is kept as bytes literals so a frozen build can serve it
+# straight from flash with no heap copy.
+#
+# Compressed frames (written by tools/sprite_compress.py) add an
+# 'encoding' key: 'rle' for a run-length keyframe, 'xor' for a run-length
+# XOR delta against the previous frame. Every frame of a state shares the
+# same width/height.
+'''
+
+def rle_encode(data):
+    """
+    Run-length encode bytes
+
+    Control byte c < 0x80: c + 1 literal bytes follow.
+    Control byte c >= 0x80: the next byte repeats (c & 0x7F) + 1 times.
+
+    Args:
+        data: bytes to encode
+
+    Returns:
+        Encoded bytes
+    """
+    out = bytearray()
+    literal = bytearray()
+    i = 0
+    n = len(data)
+
+    def flush_literal():
+        for start in range(0, len(literal), 128):
+            chunk = literal[start:start + 128]
+            out.append(len(chunk) - 1)
+            out.extend(chunk)
+        literal.clear()
+
+    while i < n:
+        run = 1
+        while i + run < n and run < 128 and data[i + run] == data[i]:
+            run += 1
+        if run >= 3 or (run == 2 and not literal):
+            flush_literal()
+            out.append(0x80 | (run - 1))
+            out.append(data[i])
+            i += run
+        else:
+            literal.append(data[i])
+            i += 1
+    flush_literal()
+    return bytes(out)
+
+def rle_decode(encoded, size):
+    """Host-side reference decoder (returns a new bytes object)"""
+    out = bytearray()
+    i = 0
+    while i < len(encoded):
+        c = encoded[i]
+        if c < 0x80:
+            out.extend(encoded[i + 1:i + 2 + c])
+            i += c + 2
+        else:
+            out.extend(bytes([encoded[i + 1]]) * ((c & 0x7F) + 1))
+            i += 2
+    return bytes(out[:size])
+
+def compress_frames(frames, keyframe_interval=0):
+    """
+    Compress an animation into an RLE keyframe plus XOR deltas
+
+    Args:
+        frames: List of raw frame dictionaries sharing width/height
+        keyframe_interval: Force a keyframe every N frames (0 = only the first)
+
+    Returns:
+        List of compressed frame dictionaries
+    """
+    width = frames[0]['width']
+    height = frames[0]['height']
+    size = ((width + 7) // 8) * height
+
+    compressed = []
+    previous = None
+    for idx, frame in enumerate(frames):
+        # Only the first width*height bits are ever drawn
+        data = bytes(frame['data'][:size])
+        keyframe = previous is None or (keyframe_interval and idx % keyframe_interval == 0)
+        if keyframe:
+            encoding = 'rle'
+            payload = rle_encode(data)
+        else:
+            delta = bytes(a ^ b for a, b in zip(data, previous))
+            encoding = 'xor'
+            payload = rle_encode(delta)
+            # A delta bigger than a fresh keyframe is not worth it
+            key_payload = rle_encode(data)
+            if len(key_payload) <= len(payload):
+                encoding = 'rle'
+                payload = key_payload
+        compressed.append({
+            'width': width,
+            'height': height,
+            'encoding': encoding,
+            'data': payload,
+        })
+        previous = data
+    return compressed
+
+def decompress_frames(frames):
+    """Host-side reference: expand compressed frames back to raw bytes"""
+    raw = []
+    previous = None
+    for frame in frames:
+        size = ((frame['width'] + 7) // 8) * frame['height']
+        data = rle_decode(frame['data'], size)
+        if frame.get('encoding') == 'xor':
+            data = bytes(a ^ b for a, b in zip(data, previous))
+        raw.append(data)
+        previous = data
+    return raw
+
+def format_bytes(data, indent):
+    """Format bytes as a parenthesised bytes literal, 16 bytes per line"""
+    hex_line = lambda chunk: "b'" + ''.join(f'\\x{b:02x}' for b in chunk) + "'"
+    if len(data) <= 16:
+        return hex_line(data)
+    lines = [indent + "    " + hex_line(data[i:i + 16]) for i in range(0, len(data), 16)]
+    return "(\n" + "\n".join(lines) + "\n" + indent + ")"
+
+def format_sprite_data(sprite_data):
+    """Render a SPRITE_DATA dictionary as sprite_data.py source"""
+    out = [HEADER, "SPRITE_DATA = {"]
+    names = list(sprite_data)
+    for n, name in enumerate(names):
+        frames = sprite_data[name]
+        out.append(f'    "{name}": [')
+        for i, frame in enumerate(frames):
+            out.append("        {")
+            out.append(f"            'width': {frame['width']},")
+            out.append(f"            'height': {frame['height']},")
+            if 'encoding' in frame:
+                out.append(f"            'encoding': '{frame['encoding']}',")
+            out.append("            'data': " + format_bytes(bytes(frame['data']), "            "))
+            out.append("        }" + ("," if i < len(frames) - 1 else ""))
+        out.append("    ]" + ("," if n < len(names) - 1 else ""))
+    out.append("}")
+    return "\n".join(out) + "\n"
+
+def load_sprite_data(path=SPRITE_DATA_PATH):
+    """Load SPRITE_DATA from a sprite_data.py file without importing the package"""
+    namespace = {}
+    with open(path) as f:
+        exec(compile(f.read(), path, "exec"), namespace)
+    return namespace["SPRITE_DATA"]
+
+def main():
+    states = sys.argv[1:] or DEFAULT_STATES
+    sprite_data = load_sprite_data()
+
+    total_raw = 0
+    total_packed = 0
+    for name in states:
+        frames = sprite_data.get(name)
+        if not frames:
+            print(f"Skipping unknown state '{name}'")
+            continue
+        if 'encoding' in frames[0]:
+            print(f"{name}: already compressed")
+            continue
+        packed = compress_frames(frames)
+        size = ((frames[0]['width'] + 7) // 8) * frames[0]['height']
+        raw = len(frames) * size
+        comp = sum(len(f['data']) for f in packed)
+        total_raw += raw
+        total_packed += comp
+        print(f"{name}: {len(frames)} frames, {raw} -> {comp} bytes "
+              f"({raw / comp:.1f}:1) [{', '.join(f['encoding'] for f in packed)}]")
+        sprite_data[name] = packed
+
+    with open(SPRITE_DATA_PATH, "w") as f:
+        f.write(format_sprite_data(sprite_data))
+
+    if total_packed:
+        print(f"Total: {total_raw} -> {total_packed} bytes ({total_raw / total_packed:.1f}:1)")
+
+if __name__ == "__main__":
+    main()
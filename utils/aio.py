@@ -0,0 +1,46 @@
+# asyncio compatibility layer - MicroPython (uasyncio) and CPython
+
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
+
+def sleep_ms(ms):
+    """Sleep for ms milliseconds (uasyncio has sleep_ms, CPython does not)"""
+    if hasattr(asyncio, 'sleep_ms'):
+        return asyncio.sleep_ms(ms)
+    return asyncio.sleep(ms / 1000)
+
+async def wait_ms(awaitable, timeout_ms):
+    """
+    Await with a timeout
+
+    Returns:
+        True if the awaitable completed, False on timeout
+    """
+    try:
+        if hasattr(asyncio, 'wait_for_ms'):
+            await asyncio.wait_for_ms(awaitable, timeout_ms)
+        else:
+            await asyncio.wait_for(awaitable, timeout_ms / 1000)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+if hasattr(asyncio, 'ThreadSafeFlag'):
+    Flag = asyncio.ThreadSafeFlag
+else:
+    class Flag:
+        """Host stand-in for ThreadSafeFlag: wait() returns once set, then clears"""
+        def __init__(self):
+            self._event = asyncio.Event()
+
+        def set(self):
+            self._event.set()
+
+        def clear(self):
+            self._event.clear()
+
+        async def wait(self):
+            await self._event.wait()
+            self._event.clear()
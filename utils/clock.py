@@ -0,0 +1,34 @@
+# Millisecond Clock - wraparound-safe ticks for every subsystem
+
+import time
+
+# ticks_ms() wraps (2**30 ms on ESP32, about 12 days); only differences
+# taken with diff()/elapsed() are meaningful, and only up to half a period.
+# On the host, sim.install(virtual_time=True) swaps the time module these
+# resolve to for the simulator's virtual clock.
+diff = time.ticks_diff
+add = time.ticks_add
+
+def now():
+    """Current ticks in milliseconds (a small int: no heap allocation)"""
+    return time.ticks_ms()
+
+def elapsed(since):
+    """Milliseconds from the ticks value since until now"""
+    return time.ticks_diff(time.ticks_ms(), since)
+
+def clamp_since(since, limit_ms):
+    """
+    Keep a reference tick within limit_ms of now
+    
+    A timestamp left alone for half a tick period would wrap and appear to
+    be in the future; callers that only care about "at least limit_ms ago"
+    pull it forward so elapsed(since) stays <= limit_ms.
+    
+    Returns:
+        since, or now - limit_ms if it is older than that
+    """
+    ticks = time.ticks_ms()
+    if time.ticks_diff(ticks, since) > limit_ms:
+        return time.ticks_add(ticks, -limit_ms)
+    return since
@@ -14,18 +14,73 @@ class Display:
         """Fill entire display with color"""
         self.display.fill(color)
     
+    def load(self, buffer):
+        """
+        Overwrite the whole framebuffer with a prerendered layer
+        
+        Args:
+            buffer: Bytes in the display buffer layout (MONO_VLSB, 1024 bytes)
+        """
+        self.display.buffer[:] = buffer
+    
     def pixel(self, x, y, color):
         """Set individual pixel"""
         self.display.pixel(x, y, color)
     
+    def blit(self, fbuf, x, y, key=-1):
+        """
+        Copy a prebuilt FrameBuffer onto the display in one native call
+        
+        Args:
+            fbuf: framebuf.FrameBuffer or (buffer, width, height, format) tuple
+            x, y: Position on display
+            key: Colour treated as transparent (-1 draws every pixel)
+        """
+        self.display.blit(fbuf, x, y, key)
+    
     def text(self, text, x, y, color):
         """Draw text"""
         self.display.text(text, x, y, color)
     
+    def mark_dirty(self, x, y, w, h):
+        """Record a changed rectangle to be sent by the next show()"""
+        self.display.mark_dirty(x, y, w, h)
+    
     def show(self):
-        """Update display"""
+        """
+        Update display
+        
+        Only marked regions that differ from the last transmitted frame are
+        sent; if none do, the I2C transfer is skipped entirely.
+        """
+        self.display.show_dirty()
+    
+    def show_full(self):
+        """Update the whole display regardless of damage tracking"""
         self.display.show()
     
+    def get_flush_stats(self):
+        """
+        Get partial flush counters
+        
+        Returns:
+            (frames_skipped, bytes_saved): show() calls that sent nothing, and
+            framebuffer bytes not transmitted compared to full-frame flushes
+        """
+        return self.display.frames_skipped, self.display.bytes_saved
+    
+    def contrast(self, level):
+        """Set panel brightness (0-255)"""
+        self.display.contrast(level)
+    
+    def poweroff(self):
+        """Blank the panel (display RAM is kept)"""
+        self.display.poweroff()
+    
+    def poweron(self):
+        """Turn the panel back on showing display RAM"""
+        self.display.poweron()
+    
     def clear(self):
         """Clear display"""
         self.display.fill(0)
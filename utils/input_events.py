@@ -0,0 +1,250 @@
+# Input Events - pin IRQ edge ring, debouncing and press classification
+
+from machine import Pin
+from utils import clock
+
+class EdgeRing:
+    def __init__(self, slots=16):
+        """
+        Initialize a single-producer / single-consumer ring of pin edges
+        
+        The pin IRQ (producer) only moves head and the input task (consumer)
+        only moves tail; indices run modulo 2 * slots to tell a full ring
+        from an empty one, as in PacketRing.
+        
+        Args:
+            slots: Edges the ring can hold
+        """
+        self.slots = slots
+        self._ticks = [0] * slots
+        self._source = bytearray(slots)
+        self._level = bytearray(slots)
+        self._wrap = 2 * slots
+        self._head = 0
+        self._tail = 0
+        self.ticks = 0  # edge last returned by pop()
+        self.source = 0
+        self.level = 0
+        self.dropped = 0
+    
+    def __len__(self):
+        return (self._head - self._tail) % self._wrap
+    
+    def push(self, ticks, source, level):
+        """Producer (IRQ): queue an edge; counted in dropped if the ring is full"""
+        if len(self) == self.slots:
+            self.dropped += 1
+            return
+        idx = self._head % self.slots
+        self._ticks[idx] = ticks
+        self._source[idx] = source
+        self._level[idx] = level
+        self._head = (self._head + 1) % self._wrap
+    
+    def pop(self):
+        """
+        Consumer: load the oldest edge into ticks/source/level
+        
+        Returns:
+            False if the ring was empty
+        """
+        if self._head == self._tail:
+            return False
+        idx = self._tail % self.slots
+        self.ticks = self._ticks[idx]
+        self.source = self._source[idx]
+        self.level = self._level[idx]
+        self._tail = (self._tail + 1) % self._wrap
+        return True
+
+class InputButton:
+    def __init__(self, debounce_ms=50, long_ms=800, double_ms=300, active_low=True):
+        """
+        Debounce and classify one active-low input from its edges
+        
+        An edge counts at once if the line had been stable for debounce_ms
+        before it; edges closer together are bounce, and the level they
+        settle on is taken debounce_ms after the last one. Classification:
+        
+        - on_press: debounced press edge (no wait, so a tap feels instant)
+        - on_double: a press within double_ms of the previous release
+          (falls back to on_press when not set)
+        - on_long: still held long_ms after the press (the release that
+          ends a long press does not start a double)
+        
+        Edges must be fed in time order; advance() runs the timers up to a
+        tick, so replaying a trace gives the same events as live input.
+        
+        Args:
+            debounce_ms: Minimum stable time before an edge counts
+            long_ms: Hold time for a long press
+            double_ms: Release-to-press gap for a double press
+            active_low: Pressed reads 0 (pull-up wiring)
+        """
+        self.debounce_ms = debounce_ms
+        self.long_ms = long_ms
+        self.double_ms = double_ms
+        self.pressed_level = 0 if active_low else 1
+        self.on_press = None
+        self.on_long = None
+        self.on_double = None
+        self.pressed = False  # debounced state
+        self._raw = 1 - self.pressed_level
+        self._raw_at = None  # ticks of the last raw edge
+        self._settle_at = None  # ticks when a bounced level is taken
+        self._long_at = None  # ticks when a held press becomes long
+        self._released_at = None  # ticks of the last debounced release
+        self._was_double = False
+        self.event_ticks = 0  # when the event being reported happened
+        self.presses = 0
+        self.longs = 0
+        self.doubles = 0
+        self.bounces = 0
+    
+    def feed(self, ticks, level):
+        """Apply a raw edge at ticks (running any timer due before it)"""
+        self.advance(ticks)
+        last = self._raw_at
+        self._raw = level
+        self._raw_at = ticks
+        pressed = level == self.pressed_level
+        if pressed == self.pressed:
+            if self._settle_at is not None:
+                self.bounces += 1
+            self._settle_at = None  # bounced back to the debounced level
+            return
+        if last is None or clock.diff(ticks, last) >= self.debounce_ms:
+            self._settle_at = None
+            self._change(ticks, pressed)
+        else:
+            self.bounces += 1
+            self._settle_at = clock.add(ticks, self.debounce_ms)
+    
+    def advance(self, now):
+        """Run the settle and long-press timers due at or before now"""
+        settle = self._settle_at
+        if settle is not None and clock.diff(now, settle) >= 0:
+            self._settle_at = None
+            self._change(settle, self._raw == self.pressed_level)
+        long_at = self._long_at
+        if long_at is not None and clock.diff(now, long_at) >= 0:
+            self._long_at = None
+            self._released_at = None  # no double press after a long one
+            self.event_ticks = long_at
+            self.longs += 1
+            if self.on_long:
+                self.on_long()
+    
+    def next_deadline(self):
+        """Ticks of the next timer, or None"""
+        settle = self._settle_at
+        long_at = self._long_at
+        if settle is None:
+            return long_at
+        if long_at is None or clock.diff(settle, long_at) < 0:
+            return settle
+        return long_at
+    
+    def _change(self, ticks, pressed):
+        self.pressed = pressed
+        if not pressed:
+            if self._long_at is not None:
+                self._released_at = ticks
+            self._long_at = None
+            return
+        self._long_at = clock.add(ticks, self.long_ms)
+        released = self._released_at
+        double = (not self._was_double and released is not None
+                  and clock.diff(ticks, released) <= self.double_ms)
+        self._was_double = double
+        self.event_ticks = ticks
+        if double:
+            self.doubles += 1
+            if self.on_double:
+                self.on_double()
+                return
+        else:
+            self.presses += 1
+        if self.on_press:
+            self.on_press()
+
+class InputManager:
+    def __init__(self, slots=16, debounce_ms=50, long_ms=800, double_ms=300):
+        """
+        Pin.irq edge capture for a set of InputButtons
+        
+        Each pin's IRQ only timestamps the edge into an EdgeRing and sets
+        flag; process() drains the ring and classifies off the IRQ, and
+        next_deadline_ms() tells the input task when a debounce or long
+        press timer is next due, so it can sleep until then.
+        
+        Args:
+            slots: Edges buffered between process() calls
+            debounce_ms, long_ms, double_ms: Passed to each InputButton
+        """
+        self.ring = EdgeRing(slots)
+        self.debounce_ms = debounce_ms
+        self.long_ms = long_ms
+        self.double_ms = double_ms
+        self.pins = []
+        self.buttons = []
+        self.flag = None  # optional ThreadSafeFlag set from the IRQ
+        self._dropped = 0  # ring.dropped at the last process()
+    
+    def add(self, pin_id):
+        """
+        Watch an active-low input with a pull-up
+        
+        Returns:
+            InputButton to set on_press/on_long/on_double on
+        """
+        source = len(self.buttons)
+        pin = Pin(pin_id, Pin.IN, Pin.PULL_UP)
+        button = InputButton(self.debounce_ms, self.long_ms, self.double_ms)
+        self.pins.append(pin)
+        self.buttons.append(button)
+        pin.irq(handler=lambda p: self._on_edge(source, p),
+                trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING)
+        return button
+    
+    def _on_edge(self, source, pin):
+        """IRQ: timestamp the edge, nothing else (no allocation)"""
+        self.ring.push(clock.now(), source, pin.value())
+        if self.flag:
+            self.flag.set()
+    
+    def process(self):
+        """Classify queued edges, then run timers due now"""
+        ring = self.ring
+        while ring.pop():
+            self.buttons[ring.source].feed(ring.ticks, ring.level)
+        now = clock.now()
+        if ring.dropped != self._dropped:
+            self._dropped = ring.dropped
+            self.resync(now)
+        for button in self.buttons:
+            button.advance(now)
+    
+    def resync(self, now):
+        """
+        Feed each line's level as an edge at now if it differs from the last
+        edge seen: catches up on edges lost to a full ring, or missed while
+        the CPU was in light sleep
+        """
+        for i in range(len(self.buttons)):
+            button = self.buttons[i]
+            level = self.pins[i].value()
+            if level != button._raw:
+                button.feed(now, level)
+    
+    def next_deadline_ms(self):
+        """Milliseconds until a button timer is due, or None"""
+        delay = None
+        now = clock.now()
+        for button in self.buttons:
+            deadline = button.next_deadline()
+            if deadline is not None:
+                remaining = max(clock.diff(deadline, now), 0)
+                if delay is None or remaining < delay:
+                    delay = remaining
+        return delay
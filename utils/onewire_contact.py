@@ -2,20 +2,48 @@
 
 from machine import Pin
 from config import DEBUG
+from utils import clock
 import time
 
+# Detector phases
+IDLE = 0  # line released, waiting for the next sample
+RESET = 1  # line held low (reset pulse)
+PRESENCE = 2  # line released, presence edge IRQ armed
+
 class OneWireContact:
-    def __init__(self, pin_number):
+    def __init__(self, pin_number, sample_ms=100, reset_us=480, window_us=(15, 300), jitter_us=150):
         """
         Initialize OneWire contact detection
         
+        The reset/presence exchange runs as a state machine over scheduler
+        ticks instead of sleeping through it: step() pulls the line low,
+        releases it at the next tick, and a falling-edge IRQ timestamps the
+        presence pulse, which is checked at the tick after. The reset pulse
+        only has a minimum length, so a late tick just stretches it, and
+        the presence window is measured from the actual release.
+        
         Args:
             pin_number: GPIO pin to use for OneWire protocol
+            sample_ms: Time between reset/presence checks
+            reset_us: Minimum reset pulse length
+            window_us: (earliest, latest) presence edge after the release
+            jitter_us: Slack on both ends of the window for IRQ latency
         """
-        self.pin = Pin(pin_number, Pin.OPEN_DRAIN)  # OneWire uses open-drain
+        self.pin = Pin(pin_number, Pin.OPEN_DRAIN, value=1)  # OneWire uses open-drain
         self.callback = None
-        self.last_contact_time = 0
+        self.last_contact_time = None  # ticks_ms of the last detected contact
         self.contact_debounce_ms = 100  # Debounce time in ms
+        self.sample_ms = sample_ms
+        self.reset_us = reset_us
+        self.window_min_us = window_us[0] - jitter_us
+        self.window_max_us = window_us[1] + jitter_us
+        self.phase = IDLE
+        self._phase_at = 0  # ticks_us the line was pulled low / released
+        self._fall_at = None  # ticks_us of the presence edge, set by the IRQ
+        self._next_at = clock.now()  # ticks_ms of the next reset pulse
+        self._irq = self._on_fall  # bound once: the IRQ must not allocate
+        self.checks = 0
+        self.presences = 0
     
     def on_contact(self, callback):
         """
@@ -26,58 +54,66 @@ class OneWireContact:
         """
         self.callback = callback
     
-    def _pull_low(self, duration_us):
-        """Pull line low for specified duration (microseconds)"""
-        self.pin.value(0)
-        time.sleep_us(duration_us)
-        self.pin.value(1)  # Release (open-drain)
-    
-    def _read_response(self, timeout_us=500):
-        """
-        Read response from OneWire device
-        Returns True if device pulled line low within timeout
-        """
-        start = time.ticks_us()
-        while time.ticks_diff(time.ticks_us(), start) < timeout_us:
-            if self.pin.value() == 0:
-                return True
-        return False
+    def _on_fall(self, pin):
+        """IRQ: timestamp the first falling edge after the release"""
+        if self._fall_at is None:
+            self._fall_at = time.ticks_us()
     
-    def reset_detect(self):
-        """
-        Perform OneWire reset and detect presence
-        Returns True if device detected (short circuit from contact)
+    def step(self):
         """
-        current_time = time.time() * 1000  # Convert to milliseconds
+        Advance the reset/presence exchange by one phase if it is due
         
-        # Debounce: ignore contacts within debounce window
-        if (current_time - self.last_contact_time) < self.contact_debounce_ms:
-            return False
+        Returns:
+            Milliseconds until step() should run again
+        """
+        if self.phase == IDLE:
+            remaining = clock.diff(self._next_at, clock.now())
+            if remaining > 0:
+                return remaining
+            self.pin.value(0)
+            self._phase_at = time.ticks_us()
+            self.phase = RESET
+            return (self.reset_us + 999) // 1000
         
-        try:
-            # Pull line low for 480µs (OneWire reset pulse)
-            self._pull_low(480)
-            
-            # Wait 65µs for device presence pulse
-            time.sleep_us(65)
-            
-            # Read for presence pulse (device pulls low for 60-240µs)
-            presence = self._read_response(240)
-            
-            if presence:
-                self.last_contact_time = current_time
-                if self.callback:
-                    self.callback()
-                if DEBUG:
-                    print("OneWire: Contact detected!")
-                return True
-            
-        except Exception as e:
-            if DEBUG:
-                print(f"OneWire error: {e}")
+        held = time.ticks_diff(time.ticks_us(), self._phase_at)
+        if self.phase == RESET:
+            if held < self.reset_us:
+                return 1
+            self._fall_at = None
+            self.pin.irq(handler=self._irq, trigger=Pin.IRQ_FALLING)
+            self.pin.value(1)  # Release (open-drain)
+            self._phase_at = time.ticks_us()
+            self.phase = PRESENCE
+            return (self.window_max_us + 999) // 1000
         
-        return False
+        if held <= self.window_max_us:
+            return 1
+        self.pin.irq(handler=None)
+        present = self.pin.value() == 0  # line still held low (contact short)
+        fall = self._fall_at
+        if fall is not None:
+            offset = time.ticks_diff(fall, self._phase_at)
+            present = present or self.window_min_us <= offset <= self.window_max_us
+        self.phase = IDLE
+        self.checks += 1
+        now = clock.now()
+        self._next_at = clock.add(now, self.sample_ms)
+        if present:
+            self.presences += 1
+            self._contact(now)
+        return self.sample_ms
+    
+    def _contact(self, now):
+        """Report a presence, ignoring contacts within the debounce window"""
+        last = self.last_contact_time
+        if last is not None and clock.diff(now, last) < self.contact_debounce_ms:
+            return
+        self.last_contact_time = now
+        if self.callback:
+            self.callback()
+        if DEBUG:
+            print("OneWire: Contact detected!")
     
     def check(self):
-        """Periodically call to check for contact"""
-        self.reset_detect()
+        """Periodically call to check for contact (never blocks)"""
+        return self.step()
@@ -0,0 +1,82 @@
+# Packet Ring Buffer - fixed-size, preallocated packet queue
+
+class PacketRing:
+    def __init__(self, slots=8, slot_size=32):
+        """
+        Initialize a single-producer / single-consumer packet ring
+        
+        The producer (scheduled radio drain) only moves head and the
+        consumer (main loop) only moves tail, so neither side needs a lock.
+        Indices run modulo 2 * slots to tell a full ring from an empty one.
+        
+        Args:
+            slots: Number of packets the ring can hold
+            slot_size: Maximum bytes stored per packet (longer ones are cut)
+        """
+        self.slots = slots
+        self.slot_size = slot_size
+        self._buffers = [bytearray(slot_size) for _ in range(slots)]
+        self._views = [memoryview(buf) for buf in self._buffers]
+        self._lengths = [0] * slots
+        self._rssi = [0] * slots
+        self._snr = [0] * slots
+        self.rssi = 0  # link quality of the packet last returned by peek()
+        self.snr = 0
+        self._wrap = 2 * slots
+        self._head = 0  # next slot to write (producer)
+        self._tail = 0  # next slot to read (consumer)
+        self.dropped = 0
+    
+    def __len__(self):
+        return (self._head - self._tail) % self._wrap
+    
+    def is_full(self):
+        """True if no free slot is left"""
+        return len(self) == self.slots
+    
+    def reserve(self):
+        """
+        Producer: get the buffer for the next packet
+        
+        Returns:
+            Writable bytearray, or None if the ring is full
+        """
+        if self.is_full():
+            return None
+        return self._buffers[self._head % self.slots]
+    
+    def commit(self, length, rssi=0, snr=0):
+        """
+        Producer: publish the packet written into the reserved buffer
+        
+        Args:
+            length: Packet bytes written
+            rssi: Packet RSSI (dBm), handed back with the packet
+            snr: Packet SNR (quarter dB), handed back with the packet
+        """
+        idx = self._head % self.slots
+        self._lengths[idx] = min(length, self.slot_size)
+        self._rssi[idx] = rssi
+        self._snr[idx] = snr
+        self._head = (self._head + 1) % self._wrap
+    
+    def peek(self):
+        """
+        Consumer: oldest packet without removing it
+        
+        Also loads its rssi/snr into the attributes of the same name.
+        
+        Returns:
+            memoryview of the packet bytes, or None if empty
+        """
+        if self._head == self._tail:
+            return None
+        idx = self._tail % self.slots
+        self.rssi = self._rssi[idx]
+        self.snr = self._snr[idx]
+        return self._views[idx][:self._lengths[idx]]
+    
+    def release(self):
+        """Consumer: free the slot returned by peek()"""
+        if self._head != self._tail:
+            self._tail = (self._tail + 1) % self._wrap
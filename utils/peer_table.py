@@ -0,0 +1,211 @@
+# Peer Table - fixed-capacity, array-backed table of nearby pets
+
+from utils import clock
+
+NO_SLOT = 0xFF
+
+class PeerTable:
+    def __init__(self, slots=16):
+        """
+        Initialize a peer table with least-recently-heard eviction
+        
+        Device ids are one byte, so a 256-entry index maps an id straight to
+        its slot. Slots are chained from most to least recently heard by two
+        bytearrays of links; a sync from a known peer moves its slot to the
+        front, a new peer takes a free slot or, once the table is full, the
+        one at the back. Every field lives in a preallocated per-slot array,
+        so record() only overwrites integers and never allocates.
+        
+        The table is shared by every layer that keeps per-peer state: the
+        link's duplicate window (newest, seen) and the data rate adapter's
+        power estimate (power_q, advertised) sit beside the last sync, so
+        all of them agree on who is known and evict together.
+        
+        Args:
+            slots: Number of peers kept (1-255)
+        """
+        if not 0 < slots <= NO_SLOT:
+            raise ValueError("slots must be 1-255")
+        self.slots = slots
+        self._index = bytearray(b"\xff" * 256)  # device id -> slot
+        self.ids = bytearray(slots)
+        self.state = bytearray(slots)
+        self.phase = bytearray(slots)
+        self.contact = bytearray(slots)
+        self.hearts = bytearray(slots)
+        self.error = bytearray(slots)
+        self.seq = bytearray(slots)
+        self.rssi = [0] * slots  # dBm
+        self.last_seen = [0] * slots  # ticks_ms
+        self.newest = bytearray(slots)  # newest link sequence number heard
+        self.seen = [0] * slots  # link window, bit k: newest - k seen (0 = none yet)
+        self.power_q = [None] * slots  # ADR received power, quarter dBm (None = no estimate)
+        self.advertised = bytearray(slots)  # fastest ADR rate the peer supports
+        self._prev = bytearray(slots)
+        self._next = bytearray(slots)
+        self.head = NO_SLOT  # most recently heard
+        self.tail = NO_SLOT  # least recently heard, evicted first
+        self.count = 0
+        self.evictions = 0
+    
+    def __len__(self):
+        return self.count
+    
+    def find(self, device_id):
+        """Slot holding device_id, or None"""
+        slot = self._index[device_id & 0xFF]
+        return None if slot == NO_SLOT else slot
+    
+    def after(self, slot):
+        """Next slot from most to least recently heard (NO_SLOT at the end)"""
+        return self._next[slot]
+    
+    def _unlink(self, slot):
+        prev = self._prev[slot]
+        nxt = self._next[slot]
+        if prev == NO_SLOT:
+            self.head = nxt
+        else:
+            self._next[prev] = nxt
+        if nxt == NO_SLOT:
+            self.tail = prev
+        else:
+            self._prev[nxt] = prev
+    
+    def _push_front(self, slot):
+        head = self.head
+        self._prev[slot] = NO_SLOT
+        self._next[slot] = head
+        if head == NO_SLOT:
+            self.tail = slot
+        else:
+            self._prev[head] = slot
+        self.head = slot
+    
+    def touch(self, device_id, now):
+        """
+        Mark device_id as the most recently heard, adding it if new
+        
+        A new peer's link window and power estimate start empty.
+        
+        Args:
+            device_id: Sender's id
+            now: ticks_ms
+        
+        Returns:
+            The peer's slot
+        """
+        device_id &= 0xFF
+        slot = self._index[device_id]
+        if slot == NO_SLOT:
+            if self.count < self.slots:
+                slot = self.count
+                self.count += 1
+            else:
+                slot = self.tail
+                self._unlink(slot)
+                self._index[self.ids[slot]] = NO_SLOT
+                self.evictions += 1
+            self._index[device_id] = slot
+            self.ids[slot] = device_id
+            self.seen[slot] = 0
+            self.power_q[slot] = None
+        elif slot != self.head:
+            self._unlink(slot)
+        else:
+            slot = NO_SLOT  # already in front
+        if slot != NO_SLOT:
+            self._push_front(slot)
+        self.last_seen[self.head] = now
+        return self.head
+    
+    def record(self, packet, rssi, seq, now):
+        """
+        Store a sync from packet.device_id as the most recently heard
+        
+        Args:
+            packet: Decoded SyncPacket
+            rssi: Packet RSSI in dBm
+            seq: Link sequence number of the frame
+            now: ticks_ms
+        
+        Returns:
+            The peer's slot
+        """
+        slot = self.touch(packet.device_id, now)
+        self.state[slot] = packet.state
+        self.phase[slot] = packet.phase
+        self.contact[slot] = packet.contact
+        self.hearts[slot] = packet.hearts
+        self.error[slot] = packet.error
+        self.seq[slot] = seq
+        self.rssi[slot] = rssi
+        return slot
+    
+    def remove(self, device_id):
+        """
+        Forget a peer (its slot is refilled from the end of the table)
+        
+        Returns:
+            True if the peer was in the table
+        """
+        slot = self._index[device_id & 0xFF]
+        if slot == NO_SLOT:
+            return False
+        self._unlink(slot)
+        self._index[device_id & 0xFF] = NO_SLOT
+        self.count -= 1
+        last = self.count
+        if slot != last:
+            # keep slots 0..count-1 in use: move the last one into the hole
+            self._move(last, slot)
+        return True
+    
+    def _move(self, src, dst):
+        for field in (self.ids, self.state, self.phase, self.contact, self.hearts,
+                      self.error, self.seq, self.rssi, self.last_seen, self.newest, self.seen,
+                      self.power_q, self.advertised):
+            field[dst] = field[src]
+        self._index[self.ids[dst]] = dst
+        prev = self._prev[dst] = self._prev[src]
+        nxt = self._next[dst] = self._next[src]
+        if prev == NO_SLOT:
+            self.head = dst
+        else:
+            self._next[prev] = dst
+        if nxt == NO_SLOT:
+            self.tail = dst
+        else:
+            self._prev[nxt] = dst
+    
+    def expire(self, now, timeout_ms):
+        """
+        Drop peers not heard within timeout_ms
+        
+        Stale peers sit at the back, so this stops at the first fresh one.
+        
+        Returns:
+            Number of peers dropped
+        """
+        dropped = 0
+        while self.tail != NO_SLOT and clock.diff(now, self.last_seen[self.tail]) >= timeout_ms:
+            self.remove(self.ids[self.tail])
+            dropped += 1
+        return dropped
+    
+    def live(self, now, timeout_ms, exclude=None):
+        """
+        Count peers heard within timeout_ms
+        
+        Args:
+            now: ticks_ms
+            timeout_ms: Silence after which a peer is not counted
+            exclude: Device id left out of the count (e.g. the partner)
+        """
+        live = 0
+        slot = self.head
+        while slot != NO_SLOT and clock.diff(now, self.last_seen[slot]) < timeout_ms:
+            if self.ids[slot] != exclude:
+                live += 1
+            slot = self._next[slot]
+        return live